@@ -0,0 +1,67 @@
+"""Plant Diary Diagnostic Entity."""
+
+from typing import Any
+
+from propcache.api import cached_property
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+
+from .const import DOMAIN
+from .PlantMetrics import COUNTERS, OPERATION_SWEEP, PlantMetrics
+
+DIAGNOSTIC_LAST_SWEEP = "last_sweep_duration"
+DIAGNOSTIC_TYPES = (DIAGNOSTIC_LAST_SWEEP, *COUNTERS)
+
+
+class PlantDiaryDiagnosticEntity(SensorEntity):
+    """Representation of a sensor exposing a metric of the manager."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, metrics: PlantMetrics, diagnostic_type: str, garden: str = ""
+    ) -> None:
+        """Initialize the sensor."""
+        self._metrics = metrics
+        self._diagnostic_type = diagnostic_type
+        self._name: str = "_".join(filter(None, (DOMAIN, garden, diagnostic_type)))
+        # Suffixed so a plant named after the metric does not share its unique ID
+        self._unique_id: str = f"{self._name}_diagnostic"
+        if diagnostic_type == DIAGNOSTIC_LAST_SWEEP:
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @cached_property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return self._name
+
+    @cached_property
+    def unique_id(self) -> str | None:
+        """Return a unique ID for this entity."""
+        return self._unique_id
+
+    @cached_property
+    def icon(self) -> str:
+        """Return the icon to use in the frontend."""
+        if self._diagnostic_type == DIAGNOSTIC_LAST_SWEEP:
+            return "mdi:timer-outline"
+        return "mdi:counter"
+
+    @property  # type: ignore[override]
+    def native_value(self) -> float | int | None:
+        """Return the value of the metric."""
+        if self._diagnostic_type == DIAGNOSTIC_LAST_SWEEP:
+            return self._metrics.last_duration(OPERATION_SWEEP)
+        return self._metrics.counters[self._diagnostic_type]
+
+    @property  # type: ignore[override]
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the timing histogram of the sweep."""
+        if self._diagnostic_type != DIAGNOSTIC_LAST_SWEEP:
+            return None
+        timings = self._metrics.timings.get(OPERATION_SWEEP)
+        return timings.as_dict() if timings else None
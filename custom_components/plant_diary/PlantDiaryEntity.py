@@ -1,39 +1,71 @@
 """Plant Diary Entity."""
 
-from datetime import date, datetime
+from datetime import date, timedelta
 from typing import Any
 
 from propcache.api import cached_property
 
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util.dt import now
 
 from .const import DOMAIN
+from .PlantRecord import PlantRecord
+from .PlantStatusEngine import watering_state
+from .PlantWeather import WeatherConditions, watering_basis
 
 
 class PlantDiaryEntity(SensorEntity):
     """Representation of a plant diary sensor."""
 
-    def __init__(self, plant_id: str, data: dict[str, Any]) -> None:
-        """Initialize the sensor."""
+    # The state is refreshed by the manager on the days it changes
+    _attr_should_poll = False
+
+    # Settings of the plant that would bloat every state change in the recorder
+    _unrecorded_attributes = frozenset(
+        {
+            "plant_name",
+            "image",
+            "adaptive_interval",
+            "predicted_interval",
+            "confidence",
+            "moisture_sensor",
+            "moisture_threshold",
+        }
+    )
+
+    def __init__(
+        self,
+        plant_id: str,
+        data: PlantRecord | dict[str, Any],
+        today: date | None = None,
+        weather: WeatherConditions | None = None,
+        garden: str = "",
+    ) -> None:
+        """Initialize the sensor.
+
+        The plants of a garden other than the first one have the garden in their
+        name, so plants with the same ID in two gardens do not clash.
+        """
         self._plant_id: str = plant_id
-        self._name: str = f"{DOMAIN}_{plant_id}"
+        self._name: str = "_".join(filter(None, (DOMAIN, garden, plant_id)))
         self._unique_id: str = self._name
-        self._plant_name: str = data.get("plant_name", plant_id)
-        self._last_watered: date | None = None
-        self._last_fertilized: date | None = None
-        self._watering_interval: int = 14
-        self._watering_postponed: int = 0
+        self.record: PlantRecord = (
+            data
+            if isinstance(data, PlantRecord)
+            else PlantRecord.from_dict(plant_id, data)
+        )
         self._days_since_watered: int = 0
-        self._inside: bool = True
-        self._image: str = ""
         self._state: int = 0
-
-        # Load data
-        self.update_from_dict(data)
+        self._attributes: dict[str, Any] | None = None
+        self._written_fingerprint: tuple | None = None
+        self.weather = weather
+        # Set when the plant is deleted before Home Assistant added the entity
+        self.deleted = False
 
         # Calculate initial state
-        self.update_days_since_last_watered()
+        self.update_days_since_last_watered(today)
 
     @cached_property
     def name(self) -> str:
@@ -57,80 +89,94 @@ class PlantDiaryEntity(SensorEntity):
 
     def update_from_dict(self, data: dict[str, Any]) -> None:
         """Update entity attributes from a dictionary."""
-        if "last_watered" in data:
-            self._last_watered: date | None = self._parse_date(data["last_watered"])
-        if "last_fertilized" in data:
-            self._last_fertilized: date | None = self._parse_date(
-                data["last_fertilized"]
-            )
-        if "watering_interval" in data:
-            self._watering_interval: int = self._parse_int(data["watering_interval"])
-        if "watering_postponed" in data:
-            self._watering_postponed: int = self._parse_int(data["watering_postponed"])
-        if "inside" in data:
-            self._inside = bool(data["inside"])
-        if "plant_name" in data:
-            self._plant_name: str = data["plant_name"]
-        if "image" in data:
-            self._image: str = data["image"]
+        self.set_record(self.record.updated(data))
+
+    def set_record(self, record: PlantRecord) -> None:
+        """Replace the plant record wrapped by the entity."""
+        if record is not self.record:
+            self.record = record
+            self._attributes = None
 
     @property  # type: ignore[override]
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        return {
-            "plant_name": self._plant_name,
-            "last_watered": self._last_watered.isoformat()
-            if self._last_watered
-            else "Unknown",
-            "last_fertilized": self._last_fertilized.isoformat()
-            if self._last_fertilized
-            else "Unknown",
-            "watering_interval": self._watering_interval,
-            "watering_postponed": self._watering_postponed,
-            "days_since_watered": self._days_since_watered,
-            "inside": self._inside,
-            "image": self._image,
-        }
-
-    async def async_update(self) -> None:
-        """Update the sensor data."""
-        self.update_days_since_last_watered()
-
-    def update_days_since_last_watered(self) -> None:
-        """Calculate and update days since last watered."""
-        if self._last_watered is None:
-            self._days_since_watered = 0
-            self._state = 0
-        else:
-            self._days_since_watered = (now().date() - self._last_watered).days
-
-            if self._days_since_watered == 0:
-                self._state = 3
-            elif self._days_since_watered < self._watering_interval:
-                self._state = 2
-            elif (
-                self._days_since_watered
-                < self._watering_interval + self._watering_postponed
-            ):
-                self._state = 1
-            else:
-                self._state = 0
+        if self._attributes is None:
+            self._attributes = {
+                **self.record.attributes,
+                "days_since_watered": self._days_since_watered,
+            }
+        return self._attributes
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added.
+
+        A plant deleted while the entity was being added is removed again, along
+        with the registry entry just created for it.
+        """
+        self._written_fingerprint = self._fingerprint()
+        if self.deleted:
+            er.async_get(self.hass).async_remove(self.entity_id)
+
+    @callback
+    def async_write_if_changed(self) -> bool:
+        """Write the state to Home Assistant only if it changed since the last write.
+
+        Returns True when the state was written.
+        """
+        if self.hass is None:
+            return False
+
+        fingerprint = self._fingerprint()
+        if fingerprint == self._written_fingerprint:
+            return False
+
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()
+        return True
+
+    def _fingerprint(self) -> tuple:
+        """Return the values the state and the attributes are built from."""
+        return (self._state, self._days_since_watered, self.record)
+
+    def update_days_since_last_watered(self, today: date | None = None) -> None:
+        """Calculate and update days since last watered.
+
+        The current date can be given to share a single snapshot between plants.
+        """
+        self.set_status(*self.status_on(today or now().date()))
+
+    def status_on(self, day: date) -> tuple[int, int]:
+        """Return the days since watered and the state of the plant on a day."""
+        last_watered, interval = watering_basis(self.record, self.weather)
+        if last_watered is None:
+            return 0, 0
+        days_since_watered = (day - last_watered).days
+        return days_since_watered, watering_state(
+            days_since_watered, interval, self.record.watering_postponed
+        )
+
+    def set_status(self, days_since_watered: int, state: int) -> None:
+        """Set the days since watered and the state computed for the plant."""
+        self._state = state
+        if days_since_watered != self._days_since_watered:
+            self._days_since_watered = days_since_watered
+            self._attributes = None
 
         # Clear cached native_value
         self.__dict__.pop("native_value", None)
 
-    def _parse_date(self, value: Any) -> date | None:
-        """Parse a date from various formats."""
-        if isinstance(value, str):
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except ValueError:
-                return None
-        return None
-
-    def _parse_int(self, value: Any, default: int = 0) -> int:
-        """Parse an integer from various formats."""
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return default
+    def next_transition_date(self, today: date) -> date | None:
+        """Return the first date after today on which the state can change."""
+        last_watered, interval = watering_basis(self.record, self.weather)
+        if last_watered is None:
+            return None
+
+        days = (today - last_watered).days
+        upcoming = [
+            boundary
+            for boundary in (0, 1, interval, interval + self.record.watering_postponed)
+            if boundary > days
+        ]
+        if not upcoming:
+            return None
+        return last_watered + timedelta(days=min(upcoming))
@@ -1,21 +1,81 @@
 """Module for managing the Plant Diary component."""
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.logbook import async_log_entry, log_entry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_change
-
-from .const import DOMAIN
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_time,
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.util.dt import now, parse_time, start_of_local_day
+
+from .const import (
+    CONF_GARDEN,
+    CONF_LOGBOOK_RATE_LIMIT,
+    CONF_NOTIFY_SERVICE,
+    CONF_PROFILING,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_LOGBOOK_RATE_LIMIT,
+    DOMAIN,
+    SNAPSHOT_HOUR,
+    SNAPSHOT_MINUTE,
+    UPDATE_COALESCE_DELAY,
+    WEATHER_CACHE_TTL,
+)
+from .PlantDiaryDiagnosticEntity import DIAGNOSTIC_TYPES, PlantDiaryDiagnosticEntity
 from .PlantDiaryEntity import PlantDiaryEntity
+from .PlantDiarySummaryEntity import PlantDiarySummaryEntity
+from .PlantHistory import PlantHistory
+from .PlantIndex import PlantIndex, due_date
+from .PlantLogbook import (
+    ACTION_ADDED,
+    ACTION_DELETED,
+    ACTION_UPDATED,
+    ACTION_WATERED,
+    PlantLogbook,
+)
+from .PlantMetrics import (
+    COUNTER_STATE_WRITES,
+    OPERATION_SWEEP,
+    PlantMetrics,
+    timed,
+)
+from .PlantMoistureDispatcher import PlantMoistureDispatcher
+from .PlantNotifier import NOTIFY_STATES, PlantNotifier
+from .PlantRecord import DEFAULT_MOISTURE_THRESHOLD, PlantRecord
+from .PlantRepository import PlantRepository
+from .PlantScheduler import PlantScheduler
+from .PlantSnapshots import PlantSnapshots
+from .PlantStatusEngine import PlantStatusEngine
+from .PlantSummary import SUMMARY_TYPES, PlantSummary
+from .PlantWeather import PlantWeather, WeatherConditions, watering_basis
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def entry_shard(config_entry: ConfigEntry) -> str | None:
+    """Return the shard of the storage of a garden.
+
+    The first garden keeps the storage of a single diary, while the other gardens
+    are sharded by config entry.
+    """
+    return config_entry.entry_id if config_entry.data.get(CONF_GARDEN) else None
+
+
 class PlantDiaryManager:
     """Manager class to handle multiple PlantDiaryEntity instances."""
 
@@ -23,199 +83,752 @@ class PlantDiaryManager:
         """Initialize the PlantDiaryManager with Home Assistant instance and config entry."""
         self.hass = hass
         self.entry = config_entry
+        # The first garden keeps the entity IDs of a single diary
+        self.garden: str = config_entry.data.get(CONF_GARDEN, "")
+        shard = entry_shard(config_entry)
+        self.metrics = PlantMetrics()
+        self.logbook = PlantLogbook(hass, self.metrics)
+        self.notifier = PlantNotifier(hass, self._plant_status)
+        self.repository = PlantRepository(hass, config_entry, self.metrics, shard)
+        self.scheduler = PlantScheduler()
+        self.status_engine = PlantStatusEngine()
+        self.history = PlantHistory(hass, shard)
+        self.snapshots = PlantSnapshots(hass, shard)
+        self._snapshot_listener: CALLBACK_TYPE | None = None
+        self.index = PlantIndex()
+        self.moisture = PlantMoistureDispatcher(
+            hass, self._async_handle_moisture_watering
+        )
+        self.weather = PlantWeather(hass)
+        self._weather_conditions: WeatherConditions | None = None
+        self._weather_listener: CALLBACK_TYPE | None = None
+        self.summary = PlantSummary()
+        self.summary_entities = [
+            PlantDiarySummaryEntity(self.summary, summary_type, self.garden)
+            for summary_type in SUMMARY_TYPES
+        ]
+        self.diagnostic_entities: list[PlantDiaryDiagnosticEntity] = []
         self.entities = {}
         self._async_add_entities = None
-        self._midnight_listener = None
+        self._transition_listener = None
+        self._next_transition: date | None = None
+        # Plants with pending updates, and whether they were watered
+        self._pending_updates: dict[str, bool] = {}
+        self._update_flush_listener: CALLBACK_TYPE | None = None
 
     async def async_init(self):
-        """Initialize the PlantDiaryManager by registering services."""
-        await self.async_register_services()
+        """Load the plants and read the options of the config entry."""
+        await self.repository.async_load()
+        self._read_options()
+
+    @callback
+    def async_migrate_unique_ids(self) -> None:
+        """Move the aggregate sensors off the unique IDs they shared with plants.
+
+        The registry entries are kept, so the sensors keep their entity IDs. An
+        entry is left to the plant when a plant has the same unique ID.
+        """
+        registry = er.async_get(self.hass)
+        plant_names = {
+            "_".join(filter(None, (DOMAIN, self.garden, plant_id)))
+            for plant_id in self.repository.plants
+        }
+        aggregates = [*self.summary_entities, *self._new_diagnostic_entities()]
+        for entity in aggregates:
+            if entity.name in plant_names:
+                continue
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, entity.name)
+            if entity_id and not registry.async_get_entity_id(
+                "sensor", DOMAIN, entity.unique_id
+            ):
+                registry.async_update_entity(entity_id, new_unique_id=entity.unique_id)
+
+    def _read_options(self) -> None:
+        """Apply the options of the config entry."""
+        options = self.entry.options
+        self.weather.set_entity_id(options.get(CONF_WEATHER_ENTITY))
+        self.metrics.enabled = options.get(CONF_PROFILING, False)
+        self.logbook.rate_limit = timedelta(
+            minutes=options.get(CONF_LOGBOOK_RATE_LIMIT, DEFAULT_LOGBOOK_RATE_LIMIT)
+        )
+        self.notifier.service = options.get(CONF_NOTIFY_SERVICE)
+        self.notifier.quiet_start = parse_time(options.get(CONF_QUIET_HOURS_START, ""))
+        self.notifier.quiet_end = parse_time(options.get(CONF_QUIET_HOURS_END, ""))
 
+    @timed("restore_and_add_entities")
     async def restore_and_add_entities(self, async_add_entities: AddEntitiesCallback):
-        """Restore plant entities from config entry and add them to Home Assistant."""
+        """Restore plant entities from storage and add them to Home Assistant."""
         self._async_add_entities = async_add_entities
-        plants_data = self.entry.data.get("plants", {})
-
-        for plant_id, plant_data in plants_data.items():
-            await self._add_plant_entity(plant_id, plant_data, save_to_config=False)
-
-    async def async_register_services(self):
-        """Register Home Assistant services for plant management."""
-
-        async def handle_create_plant(call: ServiceCall):
-            await self.create_plant(call.data)
-
-        async def handle_update_plant(call: ServiceCall):
-            await self.update_plant(call.data)
-
-        async def handle_delete_plant(call: ServiceCall):
-            await self.delete_plant(call.data["plant_id"])
-
-        async def handle_update_days_since_last_watered(_call: ServiceCall):
-            await self.async_update_all_days_since_last_watered()
-
-        self.hass.services.async_register(DOMAIN, "create_plant", handle_create_plant)
-        self.hass.services.async_register(DOMAIN, "update_plant", handle_update_plant)
-        self.hass.services.async_register(DOMAIN, "delete_plant", handle_delete_plant)
-        self.hass.services.async_register(
-            DOMAIN, "update_days_since_watered", handle_update_days_since_last_watered
+        plants_data = await self.repository.async_load()
+
+        # Build all the entities with a single "today" snapshot and add them at once
+        today = now().date()
+        weather = self._weather_conditions = await self.weather.async_update()
+        entities = []
+        for plant_id, record in plants_data.items():
+            entity = PlantDiaryEntity(plant_id, record, today, weather, self.garden)
+            self.entities[plant_id] = entity
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+            self.status_engine.set(plant_id, record, weather)
+            self._index_plant(plant_id, entity)
+            entities.append(entity)
+
+        if self.metrics.enabled:
+            self.diagnostic_entities = self._new_diagnostic_entities()
+        async_add_entities(
+            [*self.summary_entities, *self.diagnostic_entities, *entities],
+            update_before_add=False,
         )
+        self.moisture.async_update_listener()
 
-        self._midnight_listener = async_track_time_change(
+        self._snapshot_listener = async_track_time_change(
             self.hass,
-            self.async_update_all_days_since_last_watered,
-            hour=0,
-            minute=0,
-            second=1,
+            self._async_take_snapshot,
+            hour=SNAPSHOT_HOUR,
+            minute=SNAPSHOT_MINUTE,
+            second=0,
         )
 
+        self._async_update_weather_listener()
+        self._async_schedule_next_transition()
+
+    @timed("reload")
+    async def async_reload(self) -> None:
+        """Apply the options and the stored plants to the running entities.
+
+        The stored plants are compared with the live entities, so only the added,
+        changed and removed plants are touched. The other entities, and their
+        entity registry entries, are kept as they are.
+        """
+        await self.async_flush_updates()
+        self._read_options()
+        plants = await self.repository.async_reload()
+
+        today = now().date()
+        weather = await self.weather.async_update()
+        weather_changed = weather != self._weather_conditions
+        self._weather_conditions = weather
+
+        for plant_id in self.entities.keys() - plants.keys():
+            await self._remove_plant_entity(plant_id)
+
+        new_entities = []
+        for plant_id, record in plants.items():
+            entity = self.entities.get(plant_id)
+            if entity is None:
+                entity = PlantDiaryEntity(plant_id, record, today, weather, self.garden)
+                self.entities[plant_id] = entity
+                new_entities.append(entity)
+            elif entity.record != record or weather_changed:
+                entity.set_record(record)
+                entity.weather = weather
+                entity.update_days_since_last_watered(today)
+                self._async_write_state(entity)
+            else:
+                continue
+
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+            self.status_engine.set(plant_id, record, weather)
+            self._index_plant(plant_id, entity)
+
+        if self.metrics.enabled and not self.diagnostic_entities:
+            self.diagnostic_entities = self._new_diagnostic_entities()
+            new_entities.extend(self.diagnostic_entities)
+        elif not self.metrics.enabled:
+            for diagnostic_entity in self.diagnostic_entities:
+                if diagnostic_entity.hass:
+                    await diagnostic_entity.async_remove()
+            self.diagnostic_entities = []
+
+        if new_entities and self._async_add_entities:
+            self._async_add_entities(new_entities)
+
+        self._async_write_summary()
+        self.moisture.async_update_listener()
+        self._async_update_weather_listener()
+        self._async_schedule_next_transition()
+
+    def _new_diagnostic_entities(self) -> list[PlantDiaryDiagnosticEntity]:
+        """Return the diagnostic sensors of the metrics."""
+        return [
+            PlantDiaryDiagnosticEntity(self.metrics, diagnostic_type, self.garden)
+            for diagnostic_type in DIAGNOSTIC_TYPES
+        ]
+
+    @callback
+    def _async_update_weather_listener(self) -> None:
+        """Follow the weather when a weather entity is configured."""
+        # Outside plants follow the weather, which is fetched once per cycle
+        if self.weather.entity_id and self._weather_listener is None:
+            self._weather_listener = async_track_time_interval(
+                self.hass, self._async_refresh_weather_later, WEATHER_CACHE_TTL
+            )
+        elif not self.weather.entity_id and self._weather_listener:
+            self._weather_listener()
+            self._weather_listener = None
+
+    def _get_entity(self, plant_id: str) -> PlantDiaryEntity:
+        """Return the entity of a plant, raising for an unknown plant."""
+        entity = self.entities.get(plant_id)
+        if entity is None:
+            raise ServiceValidationError(f"Plant with ID {plant_id} not found")
+        return entity
+
+    @timed("create_plant")
     async def create_plant(self, data: dict):
         """Create a new PlantDiaryEntity and add it."""
         plant_id = data["plant_name"]
-        plant_data = {
-            "plant_name": data.get("plant_name", plant_id),
-            "last_watered": data.get("last_watered", "Unknown"),
-            "last_fertilized": data.get("last_fertilized", "Unknown"),
-            "watering_interval": data.get("watering_interval", 14),
-            "watering_postponed": data.get("watering_postponed", 0),
-            "inside": data.get("inside", True),
-            "image": data.get("image", plant_id),
-        }
+        record = self._new_plant_record(plant_id, data)
 
-        await self._add_plant_entity(plant_id, plant_data, save_to_config=True)
+        await self._add_plant_entity(plant_id, record, save_to_storage=True)
 
         entity = self.entities.get(plant_id)
         if entity:
-            async_log_entry(
-                self.hass,
-                name="Plant Diary",
-                message=f"Added new plant: {plant_id}",
-                domain=DOMAIN,
-                entity_id=f"{entity.entity_id}",
+            self.logbook.async_log(
+                f"Added new plant: {plant_id}", entity.entity_id, plant_id, ACTION_ADDED
             )
 
+    @timed("update_plant")
     async def update_plant(self, data: dict):
-        """Update an existing plant."""
+        """Update an existing plant.
+
+        The update is applied in memory at once, while the state write, the save
+        and the logbook entry are coalesced with the other updates of the plant
+        made within UPDATE_COALESCE_DELAY seconds.
+        """
         plant_id = data["plant_id"]
-        entity = self.entities.get(plant_id)
-        if not entity:
-            _LOGGER.error("Plant with ID %s not found", plant_id)
-            return
+        entity = self._get_entity(plant_id)
 
+        previous_record = entity.record
         entity.update_from_dict(data)
+        self.history.async_record_changes(
+            plant_id, previous_record, entity.record, now().date()
+        )
+        watered = entity.record.last_watered != previous_record.last_watered
+
+        entity.update_days_since_last_watered()
+        self._schedule_plant(plant_id, entity)
+        self.status_engine.set(plant_id, entity.record, entity.weather)
+        self._index_plant(plant_id, entity)
+        self.moisture.async_update_listener()
+
+        self._pending_updates[plant_id] = self._pending_updates.get(plant_id) or watered
+        if self._update_flush_listener is None:
+            self._update_flush_listener = async_call_later(
+                self.hass, UPDATE_COALESCE_DELAY, self._async_flush_updates_later
+            )
 
-        # Force update the entity state
-        await entity.async_update_ha_state(True)
+    @timed("async_flush_updates")
+    async def async_flush_updates(self) -> None:
+        """Write, save and log the pending plant updates."""
+        if self._update_flush_listener:
+            self._update_flush_listener()
+            self._update_flush_listener = None
 
-        # Store the new state in the configuration
-        self.update_plant_in_config_entry(plant_id, entity.extra_state_attributes)
+        if not self._pending_updates:
+            return
 
-        async_log_entry(
-            self.hass,
-            name="Plant Diary",
-            message=f"Updated plant: {plant_id}",
-            domain=DOMAIN,
-            entity_id=f"{entity.entity_id}",
-        )
+        pending = self._pending_updates
+        self._pending_updates = {}
+        changes = {}
+        for plant_id, watered in pending.items():
+            # Skip the plants deleted since their update
+            entity = self.entities.get(plant_id)
+            if entity is None:
+                continue
+
+            self._async_write_state(entity)
+            changes[plant_id] = entity.record
+            action = ACTION_WATERED if watered else ACTION_UPDATED
+            self.logbook.async_log(
+                f"{action} plant: {plant_id}", entity.entity_id, plant_id, action
+            )
 
-    async def delete_plant(self, plant_id: str, update_config_entry: bool = True):
+        self._async_write_summary()
+        self.repository.async_set_many(changes)
+
+    async def _async_flush_updates_later(self, _now: datetime) -> None:
+        """Flush the pending plant updates once the delay has passed."""
+        self._update_flush_listener = None
+        await self.async_flush_updates()
+
+    async def _async_handle_moisture_watering(self, plant_ids: list[str]) -> None:
+        """Record the waterings detected by the moisture sensors."""
+        today = now().date().isoformat()
+        for plant_id in plant_ids:
+            _LOGGER.debug("Watering of %s detected by its moisture sensor", plant_id)
+            await self.update_plant({"plant_id": plant_id, "last_watered": today})
+
+    async def async_handle_stop(self, _event: Event) -> None:
+        """Write the pending changes when Home Assistant stops."""
+        await self.async_flush_updates()
+        self.logbook.async_flush()
+        await self.repository.async_flush()
+        await self.history.async_flush()
+
+    @timed("delete_plant")
+    async def delete_plant(self, plant_id: str):
         """Delete a plant diary entity."""
-        entity = self.entities.get(plant_id)
-        if not entity:
-            _LOGGER.error("Plant with ID %s not found", plant_id)
-            return
-
-        # Remove from config entry
-        if update_config_entry:
-            self.update_plant_in_config_entry(plant_id, None)
+        entity = self._get_entity(plant_id)
 
-        # Remove the entity from Home Assistant
-        await entity.async_remove()
+        # Remove from storage
+        self.repository.async_set(plant_id, None)
+        await self.history.async_remove(plant_id)
+        await self.snapshots.async_remove(plant_id)
 
-        # Remove from entity registry (if registered)
-        entity_registry = er.async_get(self.hass)
-        entity_entry = entity_registry.async_get(entity.entity_id)
-        if entity_entry:
-            entity_registry.async_remove(entity_entry.entity_id)
+        await self._remove_plant_entity(plant_id)
+        self._async_write_summary()
+        self.moisture.async_update_listener()
 
-        async_log_entry(
-            self.hass,
-            name="Plant Diary",
-            message=f"Deleted plant: {plant_id}",
-            domain=DOMAIN,
-            entity_id=f"{entity.entity_id}",
+        self.logbook.async_forget(plant_id)
+        self.logbook.async_log(
+            f"Deleted plant: {plant_id}", entity.entity_id, plant_id, ACTION_DELETED
         )
 
-        # Remove from the entities dictionary
-        del self.entities[plant_id]
+    @timed("bulk_upsert")
+    async def bulk_upsert(self, plants: list[dict]) -> dict:
+        """Create or update several plants with a single add and a single save.
+
+        Each item is matched by its plant_id, or by its plant_name when no plant_id
+        is given. Unknown plants are created and known plants are updated.
+        """
+        today = now().date()
+        new_entities = []
+        created = []
+        updated = []
+        changes = {}
+
+        for data in plants:
+            plant_id = data.get("plant_id", data.get("plant_name"))
+            if not plant_id:
+                _LOGGER.error("Plant without plant_id or plant_name: %s", data)
+                continue
+
+            entity = self.entities.get(plant_id)
+            if entity:
+                previous_record = entity.record
+                entity.update_from_dict(data)
+                self.history.async_record_changes(
+                    plant_id, previous_record, entity.record, today
+                )
+                entity.update_days_since_last_watered(today)
+                self._async_write_state(entity)
+                updated.append(plant_id)
+            else:
+                entity = PlantDiaryEntity(
+                    plant_id,
+                    self._new_plant_record(plant_id, data),
+                    today,
+                    self._weather_conditions,
+                    self.garden,
+                )
+                self.entities[plant_id] = entity
+                self.history.async_record_changes(plant_id, None, entity.record, today)
+                new_entities.append(entity)
+                created.append(plant_id)
+
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+            self.status_engine.set(plant_id, entity.record, entity.weather)
+            self._index_plant(plant_id, entity)
+            changes[plant_id] = entity.record
+
+        if new_entities and self._async_add_entities:
+            self._async_add_entities(new_entities)
+
+        self._async_write_summary()
+        self.moisture.async_update_listener()
+
+        self._async_schedule_next_transition()
+
+        self.repository.async_set_many(changes)
+
+        if changes:
+            self.logbook.async_log(
+                f"Created {len(created)} and updated {len(updated)} plants"
+            )
+
+        return {"created": created, "updated": updated}
+
+    @timed("bulk_delete")
+    async def bulk_delete(self, plant_ids: list[str]) -> dict:
+        """Delete several plants with a single save."""
+        deleted = []
+        not_found = []
+
+        for plant_id in plant_ids:
+            if plant_id not in self.entities:
+                not_found.append(plant_id)
+                continue
+
+            await self._remove_plant_entity(plant_id)
+            await self.history.async_remove(plant_id)
+            self.logbook.async_forget(plant_id)
+            deleted.append(plant_id)
+
+        await self.snapshots.async_remove(*deleted)
+        self._async_write_summary()
+        self.moisture.async_update_listener()
+        self.repository.async_set_many(dict.fromkeys(deleted))
+
+        if deleted:
+            self.logbook.async_log(f"Deleted {len(deleted)} plants")
+
+        return {"deleted": deleted, "not_found": not_found}
 
-    def update_plant_in_config_entry(self, plant_id: str, plant_data: dict | None):
-        """Update a plant in the config entry. When plant_data is none, the plant is removed."""
-        raw_plants = dict(self.entry.data.get("plants", {}))
-        all_plants = {}
-        if isinstance(raw_plants, dict):
-            all_plants = dict(raw_plants)
+    @timed("snooze_plant")
+    async def snooze_plant(self, data: dict):
+        """Postpone the watering of a plant, silencing its reminders.
 
-        if plant_data is None:
-            del all_plants[plant_id]
+        The postponement is extended so the plant is not overdue for the given
+        number of days, today included.
+        """
+        plant_id = data["plant_id"]
+        entity = self._get_entity(plant_id)
+
+        days = data.get("days", 1)
+        record = entity.record
+        last_watered, interval = watering_basis(record, entity.weather)
+        if last_watered is None:
+            postponed = record.watering_postponed + days
         else:
-            all_plants[plant_id] = plant_data
+            days_since_watered = (now().date() - last_watered).days
+            postponed = max(
+                record.watering_postponed, days_since_watered - interval + days
+            )
+
+        self.notifier.async_discard(plant_id)
+        await self.update_plant({"plant_id": plant_id, "watering_postponed": postponed})
+
+    async def add_event(self, data: dict):
+        """Add an event, such as a repotting, to the history of a plant."""
+        plant_id = data["plant_id"]
+        self._get_entity(plant_id)
+
+        self.history.async_append(
+            plant_id, data["event"], data.get("date") or now().date()
+        )
+
+    async def get_history(self, data: dict) -> dict:
+        """Return the last events, or the events within a date range, of a plant."""
+        self._get_entity(data["plant_id"])
+        events = await self.history.async_get_events(
+            data["plant_id"],
+            last=data.get("last"),
+            start=data.get("start"),
+            end=data.get("end"),
+        )
+        return {"events": events}
+
+    async def get_trend(self, data: dict) -> dict:
+        """Return the daily snapshots of a plant within a date range."""
+        self._get_entity(data["plant_id"])
+        end = data.get("end") or now().date()
+        start = data.get("start") or (end - timedelta(days=30))
+        snapshots = await self.snapshots.async_get_trend(data["plant_id"], start, end)
+        return {"snapshots": snapshots}
+
+    async def _async_take_snapshot(self, _now: datetime | None = None) -> None:
+        """Record the state of every plant for today."""
+        today = now().date()
+        await self.snapshots.async_record(
+            today,
+            {
+                plant_id: entity.status_on(today)
+                for plant_id, entity in self.entities.items()
+            },
+        )
 
-        self.hass.config_entries.async_update_entry(
-            self.entry, data={"plants": all_plants}
+    def query(self, data: dict) -> dict:
+        """Return the plants matching the given conditions, sorted by due date."""
+        due_within = data.get("due_within")
+
+        plant_ids = self.index.query(
+            due_by=now().date() + timedelta(days=due_within)
+            if due_within is not None
+            else None,
+            states=data.get("state"),
+            inside=data.get("inside"),
+            name_prefix=data.get("name_prefix"),
         )
+        if (limit := data.get("limit")) is not None:
+            plant_ids = plant_ids[:limit]
+
+        plants = []
+        for plant_id in plant_ids:
+            entity = self.entities[plant_id]
+            record = entity.record
+            due = due_date(record, entity.weather)
+            plants.append(
+                {
+                    "plant_id": plant_id,
+                    "plant_name": record.plant_name,
+                    "state": entity.native_value,
+                    "due_date": due.isoformat() if due else None,
+                    "inside": record.inside,
+                }
+            )
+        return {"plants": plants}
+
+    def _new_plant_record(self, plant_id: str, data: dict) -> PlantRecord:
+        """Return the record of a new plant, using defaults for missing fields."""
+        return PlantRecord.from_dict(
+            plant_id,
+            {
+                "plant_name": data.get("plant_name", plant_id),
+                "last_watered": data.get("last_watered", "Unknown"),
+                "last_fertilized": data.get("last_fertilized", "Unknown"),
+                "watering_interval": data.get("watering_interval", 14),
+                "watering_postponed": data.get("watering_postponed", 0),
+                "inside": data.get("inside", True),
+                "image": data.get("image", plant_id),
+                "adaptive_interval": data.get("adaptive_interval", False),
+                "moisture_sensor": data.get("moisture_sensor", ""),
+                "moisture_threshold": data.get(
+                    "moisture_threshold", DEFAULT_MOISTURE_THRESHOLD
+                ),
+            },
+        )
+
+    async def _remove_plant_entity(self, plant_id: str):
+        """Remove a PlantDiaryEntity from Home Assistant and the entity registry."""
+        entity = self.entities.pop(plant_id)
+        self.scheduler.unschedule(plant_id)
+        self.status_engine.remove(plant_id)
+        self.index.remove(plant_id)
+        self.summary.remove(plant_id)
+        self.moisture.unbind(plant_id)
+
+        # Remove the entity from Home Assistant, unless it is not added yet
+        entity_registry = er.async_get(self.hass)
+        if entity.hass is None:
+            entity.deleted = True
+            entity_id = entity_registry.async_get_entity_id(
+                "sensor", DOMAIN, entity.unique_id
+            )
+        else:
+            await entity.async_remove()
+            entity_id = entity.entity_id
+
+        # Remove from entity registry (if registered)
+        entity_entry = entity_registry.async_get(entity_id) if entity_id else None
+        if entity_entry:
+            entity_registry.async_remove(entity_entry.entity_id)
 
     async def _add_plant_entity(
-        self, plant_id: str, plant_data: dict, save_to_config: bool = False
+        self, plant_id: str, record: PlantRecord, save_to_storage: bool = False
     ):
         """Create and add a PlantDiaryEntity."""
-        entity = PlantDiaryEntity(plant_id, plant_data)
+        entity = PlantDiaryEntity(
+            plant_id, record, weather=self._weather_conditions, garden=self.garden
+        )
         self.entities[plant_id] = entity
 
         if self._async_add_entities:
             self._async_add_entities([entity])
 
-        # Force update the entity state
-        await entity.async_update_ha_state(True)
+        self._schedule_plant(plant_id, entity)
+        self.status_engine.set(plant_id, record, entity.weather)
+        if self._index_plant(plant_id, entity):
+            self._async_write_summary()
+        self.moisture.async_update_listener()
+
+        # Store the plant if applicable
+        if save_to_storage:
+            self.repository.async_set(plant_id, entity.record)
+            self.history.async_record_changes(plant_id, None, record, now().date())
+
+    def _index_plant(self, plant_id: str, entity: PlantDiaryEntity) -> bool:
+        """Update the indexes, the summary and the moisture sensor of a plant.
+
+        Returns True when the summary changed.
+        """
+        record = entity.record
+        self.moisture.bind(plant_id, record.moisture_sensor, record.moisture_threshold)
+        self.index.set(plant_id, record, entity.native_value, entity.weather)
+        return self.summary.set(plant_id, entity.native_value, entity.record.inside)
+
+    @callback
+    def _async_write_state(
+        self, entity: PlantDiaryEntity | PlantDiarySummaryEntity
+    ) -> None:
+        """Write the state of an entity if it changed."""
+        if entity.async_write_if_changed():
+            self.metrics.count(COUNTER_STATE_WRITES)
+
+    @callback
+    def _async_write_summary(self) -> None:
+        """Write the summary sensors whose counts changed."""
+        for summary_entity in self.summary_entities:
+            self._async_write_state(summary_entity)
+
+    @callback
+    def _async_notify_transition(
+        self, plant_id: str, previous_state: int, entity: PlantDiaryEntity
+    ) -> None:
+        """Remind of a plant whose state turned due or overdue."""
+        state = entity.native_value
+        if state != previous_state and state in NOTIFY_STATES:
+            self.notifier.async_add(plant_id)
+
+    def _plant_status(self, plant_id: str) -> tuple[str, int] | None:
+        """Return the name and the state of a plant, or None when it is gone."""
+        entity = self.entities.get(plant_id)
+        if entity is None:
+            return None
+        return entity.record.plant_name, entity.native_value
+
+    def _schedule_plant(self, plant_id: str, entity: PlantDiaryEntity) -> None:
+        """Schedule the next state transition of a plant."""
+        self.scheduler.schedule(plant_id, entity.next_transition_date(now().date()))
+        self._async_schedule_next_transition()
+
+    @callback
+    def _async_schedule_next_transition(self) -> None:
+        """Arm the timer for the earliest scheduled state transition."""
+        next_transition = self.scheduler.next_date()
+        if next_transition == self._next_transition and (
+            self._transition_listener or next_transition is None
+        ):
+            return
+
+        if self._transition_listener:
+            self._transition_listener()
+            self._transition_listener = None
+
+        self._next_transition = next_transition
+        if next_transition is None:
+            return
+
+        self._transition_listener = async_track_point_in_time(
+            self.hass,
+            self._async_handle_transitions,
+            start_of_local_day(next_transition) + timedelta(seconds=1),
+        )
+
+    @timed("transitions")
+    async def _async_handle_transitions(self, _now: datetime | None = None):
+        """Update the plants whose state transition is due."""
+        self._transition_listener = None
+        self._next_transition = None
+
+        today = now().date()
+        transitions = 0
+        for plant_id in self.scheduler.pop_due(today):
+            entity = self.entities.get(plant_id)
+            if entity is None:
+                continue
+
+            previous_state = entity.native_value
+            entity.update_days_since_last_watered(today)
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+
+            # Only plants whose state flipped are written
+            if entity.native_value != previous_state:
+                self._async_write_state(entity)
+                self._index_plant(plant_id, entity)
+                self._async_notify_transition(plant_id, previous_state, entity)
+                transitions += 1
+
+        if transitions:
+            self._async_write_summary()
+        _LOGGER.debug("State transitions for %s plants", transitions)
+        self._async_schedule_next_transition()
+
+    async def _async_refresh_weather_later(self, _now: datetime) -> None:
+        """Fetch the weather once the refresh interval has passed."""
+        await self._async_refresh_weather(force=True)
+
+    async def _async_refresh_weather(self, force: bool = False) -> None:
+        """Update the outside plants if the weather conditions changed."""
+        conditions = await self.weather.async_update(force)
+        if conditions == self._weather_conditions:
+            return
+        self._weather_conditions = conditions
 
-        # Store in the config entry if applicable
-        if save_to_config:
-            self.update_plant_in_config_entry(plant_id, entity.extra_state_attributes)
+        for entity in self.entities.values():
+            entity.weather = conditions
 
+        # Inside plants ignore the weather, so only outside plants are recomputed
+        today = now().date()
+        for plant_id in self.index.query(inside=False):
+            entity = self.entities[plant_id]
+            previous_state = entity.native_value
+            entity.update_days_since_last_watered(today)
+            self._async_notify_transition(plant_id, previous_state, entity)
+            self._async_write_state(entity)
+            self.status_engine.set(plant_id, entity.record, conditions)
+            self._index_plant(plant_id, entity)
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+
+        self._async_write_summary()
+        self._async_schedule_next_transition()
+
+    @timed(OPERATION_SWEEP)
     async def async_update_all_days_since_last_watered(
         self, _now: datetime | None = None
     ):
         """Update the days since last watered for all plant entities."""
 
         _LOGGER.debug("update for all plants")
-        for plant_id in list(self.entities.keys()):
-            entity = self.entities[plant_id]
-
-            # Force update the entity state and write it to home assistant
-            await entity.async_update_ha_state(True)
-
-            # Store the new state in the configuration
-            self.update_plant_in_config_entry(plant_id, entity.extra_state_attributes)
-
-        log_entry(
-            self.hass,
-            name="Plant Diary",
-            message="Updated days since last watered for all plants: "
-            + str(len(self.entities)),
-            domain=DOMAIN,
-            entity_id=None,  # No specific entity ID for this log entry
+        await self._async_refresh_weather()
+        today = now().date()
+
+        # Compute the status of every plant in one pass and only touch the changed ones
+        for plant_id in self.status_engine.compute(today):
+            entity = self.entities.get(plant_id)
+            if entity is None:
+                continue
+
+            previous_state = entity.native_value
+            entity.set_status(*self.status_engine.status(plant_id))
+            self._async_notify_transition(plant_id, previous_state, entity)
+            self._async_write_state(entity)
+            self._index_plant(plant_id, entity)
+            self.scheduler.schedule(plant_id, entity.next_transition_date(today))
+
+        self._async_write_summary()
+        # The plant records do not change, so nothing needs to be saved
+        self._async_schedule_next_transition()
+
+        self.logbook.async_log(
+            f"Updated days since last watered for all plants: {len(self.entities)}"
         )
 
     async def async_unload(self):
-        """Unload the manager and remove all entities."""
-
-        # Unload all entities
-        for plant_id in list(self.entities.keys()):
-            await self.delete_plant(plant_id, update_config_entry=False)
-
-        if self._midnight_listener:
-            self._midnight_listener()
-            self._midnight_listener = None
+        """Unload the manager, detaching its entities.
+
+        The entities are removed from Home Assistant by the unload of the sensor
+        platform. Their entity registry entries are kept, so customised entity IDs
+        survive restarts and reloads, and nothing is logged.
+        """
+
+        # Apply the coalesced updates before the entities go away
+        await self.async_flush_updates()
+        self.logbook.async_unload()
+        self.notifier.async_unload()
+        self.moisture.async_unload()
+
+        self.entities.clear()
+        self.diagnostic_entities = []
+        self.summary.clear()
+
+        if self._transition_listener:
+            self._transition_listener()
+            self._transition_listener = None
+        self._next_transition = None
+        if self._weather_listener:
+            self._weather_listener()
+            self._weather_listener = None
+        if self._snapshot_listener:
+            self._snapshot_listener()
+            self._snapshot_listener = None
+        self.scheduler.clear()
+        self.status_engine.clear()
+        self.index.clear()
 
         if self._async_add_entities:
             self._async_add_entities = None
+
+        # Write pending changes before the manager goes away
+        await self.repository.async_flush()
+        await self.history.async_flush()
@@ -0,0 +1,86 @@
+"""Plant Diary Summary Entity."""
+
+from typing import Any
+
+from propcache.api import cached_property
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .PlantSummary import SUMMARY_DUE_TODAY, PlantSummary
+
+
+class PlantDiarySummaryEntity(SensorEntity):
+    """Representation of a sensor counting plants in a watering state."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "plants"
+
+    def __init__(
+        self, summary: PlantSummary, summary_type: str, garden: str = ""
+    ) -> None:
+        """Initialize the sensor."""
+        self._summary = summary
+        self._summary_type = summary_type
+        self._name: str = "_".join(filter(None, (DOMAIN, garden, summary_type)))
+        # Suffixed so a plant named after the summary does not share its unique ID
+        self._unique_id: str = f"{self._name}_summary"
+        self._written_values: tuple[int, int] | None = None
+
+    @cached_property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return self._name
+
+    @cached_property
+    def unique_id(self) -> str | None:
+        """Return a unique ID for this entity."""
+        return self._unique_id
+
+    @cached_property
+    def icon(self) -> str:
+        """Return the icon to use in the frontend."""
+        if self._summary_type == SUMMARY_DUE_TODAY:
+            return "mdi:watering-can"
+        return "mdi:water-alert"
+
+    @property  # type: ignore[override]
+    def native_value(self) -> int:
+        """Return the number of plants."""
+        return self._summary.count(self._summary_type)
+
+    @property  # type: ignore[override]
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of plants inside and outside."""
+        inside, outside = self._values()
+        return {"inside": inside, "outside": outside}
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the counts written when the entity is added."""
+        self._written_values = self._values()
+
+    @callback
+    def async_write_if_changed(self) -> bool:
+        """Write the state to Home Assistant only if the counts changed.
+
+        Returns True when the state was written.
+        """
+        if self.hass is None:
+            return False
+
+        values = self._values()
+        if values == self._written_values:
+            return False
+
+        self._written_values = values
+        self.async_write_ha_state()
+        return True
+
+    def _values(self) -> tuple[int, int]:
+        """Return the number of plants inside and outside."""
+        return (
+            self._summary.count(self._summary_type, inside=True),
+            self._summary.count(self._summary_type, inside=False),
+        )
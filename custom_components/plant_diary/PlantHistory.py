@@ -0,0 +1,258 @@
+"""Watering history of the Plant Diary component."""
+
+from datetime import date
+import hashlib
+import json
+import logging
+import mmap
+import os
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import HISTORY_DIRECTORY, HISTORY_FLUSH_DELAY
+from .PlantRecord import PlantRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_WATERED = "watered"
+EVENT_FERTILIZED = "fertilized"
+EVENT_POSTPONED = "postponed"
+EVENT_REPOTTED = "repotted"
+EVENT_TYPES = (EVENT_WATERED, EVENT_FERTILIZED, EVENT_POSTPONED, EVENT_REPOTTED)
+
+# Each event is a JSON line starting with its date: {"d":"2025-07-30",...
+_DATE_SLICE = slice(6, 16)
+
+
+def encode_event(event_date: date, event: str, value: int | None = None) -> bytes:
+    """Encode an event as a JSON line."""
+    data: dict[str, Any] = {"d": event_date.isoformat(), "e": event}
+    if value is not None:
+        data["v"] = value
+    return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_event(line: bytes) -> dict[str, Any]:
+    """Decode a JSON line into an event."""
+    data = json.loads(line)
+    event = {"date": data["d"], "event": data["e"]}
+    if "v" in data:
+        event["value"] = data["v"]
+    return event
+
+
+def read_events(
+    path: str,
+    last: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[dict[str, Any]]:
+    """Read the events of a history file through a memory map.
+
+    With last, only the last events are decoded by scanning the file backwards.
+    Otherwise the date of each line is compared before decoding it.
+    """
+    try:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if last is not None:
+                    return _read_last_events(data, last)
+                return _read_events_between(data, start, end)
+    except FileNotFoundError:
+        return []
+
+
+def _read_last_events(data: mmap.mmap, last: int) -> list[dict[str, Any]]:
+    """Decode the last events of a memory mapped history file."""
+    events = []
+    # An interrupted append leaves a last line without its newline, skipped here
+    line_end = data.rfind(b"\n")
+    while line_end > 0 and len(events) < last:
+        line_start = data.rfind(b"\n", 0, line_end) + 1
+        event = _decode_line(data[line_start:line_end])
+        if event is not None:
+            events.append(event)
+        line_end = line_start - 1
+    return events[::-1]
+
+
+def _read_events_between(
+    data: mmap.mmap, start: date | None, end: date | None
+) -> list[dict[str, Any]]:
+    """Decode the events of a memory mapped history file within a date range."""
+    start_key = start.isoformat().encode() if start else None
+    end_key = end.isoformat().encode() if end else None
+    events = []
+    for line in iter(data.readline, b""):
+        # An interrupted append leaves a last line without its newline
+        if not line.endswith(b"\n"):
+            break
+        event_date = line[_DATE_SLICE]
+        if start_key and event_date < start_key:
+            continue
+        if end_key and event_date > end_key:
+            continue
+        event = _decode_line(line)
+        if event is not None:
+            events.append(event)
+    return events
+
+
+def _decode_line(line: bytes) -> dict[str, Any] | None:
+    """Decode a line of a history file, or return None for a corrupted line."""
+    try:
+        return decode_event(line)
+    except (ValueError, KeyError):
+        _LOGGER.warning("Ignoring a corrupted history line: %s", line)
+        return None
+
+
+class PlantHistory:
+    """Append-only event history of each plant.
+
+    Every plant has its own JSON lines file. New events are buffered in memory and
+    appended to the files in a single executor job after a short delay.
+    """
+
+    def __init__(self, hass: HomeAssistant, shard: str | None = None) -> None:
+        """Initialize the history, kept in a subdirectory when a shard is given."""
+        self.hass = hass
+        self.shard = shard
+        self._pending: dict[str, list[bytes]] = {}
+        self._flush_listener: CALLBACK_TYPE | None = None
+
+    @property
+    def directory(self) -> str:
+        """Return the directory of the history files."""
+        directory = self.hass.config.path(".storage", HISTORY_DIRECTORY)
+        return os.path.join(directory, self.shard) if self.shard else directory
+
+    def path(self, plant_id: str) -> str:
+        """Return the path of the history file of a plant."""
+        name = hashlib.sha1(plant_id.encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    @callback
+    def async_append(
+        self,
+        plant_id: str,
+        event: str,
+        event_date: date,
+        value: int | None = None,
+    ) -> None:
+        """Append an event to the history of a plant."""
+        self._pending.setdefault(plant_id, []).append(
+            encode_event(event_date, event, value)
+        )
+        if self._flush_listener is None:
+            self._flush_listener = async_call_later(
+                self.hass, HISTORY_FLUSH_DELAY, self._async_flush_later
+            )
+
+    @callback
+    def async_record_changes(
+        self,
+        plant_id: str,
+        old: PlantRecord | None,
+        new: PlantRecord,
+        today: date,
+    ) -> None:
+        """Append the events implied by the changes between two plant records."""
+        if new.last_watered and (old is None or old.last_watered != new.last_watered):
+            self.async_append(plant_id, EVENT_WATERED, new.last_watered)
+        if new.last_fertilized and (
+            old is None or old.last_fertilized != new.last_fertilized
+        ):
+            self.async_append(plant_id, EVENT_FERTILIZED, new.last_fertilized)
+        if old is not None and new.watering_postponed > old.watering_postponed:
+            self.async_append(
+                plant_id, EVENT_POSTPONED, today, new.watering_postponed
+            )
+
+    async def async_get_events(
+        self,
+        plant_id: str,
+        last: int | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the last events, or the events within a date range, of a plant."""
+        await self.async_flush()
+        return await self.hass.async_add_executor_job(
+            self._read_events, plant_id, last, start, end
+        )
+
+    async def async_remove(self, plant_id: str) -> None:
+        """Remove the history of a plant."""
+        self._pending.pop(plant_id, None)
+        await self.hass.async_add_executor_job(self._remove_file, plant_id)
+
+    async def async_remove_all(self) -> None:
+        """Remove the history of every plant."""
+        self._pending.clear()
+        await self.hass.async_add_executor_job(self._remove_directory)
+
+    async def async_flush(self) -> None:
+        """Append the buffered events to the history files."""
+        if self._flush_listener:
+            self._flush_listener()
+            self._flush_listener = None
+
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = {}
+        await self.hass.async_add_executor_job(self._write_events, pending)
+
+    async def _async_flush_later(self, _now: Any) -> None:
+        """Flush the buffered events once the delay has passed."""
+        self._flush_listener = None
+        await self.async_flush()
+
+    def _read_events(
+        self,
+        plant_id: str,
+        last: int | None,
+        start: date | None,
+        end: date | None,
+    ) -> list[dict[str, Any]]:
+        """Read the events of the history file of a plant."""
+        return read_events(self.path(plant_id), last, start, end)
+
+    def _write_events(self, pending: dict[str, list[bytes]]) -> None:
+        """Append events to the history files."""
+        os.makedirs(self.directory, exist_ok=True)
+        for plant_id, lines in pending.items():
+            with open(self.path(plant_id), "a+b") as file:
+                # End a line left incomplete by an interrupted append
+                size = file.seek(0, os.SEEK_END)
+                if size:
+                    file.seek(size - 1)
+                    if file.read(1) != b"\n":
+                        lines = [b"\n", *lines]
+                file.write(b"".join(lines))
+
+    def _remove_directory(self) -> None:
+        """Remove the history files, keeping the shards of the other gardens."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                os.remove(path)
+        if self.shard:
+            os.rmdir(self.directory)
+
+    def _remove_file(self, plant_id: str) -> None:
+        """Remove the history file of a plant if it exists."""
+        try:
+            os.remove(self.path(plant_id))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,165 @@
+"""Secondary indexes of the Plant Diary component."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import NamedTuple
+
+from .PlantRecord import PlantRecord
+from .PlantWeather import WeatherConditions, watering_basis
+
+# Plants never watered are due from the start
+NO_DUE_DATE = 0
+
+_KEY = itemgetter(0)
+
+
+class PlantIndexEntry(NamedTuple):
+    """Values of a plant kept in the indexes."""
+
+    due: int
+    name: str
+    state: int
+    inside: bool
+
+
+def due_date(
+    record: PlantRecord, weather: WeatherConditions | None = None
+) -> date | None:
+    """Return the date from which a plant needs watering."""
+    last_watered, interval = watering_basis(record, weather)
+    if last_watered is None:
+        return None
+    return last_watered + timedelta(days=interval)
+
+
+class PlantIndex:
+    """Indexes over the plants answering queries without scanning every plant.
+
+    Due dates and names are kept in sorted lists searched with bisect, while
+    states and locations map to sets of plant IDs. A query starts from the
+    smallest matching candidates and checks the other conditions on each of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self._entries: dict[str, PlantIndexEntry] = {}
+        self._due: list[tuple[int, str]] = []
+        self._names: list[tuple[str, str]] = []
+        self._states: dict[int, set[str]] = {}
+        self._inside: dict[bool, set[str]] = {True: set(), False: set()}
+
+    def __len__(self) -> int:
+        """Return the number of plants."""
+        return len(self._entries)
+
+    def set(
+        self,
+        plant_id: str,
+        record: PlantRecord,
+        state: int,
+        weather: WeatherConditions | None = None,
+    ) -> None:
+        """Add or update a plant in the indexes."""
+        due = due_date(record, weather)
+        entry = PlantIndexEntry(
+            due.toordinal() if due else NO_DUE_DATE,
+            record.plant_name.casefold(),
+            state,
+            record.inside,
+        )
+        previous = self._entries.get(plant_id)
+        if previous == entry:
+            return
+
+        if previous is not None:
+            self._unindex(plant_id, previous)
+        self._entries[plant_id] = entry
+        insort(self._due, (entry.due, plant_id))
+        insort(self._names, (entry.name, plant_id))
+        self._states.setdefault(entry.state, set()).add(plant_id)
+        self._inside[entry.inside].add(plant_id)
+
+    def remove(self, plant_id: str) -> None:
+        """Remove a plant from the indexes."""
+        previous = self._entries.pop(plant_id, None)
+        if previous is not None:
+            self._unindex(plant_id, previous)
+
+    def clear(self) -> None:
+        """Remove all plants."""
+        self._entries.clear()
+        self._due.clear()
+        self._names.clear()
+        self._states.clear()
+        for plant_ids in self._inside.values():
+            plant_ids.clear()
+
+    def query(
+        self,
+        due_by: date | None = None,
+        states: Iterable[int] | None = None,
+        inside: bool | None = None,
+        name_prefix: str | None = None,
+    ) -> list[str]:
+        """Return the IDs of the plants matching every given condition.
+
+        The plants are sorted by due date, with the plants never watered first.
+        """
+        candidates: list[Iterable[str]] = []
+        if due_by is not None:
+            end = bisect_right(self._due, due_by.toordinal(), key=_KEY)
+            candidates.append([plant_id for _, plant_id in self._due[:end]])
+        if states is not None:
+            states = set(states)
+            candidates.append(
+                [
+                    plant_id
+                    for state in states
+                    for plant_id in self._states.get(state, ())
+                ]
+            )
+        if inside is not None:
+            candidates.append(self._inside[inside])
+        if name_prefix:
+            prefix = name_prefix.casefold()
+            start = bisect_left(self._names, prefix, key=_KEY)
+            end = bisect_left(self._names, prefix + "\U0010ffff", key=_KEY)
+            candidates.append([plant_id for _, plant_id in self._names[start:end]])
+
+        if not candidates:
+            matches: Iterable[str] = self._entries
+        else:
+            matches = min(candidates, key=len)
+
+        entries = self._entries
+        result = []
+        for plant_id in matches:
+            entry = entries[plant_id]
+            if due_by is not None and entry.due > due_by.toordinal():
+                continue
+            if states is not None and entry.state not in states:
+                continue
+            if inside is not None and entry.inside != inside:
+                continue
+            if name_prefix and not entry.name.startswith(prefix):
+                continue
+            result.append(plant_id)
+
+        result.sort(key=lambda plant_id: (entries[plant_id].due, plant_id))
+        return result
+
+    def _unindex(self, plant_id: str, entry: PlantIndexEntry) -> None:
+        """Remove the values of a plant from the indexes."""
+        self._remove_sorted(self._due, (entry.due, plant_id))
+        self._remove_sorted(self._names, (entry.name, plant_id))
+        self._states[entry.state].discard(plant_id)
+        self._inside[entry.inside].discard(plant_id)
+
+    @staticmethod
+    def _remove_sorted(items: list, item: tuple) -> None:
+        """Remove an item from a sorted list."""
+        position = bisect_left(items, item)
+        if position < len(items) and items[position] == item:
+            del items[position]
@@ -0,0 +1,64 @@
+"""Watering interval statistics of the Plant Diary component."""
+
+from dataclasses import dataclass
+import math
+
+# Weight of the newest watering gap in the moving average
+INTERVAL_SMOOTHING = 0.3
+# Number of gaps needed before the estimate replaces the configured interval
+ADAPTIVE_MIN_SAMPLES = 2
+# Number of gaps after which the estimate is fully trusted
+CONFIDENCE_SAMPLES = 5
+
+
+@dataclass(frozen=True, slots=True)
+class PlantIntervalStats:
+    """Exponentially weighted mean and variance of the gaps between waterings.
+
+    Each new gap updates the statistics in constant time, so the estimate never
+    has to rescan the watering history.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+
+    def add(self, gap: int) -> "PlantIntervalStats":
+        """Return the statistics including a new gap between two waterings."""
+        if self.count == 0:
+            return PlantIntervalStats(1, float(gap), 0.0)
+
+        diff = gap - self.mean
+        increment = INTERVAL_SMOOTHING * diff
+        return PlantIntervalStats(
+            self.count + 1,
+            self.mean + increment,
+            (1 - INTERVAL_SMOOTHING) * (self.variance + diff * increment),
+        )
+
+    @property
+    def predicted_interval(self) -> float | None:
+        """Return the predicted watering interval in days."""
+        if self.count == 0:
+            return None
+        return round(self.mean, 1)
+
+    @property
+    def confidence(self) -> float:
+        """Return a confidence between 0 and 1 in the predicted interval."""
+        if self.count == 0 or self.mean <= 0:
+            return 0.0
+        variation = math.sqrt(self.variance) / self.mean
+        return round(
+            min(1.0, self.count / CONFIDENCE_SAMPLES) * max(0.0, 1.0 - variation), 2
+        )
+
+    def as_list(self) -> list[float]:
+        """Return the statistics in their stored form."""
+        return [self.count, self.mean, self.variance]
+
+    @classmethod
+    def from_list(cls, value: list[float]) -> "PlantIntervalStats":
+        """Create the statistics from their stored form."""
+        count, mean, variance = value
+        return cls(int(count), float(mean), float(variance))
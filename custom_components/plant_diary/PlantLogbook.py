@@ -0,0 +1,139 @@
+"""Logbook entries of the Plant Diary component."""
+
+from datetime import timedelta
+import logging
+from time import monotonic
+from typing import Any, NamedTuple
+
+from homeassistant.components.logbook import async_log_entry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_LOGBOOK_RATE_LIMIT, DOMAIN, LOGBOOK_BATCH_DELAY
+from .PlantMetrics import COUNTER_LOGBOOK_ENTRIES, PlantMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+ACTION_ADDED = "Added"
+ACTION_UPDATED = "Updated"
+ACTION_WATERED = "Watered"
+ACTION_DELETED = "Deleted"
+
+# Added and deleted plants are always logged
+RATE_LIMITED_ACTIONS = (ACTION_UPDATED, ACTION_WATERED)
+
+LOGBOOK_NAME = "Plant Diary"
+
+
+class LogbookEntry(NamedTuple):
+    """Buffered logbook entry, for a plant when it has an action."""
+
+    message: str
+    entity_id: str | None
+    action: str | None
+
+
+class PlantLogbook:
+    """Batched and rate limited logbook entries.
+
+    Entries are buffered and written together after LOGBOOK_BATCH_DELAY seconds.
+    Within a batch, the entries of several plants for the same action are
+    summarised in a single entry, such as "Watered 12 plants". Updates of a plant
+    within the rate limit of its last logged update are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, metrics: PlantMetrics) -> None:
+        """Initialize the logbook."""
+        self.hass = hass
+        self.metrics = metrics
+        self.rate_limit = timedelta(minutes=DEFAULT_LOGBOOK_RATE_LIMIT)
+        self._pending: list[LogbookEntry] = []
+        self._last_logged: dict[tuple[str, str], float] = {}
+        self._flush_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_log(
+        self,
+        message: str,
+        entity_id: str | None = None,
+        plant_id: str | None = None,
+        action: str | None = None,
+    ) -> None:
+        """Buffer an entry, dropping the rate limited updates of a plant."""
+        if plant_id is not None and action in RATE_LIMITED_ACTIONS:
+            key = (plant_id, action)
+            now = monotonic()
+            last = self._last_logged.get(key)
+            if last is not None and now - last < self.rate_limit.total_seconds():
+                _LOGGER.debug("Rate limited logbook entry: %s", message)
+                return
+            self._last_logged[key] = now
+
+        self._pending.append(
+            LogbookEntry(message, entity_id, action if plant_id else None)
+        )
+        if self._flush_listener is None:
+            self._flush_listener = async_call_later(
+                self.hass, LOGBOOK_BATCH_DELAY, self._async_flush_later
+            )
+
+    @callback
+    def async_forget(self, plant_id: str) -> None:
+        """Forget the rate limits of a deleted plant."""
+        for action in RATE_LIMITED_ACTIONS:
+            self._last_logged.pop((plant_id, action), None)
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the buffered entries, summarising the bursts of an action."""
+        if self._flush_listener:
+            self._flush_listener()
+            self._flush_listener = None
+
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = []
+        entries: list[LogbookEntry] = []
+        by_action: dict[str, list[LogbookEntry]] = {}
+        for entry in pending:
+            if entry.action is None:
+                entries.append(entry)
+            else:
+                by_action.setdefault(entry.action, []).append(entry)
+
+        for action, action_entries in by_action.items():
+            if len(action_entries) == 1:
+                entries.extend(action_entries)
+            else:
+                entries.append(
+                    LogbookEntry(f"{action} {len(action_entries)} plants", None, action)
+                )
+
+        for entry in entries:
+            self._async_write(entry)
+
+    @callback
+    def async_unload(self) -> None:
+        """Write the buffered entries and forget the rate limits."""
+        self.async_flush()
+        self._last_logged.clear()
+
+    @callback
+    def _async_write(self, entry: LogbookEntry) -> None:
+        """Add an entry to the logbook."""
+        self.metrics.count(COUNTER_LOGBOOK_ENTRIES)
+        async_log_entry(
+            self.hass,
+            name=LOGBOOK_NAME,
+            message=entry.message,
+            domain=DOMAIN,
+            entity_id=entry.entity_id,
+        )
+
+    @callback
+    def _async_flush_later(self, _now: Any) -> None:
+        """Write the buffered entries once the delay has passed."""
+        self._flush_listener = None
+        self.async_flush()
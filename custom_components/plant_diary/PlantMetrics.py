@@ -0,0 +1,118 @@
+"""Profiling instrumentation of the Plant Diary component."""
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from time import perf_counter
+from typing import Any, TypeVar
+
+COUNTER_STORAGE_WRITES = "storage_writes"
+COUNTER_STATE_WRITES = "state_writes"
+COUNTER_LOGBOOK_ENTRIES = "logbook_entries"
+COUNTERS = (COUNTER_STORAGE_WRITES, COUNTER_STATE_WRITES, COUNTER_LOGBOOK_ENTRIES)
+
+OPERATION_SWEEP = "sweep"
+
+# Upper bounds of the histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_T = TypeVar("_T")
+
+
+class OperationTimings:
+    """Histogram of the durations of an operation."""
+
+    __slots__ = ("buckets", "count", "last", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, milliseconds: float) -> None:
+        """Add the duration of a run."""
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.last = milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in a serialisable form."""
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS]
+        labels.append(f">{HISTOGRAM_BUCKETS[-1]}ms")
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.max, 3),
+            "last_ms": round(self.last, 3),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class PlantMetrics:
+    """Timings and counters of the manager operations.
+
+    Nothing is collected while disabled, leaving a single flag check on the
+    instrumented paths.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the metrics."""
+        self.enabled = enabled
+        self.timings: dict[str, OperationTimings] = {}
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+
+    def record(self, operation: str, seconds: float) -> None:
+        """Record the duration of an operation."""
+        timings = self.timings.get(operation)
+        if timings is None:
+            timings = self.timings[operation] = OperationTimings()
+        timings.add(seconds * 1000)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter if the metrics are enabled."""
+        if self.enabled:
+            self.counters[counter] += amount
+
+    def last_duration(self, operation: str) -> float | None:
+        """Return the duration of the last run of an operation in milliseconds."""
+        timings = self.timings.get(operation)
+        return round(timings.last, 3) if timings else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics in a serialisable form."""
+        return {
+            "enabled": self.enabled,
+            "counters": dict(self.counters),
+            "timings": {
+                operation: timings.as_dict()
+                for operation, timings in self.timings.items()
+            },
+        }
+
+
+def timed(
+    operation: str,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Time a coroutine method of an object holding PlantMetrics in .metrics."""
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> _T:
+            metrics: PlantMetrics = self.metrics
+            if not metrics.enabled:
+                return await func(self, *args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                metrics.record(operation, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
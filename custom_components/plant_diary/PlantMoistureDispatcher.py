@@ -0,0 +1,165 @@
+"""Soil moisture watering detection of the Plant Diary component."""
+
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+
+from .const import MOISTURE_DEBOUNCE_DELAY, MOISTURE_HYSTERESIS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantMoistureDispatcher:
+    """Detect waterings from the moisture sensors bound to the plants.
+
+    A single state change listener covers every bound sensor and dispatches each
+    reading to the plants bound to that sensor. Readings are debounced, so only
+    the last reading of a chatty sensor within MOISTURE_DEBOUNCE_DELAY seconds is
+    evaluated. A watering is a rise of the moisture to the threshold of a plant,
+    and the plant is armed again once the moisture falls MOISTURE_HYSTERESIS below
+    the threshold.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_watered: Callable[[list[str]], Awaitable[None]],
+    ) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._on_watered = on_watered
+        self._bindings: dict[str, dict[str, int]] = {}
+        self._plant_sources: dict[str, tuple[str, int]] = {}
+        self._armed: dict[str, bool] = {}
+        self._readings: dict[str, float] = {}
+        self._listener: CALLBACK_TYPE | None = None
+        self._flush_listener: CALLBACK_TYPE | None = None
+        self._sources_changed = False
+
+    @property
+    def sources(self) -> list[str]:
+        """Return the bound sensor entity IDs."""
+        return list(self._bindings)
+
+    def bind(self, plant_id: str, source: str, threshold: int) -> None:
+        """Bind a plant to a moisture sensor, or unbind it when source is empty.
+
+        async_update_listener() must be called to listen to new sensors.
+        """
+        binding = (source, threshold) if source else None
+        previous = self._plant_sources.get(plant_id)
+        if previous == binding:
+            return
+
+        if previous is not None:
+            self._unbind(plant_id, previous[0])
+        if binding is None:
+            return
+
+        self._plant_sources[plant_id] = binding
+        plants = self._bindings.get(source)
+        if plants is None:
+            plants = self._bindings[source] = {}
+            self._sources_changed = True
+        plants[plant_id] = threshold
+
+    def unbind(self, plant_id: str) -> None:
+        """Unbind a plant from its moisture sensor."""
+        self.bind(plant_id, "", 0)
+
+    @callback
+    def async_update_listener(self) -> None:
+        """Listen to the bound sensors if they changed since the last call."""
+        if not self._sources_changed:
+            return
+        self._sources_changed = False
+
+        if self._listener:
+            self._listener()
+            self._listener = None
+        if self._bindings:
+            self._listener = async_track_state_change_event(
+                self.hass, self.sources, self._async_handle_state_change
+            )
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop listening to the sensors and forget every binding."""
+        if self._listener:
+            self._listener()
+            self._listener = None
+        if self._flush_listener:
+            self._flush_listener()
+            self._flush_listener = None
+        self._bindings.clear()
+        self._plant_sources.clear()
+        self._armed.clear()
+        self._readings.clear()
+        self._sources_changed = False
+
+    @callback
+    def _async_handle_state_change(self, event: Event) -> None:
+        """Keep the last reading of a sensor until the readings are evaluated."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return
+        try:
+            value = float(new_state.state)
+        except ValueError:
+            _LOGGER.debug("Ignoring moisture reading %s", new_state.state)
+            return
+
+        self._readings[event.data["entity_id"]] = value
+        if self._flush_listener is None:
+            self._flush_listener = async_call_later(
+                self.hass, MOISTURE_DEBOUNCE_DELAY, self._async_evaluate_readings
+            )
+
+    async def _async_evaluate_readings(self, _now: Any) -> None:
+        """Evaluate the last reading of every sensor that changed."""
+        self._flush_listener = None
+        readings = self._readings
+        self._readings = {}
+
+        watered = []
+        for source, value in readings.items():
+            for plant_id, threshold in self._bindings.get(source, {}).items():
+                if self.detect_watering(plant_id, value, threshold):
+                    watered.append(plant_id)
+
+        if watered:
+            await self._on_watered(watered)
+
+    def detect_watering(self, plant_id: str, value: float, threshold: int) -> bool:
+        """Return True when a reading is a watering of a plant.
+
+        The first reading only arms the plant, so a sensor already above the
+        threshold when it is bound is not taken for a watering.
+        """
+        armed = self._armed.get(plant_id)
+        if armed is None:
+            self._armed[plant_id] = value < threshold
+            return False
+        if armed and value >= threshold:
+            self._armed[plant_id] = False
+            return True
+        if not armed and value < threshold - MOISTURE_HYSTERESIS:
+            self._armed[plant_id] = True
+        return False
+
+    def _unbind(self, plant_id: str, source: str) -> None:
+        """Remove the binding of a plant to a sensor."""
+        del self._plant_sources[plant_id]
+        self._armed.pop(plant_id, None)
+        plants = self._bindings[source]
+        del plants[plant_id]
+        if not plants:
+            del self._bindings[source]
+            self._sources_changed = True
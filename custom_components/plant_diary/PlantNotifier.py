@@ -0,0 +1,160 @@
+"""Watering reminders of the Plant Diary component."""
+
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
+from homeassistant.util.dt import now
+
+from .const import NOTIFY_DIGEST_DELAY
+from .PlantSummary import STATE_DUE, STATE_OVERDUE
+
+_LOGGER = logging.getLogger(__name__)
+
+# The states a plant is reminded of when it enters them
+NOTIFY_STATES = (STATE_OVERDUE, STATE_DUE)
+
+NOTIFY_TITLE = "Plant Diary"
+
+
+def quiet_hours_end(
+    moment: datetime, start: time | None, end: time | None
+) -> datetime | None:
+    """Return the end of the quiet hours around a moment, or None outside them.
+
+    The quiet hours may span midnight, such as from 22:00 to 07:00.
+    """
+    if start is None or end is None or start == end:
+        return None
+
+    current = moment.time()
+    if start < end:
+        quiet = start <= current < end
+    else:
+        quiet = current >= start or current < end
+    if not quiet:
+        return None
+
+    end_moment = moment.replace(
+        hour=end.hour, minute=end.minute, second=end.second, microsecond=0
+    )
+    if end_moment <= moment:
+        end_moment += timedelta(days=1)
+    return end_moment
+
+
+def digest_message(overdue: list[str], due: list[str]) -> str:
+    """Return the message listing the overdue and the due plants."""
+    count = len(overdue) + len(due)
+    lines = [
+        f"{count} plant needs watering"
+        if count == 1
+        else f"{count} plants need watering"
+    ]
+    if overdue:
+        lines.append(f"Overdue: {', '.join(overdue)}")
+    if due:
+        lines.append(f"Due: {', '.join(due)}")
+    return "\n".join(lines)
+
+
+class PlantNotifier:
+    """Reminders of the plants that became due or overdue.
+
+    The plants entering a reminded state are collected and sent in one digest
+    through a notify service, NOTIFY_DIGEST_DELAY seconds after the first one or
+    at the end of the quiet hours. The state of each plant is read again when the
+    digest is sent, so plants watered or snoozed meanwhile are left out. Nothing
+    runs while no plant changes its state.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        plant_status: Callable[[str], tuple[str, int] | None],
+    ) -> None:
+        """Initialize the notifier with a lookup of the name and state of a plant."""
+        self.hass = hass
+        self.service: str | None = None
+        self.quiet_start: time | None = None
+        self.quiet_end: time | None = None
+        self._plant_status = plant_status
+        self._pending: dict[str, None] = {}
+        self._listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, plant_id: str) -> None:
+        """Add a plant that became due or overdue to the next digest."""
+        if not self.service:
+            return
+
+        self._pending[plant_id] = None
+        if self._listener is not None:
+            return
+
+        end = quiet_hours_end(now(), self.quiet_start, self.quiet_end)
+        if end is None:
+            self._listener = async_call_later(
+                self.hass, NOTIFY_DIGEST_DELAY, self._async_send_later
+            )
+        else:
+            self._listener = async_track_point_in_time(
+                self.hass, self._async_send_later, end
+            )
+
+    @callback
+    def async_discard(self, plant_id: str) -> None:
+        """Leave a plant out of the next digest."""
+        self._pending.pop(plant_id, None)
+
+    async def async_send(self) -> None:
+        """Send the digest of the plants still due or overdue."""
+        if self._listener:
+            self._listener()
+            self._listener = None
+
+        pending = self._pending
+        self._pending = {}
+        overdue = []
+        due = []
+        for plant_id in pending:
+            status = self._plant_status(plant_id)
+            if status is None:
+                continue
+            name, state = status
+            if state == STATE_OVERDUE:
+                overdue.append(name)
+            elif state == STATE_DUE:
+                due.append(name)
+
+        if not (overdue or due) or not self.service:
+            return
+
+        # The service may be given with or without its notify domain
+        domain, _, service = self.service.rpartition(".")
+        try:
+            await self.hass.services.async_call(
+                domain or "notify",
+                service,
+                {"title": NOTIFY_TITLE, "message": digest_message(overdue, due)},
+                blocking=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Cannot send the watering reminder: %s", err)
+
+    @callback
+    def async_unload(self) -> None:
+        """Cancel the pending digest."""
+        if self._listener:
+            self._listener()
+            self._listener = None
+        self._pending.clear()
+
+    async def _async_send_later(self, _now: Any) -> None:
+        """Send the digest once the delay or the quiet hours have passed."""
+        self._listener = None
+        await self.async_send()
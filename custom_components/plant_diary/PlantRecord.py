@@ -0,0 +1,202 @@
+"""Plant record of the Plant Diary component."""
+
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .PlantIntervalStats import ADAPTIVE_MIN_SAMPLES, PlantIntervalStats
+
+DEFAULT_WATERING_INTERVAL = 14
+DEFAULT_MOISTURE_THRESHOLD = 40
+
+DATE_FIELDS = ("last_watered", "last_fertilized")
+
+# Values standing for a missing date, "Unknown" being the stored form
+NO_DATE_VALUES = frozenset(("", "Unknown", "unknown", "None"))
+
+# Distinct date strings kept parsed, enough for the dates of a large diary
+DATE_CACHE_SIZE = 4096
+
+
+class InvalidDateError(ValueError):
+    """Raised when a value cannot be parsed as a date."""
+
+
+def parse_date(value: Any) -> date | None:
+    """Parse a date from a date, a datetime, an epoch timestamp or an ISO string.
+
+    Datetimes with a timezone are converted to the local timezone first. None and
+    the values of NO_DATE_VALUES mean no date. Anything else raises
+    InvalidDateError.
+    """
+    # Validated service data already holds dates
+    if value.__class__ is date or value is None:
+        return value
+    if isinstance(value, str):
+        if value in NO_DATE_VALUES:
+            return None
+        value = _parse_date_string(value)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            value = dt_util.utc_from_timestamp(value)
+        except (OverflowError, OSError, ValueError) as err:
+            raise InvalidDateError(f"Invalid timestamp: {value}") from err
+
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = dt_util.as_local(value)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    raise InvalidDateError(f"Invalid date: {value!r}")
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_string(value: str) -> date | datetime:
+    """Parse an ISO date or datetime string.
+
+    Datetimes are returned as such, since their local date depends on the
+    timezone at the time of the call.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        raise InvalidDateError(f"Invalid date: {value!r}")
+    return parsed
+
+
+def parse_int(value: Any, default: int = 0) -> int:
+    """Parse an integer from various formats."""
+    if value.__class__ is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class PlantRecord:
+    """Immutable data of a plant.
+
+    Records are replaced rather than modified, so the serialised attributes can be
+    built once and reused for every state write and save.
+    """
+
+    plant_id: str
+    plant_name: str
+    last_watered: date | None = None
+    last_fertilized: date | None = None
+    watering_interval: int = DEFAULT_WATERING_INTERVAL
+    watering_postponed: int = 0
+    inside: bool = True
+    image: str = ""
+    adaptive_interval: bool = False
+    interval_stats: PlantIntervalStats = PlantIntervalStats()
+    moisture_sensor: str = ""
+    moisture_threshold: int = DEFAULT_MOISTURE_THRESHOLD
+    _attributes: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_dict(cls, plant_id: str, data: dict[str, Any]) -> "PlantRecord":
+        """Create a record from a dictionary."""
+        return cls(plant_id, data.get("plant_name", plant_id)).updated(data)
+
+    def updated(self, data: dict[str, Any]) -> "PlantRecord":
+        """Return a copy of the record with the fields present in data replaced."""
+        changes: dict[str, Any] = {}
+        if "interval_stats" in data:
+            changes["interval_stats"] = PlantIntervalStats.from_list(
+                data["interval_stats"]
+            )
+        if "last_watered" in data:
+            last_watered = parse_date(data["last_watered"])
+            changes["last_watered"] = last_watered
+            # Learn the watering interval from the gap to the previous watering
+            previous = self.last_watered
+            if last_watered and previous and last_watered > previous:
+                changes["interval_stats"] = changes.get(
+                    "interval_stats", self.interval_stats
+                ).add((last_watered - previous).days)
+        if "last_fertilized" in data:
+            changes["last_fertilized"] = parse_date(data["last_fertilized"])
+        if "watering_interval" in data:
+            changes["watering_interval"] = parse_int(data["watering_interval"])
+        if "watering_postponed" in data:
+            changes["watering_postponed"] = parse_int(data["watering_postponed"])
+        if "inside" in data:
+            changes["inside"] = bool(data["inside"])
+        if "plant_name" in data:
+            changes["plant_name"] = data["plant_name"]
+        if "image" in data:
+            changes["image"] = data["image"]
+        if "adaptive_interval" in data:
+            changes["adaptive_interval"] = bool(data["adaptive_interval"])
+        if "moisture_sensor" in data:
+            changes["moisture_sensor"] = data["moisture_sensor"] or ""
+        if "moisture_threshold" in data:
+            changes["moisture_threshold"] = parse_int(
+                data["moisture_threshold"], DEFAULT_MOISTURE_THRESHOLD
+            )
+
+        if not changes:
+            return self
+        record = replace(self, **changes)
+        return self if record == self else record
+
+    @property
+    def effective_interval(self) -> int:
+        """Return the watering interval used to compute the state of the plant.
+
+        In adaptive mode the interval learned from the watering history replaces
+        the configured one once enough waterings have been seen.
+        """
+        stats = self.interval_stats
+        if self.adaptive_interval and stats.count >= ADAPTIVE_MIN_SAMPLES:
+            return max(1, round(stats.mean))
+        return self.watering_interval
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the serialised attributes of the plant.
+
+        The dictionary is shared and must not be modified.
+        """
+        if self._attributes is None:
+            object.__setattr__(
+                self,
+                "_attributes",
+                {
+                    "plant_name": self.plant_name,
+                    "last_watered": self.last_watered.isoformat()
+                    if self.last_watered
+                    else "Unknown",
+                    "last_fertilized": self.last_fertilized.isoformat()
+                    if self.last_fertilized
+                    else "Unknown",
+                    "watering_interval": self.watering_interval,
+                    "watering_postponed": self.watering_postponed,
+                    "inside": self.inside,
+                    "image": self.image,
+                    "adaptive_interval": self.adaptive_interval,
+                    "predicted_interval": self.interval_stats.predicted_interval,
+                    "confidence": self.interval_stats.confidence,
+                    "moisture_sensor": self.moisture_sensor,
+                    "moisture_threshold": self.moisture_threshold,
+                },
+            )
+        return self._attributes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the data of the plant in its stored form."""
+        if self.interval_stats.count == 0:
+            return self.attributes
+        return {**self.attributes, "interval_stats": self.interval_stats.as_list()}
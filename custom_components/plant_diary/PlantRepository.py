@@ -0,0 +1,181 @@
+"""Persistent storage for the plants of the Plant Diary component."""
+
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    STORAGE_KEY,
+    STORAGE_MINOR_VERSION,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .PlantMetrics import COUNTER_STORAGE_WRITES, PlantMetrics
+from .PlantRecord import DATE_FIELDS, InvalidDateError, PlantRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantStore(Store[dict[str, Any]]):
+    """Store for the plant data with schema migrations."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate the stored data to the current schema version."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+        return old_data
+
+
+class PlantRepository:
+    """Repository holding the plants of a config entry.
+
+    Plants are kept in memory as PlantRecord instances and written to a dedicated
+    storage file with a delayed save, so several changes in a short time result in
+    a single write.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        metrics: PlantMetrics | None = None,
+        shard: str | None = None,
+    ) -> None:
+        """Initialize the repository for a config entry.
+
+        The plants of a shard are kept in their own storage file.
+        """
+        self.hass = hass
+        self.entry = config_entry
+        self.metrics = metrics or PlantMetrics()
+        self._store = PlantStore(
+            hass,
+            STORAGE_VERSION,
+            f"{STORAGE_KEY}.{shard}" if shard else STORAGE_KEY,
+            minor_version=STORAGE_MINOR_VERSION,
+        )
+        self._plants: dict[str, PlantRecord] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def plants(self) -> dict[str, PlantRecord]:
+        """Return the stored plants keyed by plant ID."""
+        return self._plants
+
+    async def async_load(self) -> dict[str, PlantRecord]:
+        """Load the plants from storage, migrating them from the config entry once."""
+        if self._loaded:
+            return self._plants
+
+        data = await self._store.async_load()
+        if data is None:
+            await self._async_migrate_from_config_entry()
+        else:
+            self._plants = self._records_from_dict(data.get("plants", {}))
+
+        self._loaded = True
+        return self._plants
+
+    async def async_reload(self) -> dict[str, PlantRecord]:
+        """Write the pending changes and read the plants from storage again."""
+        await self.async_flush()
+        self._loaded = False
+        return await self.async_load()
+
+    async def _async_migrate_from_config_entry(self) -> None:
+        """Move the plants stored in the config entry data to the repository."""
+        raw_plants = self.entry.data.get("plants", {})
+        if isinstance(raw_plants, dict):
+            self._plants = self._records_from_dict(raw_plants)
+
+        await self._store.async_save(self._data_to_save())
+
+        if "plants" in self.entry.data:
+            _LOGGER.debug(
+                "Migrated %s plants from the config entry to storage",
+                len(self._plants),
+            )
+            data = {
+                key: value for key, value in self.entry.data.items() if key != "plants"
+            }
+            self.hass.config_entries.async_update_entry(self.entry, data=data)
+
+    def get(self, plant_id: str) -> PlantRecord | None:
+        """Return the stored record of a plant."""
+        return self._plants.get(plant_id)
+
+    def async_set(self, plant_id: str, record: PlantRecord | None) -> None:
+        """Store a plant. When record is None, the plant is removed."""
+        self.async_set_many({plant_id: record})
+
+    def async_set_many(self, changes: dict[str, PlantRecord | None]) -> None:
+        """Store several plants and schedule a single save.
+
+        Each value replaces the stored record; a value of None removes the plant.
+        Records identical to the stored ones do not trigger a save.
+        """
+        changed = False
+        for plant_id, record in changes.items():
+            if record is None:
+                changed |= self._plants.pop(plant_id, None) is not None
+            elif self._plants.get(plant_id) != record:
+                self._plants[plant_id] = record
+                changed = True
+
+        if not changed:
+            return
+
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write pending changes to storage immediately."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the storage file of the plants."""
+        self._plants = {}
+        self._dirty = False
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        self._dirty = False
+        self.metrics.count(COUNTER_STORAGE_WRITES)
+        return {
+            "plants": {
+                plant_id: record.to_dict() for plant_id, record in self._plants.items()
+            }
+        }
+
+    @staticmethod
+    def _records_from_dict(plants: dict[str, Any]) -> dict[str, PlantRecord]:
+        """Create the plant records from their stored data.
+
+        A plant with an invalid date is restored without its dates rather than lost.
+        """
+        records = {}
+        for plant_id, plant_data in plants.items():
+            try:
+                records[plant_id] = PlantRecord.from_dict(plant_id, plant_data)
+            except InvalidDateError as err:
+                _LOGGER.error("Ignoring the dates of plant %s: %s", plant_id, err)
+                records[plant_id] = PlantRecord.from_dict(
+                    plant_id,
+                    {
+                        key: value
+                        for key, value in plant_data.items()
+                        if key not in DATE_FIELDS
+                    },
+                )
+        return records
@@ -0,0 +1,70 @@
+"""Scheduler of the plant state transitions for the Plant Diary component."""
+
+import heapq
+from datetime import date
+
+
+class PlantScheduler:
+    """Min-heap of plants keyed by the date of their next state transition.
+
+    Rescheduling or removing a plant leaves its old heap item behind; stale items
+    are skipped when popped and dropped when the heap is compacted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler."""
+        self._heap: list[tuple[int, str]] = []
+        self._scheduled: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of scheduled plants."""
+        return len(self._scheduled)
+
+    def schedule(self, plant_id: str, when: date | None) -> None:
+        """Schedule the next transition of a plant. None unschedules the plant."""
+        if when is None:
+            self.unschedule(plant_id)
+            return
+
+        ordinal = when.toordinal()
+        if self._scheduled.get(plant_id) == ordinal:
+            return
+
+        self._scheduled[plant_id] = ordinal
+        heapq.heappush(self._heap, (ordinal, plant_id))
+
+        if len(self._heap) > 2 * len(self._scheduled) + 64:
+            self._compact()
+
+    def unschedule(self, plant_id: str) -> None:
+        """Remove a plant from the scheduler."""
+        self._scheduled.pop(plant_id, None)
+
+    def clear(self) -> None:
+        """Remove all plants from the scheduler."""
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def next_date(self) -> date | None:
+        """Return the date of the earliest scheduled transition."""
+        heap = self._heap
+        while heap and self._scheduled.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return date.fromordinal(heap[0][0]) if heap else None
+
+    def pop_due(self, today: date) -> list[str]:
+        """Remove and return the plants with a transition on or before today."""
+        due = []
+        limit = today.toordinal()
+        heap = self._heap
+        while heap and heap[0][0] <= limit:
+            ordinal, plant_id = heapq.heappop(heap)
+            if self._scheduled.get(plant_id) == ordinal:
+                del self._scheduled[plant_id]
+                due.append(plant_id)
+        return due
+
+    def _compact(self) -> None:
+        """Rebuild the heap without stale items."""
+        self._heap = [(ordinal, plant_id) for plant_id, ordinal in self._scheduled.items()]
+        heapq.heapify(self._heap)
@@ -0,0 +1,130 @@
+"""Service schemas of the Plant Diary component.
+
+The schemas are built once at import and registered with the services, so the
+data reaching the manager is already validated and converted: dates are date
+objects, numbers are integers and flags are booleans.
+"""
+
+from datetime import date
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import CONF_GARDEN
+from .PlantHistory import EVENT_TYPES
+from .PlantRecord import InvalidDateError, parse_date
+
+# Watering states, from overdue (0) to watered today (3)
+WATERING_STATES = (0, 1, 2, 3)
+
+
+def valid_date(value: Any) -> date | None:
+    """Validate a date, a datetime, an epoch timestamp or an ISO string."""
+    try:
+        return parse_date(value)
+    except InvalidDateError as err:
+        raise vol.Invalid(str(err)) from err
+
+
+def _int_range(minimum: int, maximum: int | None = None) -> vol.All:
+    """Return a validator of an integer within a range."""
+    return vol.All(vol.Coerce(int), vol.Range(min=minimum, max=maximum))
+
+
+# Every service may name the garden it applies to
+GARDEN_FIELD = {vol.Optional(CONF_GARDEN): cv.string}
+
+PLANT_FIELDS = {
+    vol.Optional("plant_name"): cv.string,
+    vol.Optional("last_watered"): valid_date,
+    vol.Optional("last_fertilized"): valid_date,
+    vol.Optional("watering_interval"): _int_range(1),
+    vol.Optional("watering_postponed"): _int_range(0),
+    vol.Optional("inside"): cv.boolean,
+    vol.Optional("image"): cv.string,
+    vol.Optional("adaptive_interval"): cv.boolean,
+    # An empty sensor unbinds the plant
+    vol.Optional("moisture_sensor"): vol.Any(None, "", cv.entity_id),
+    vol.Optional("moisture_threshold"): _int_range(0, 100),
+}
+
+# A dict keeps its first key, so Required must come before the optional plant_name
+CREATE_PLANT_SCHEMA = vol.Schema(
+    {vol.Required("plant_name"): cv.string, **PLANT_FIELDS, **GARDEN_FIELD}
+)
+
+UPDATE_PLANT_SCHEMA = vol.Schema(
+    {vol.Required("plant_id"): cv.string, **PLANT_FIELDS, **GARDEN_FIELD}
+)
+
+DELETE_PLANT_SCHEMA = vol.Schema({vol.Required("plant_id"): cv.string, **GARDEN_FIELD})
+
+# Items of a bulk upsert, matched by plant_id or by plant_name
+BULK_PLANT_SCHEMA = vol.All(
+    vol.Schema({vol.Optional("plant_id"): cv.string, **PLANT_FIELDS}),
+    cv.has_at_least_one_key("plant_id", "plant_name"),
+)
+
+BULK_UPSERT_SCHEMA = vol.Schema(
+    {
+        vol.Required("plants"): vol.All(cv.ensure_list, [BULK_PLANT_SCHEMA]),
+        **GARDEN_FIELD,
+    }
+)
+
+BULK_DELETE_SCHEMA = vol.Schema(
+    {vol.Required("plant_ids"): vol.All(cv.ensure_list, [cv.string]), **GARDEN_FIELD}
+)
+
+SNOOZE_PLANT_SCHEMA = vol.Schema(
+    {
+        vol.Required("plant_id"): cv.string,
+        vol.Optional("days", default=1): _int_range(1),
+        **GARDEN_FIELD,
+    }
+)
+
+ADD_EVENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("plant_id"): cv.string,
+        vol.Required("event"): vol.In(EVENT_TYPES),
+        vol.Optional("date"): valid_date,
+        **GARDEN_FIELD,
+    }
+)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("plant_id"): cv.string,
+        vol.Optional("last"): _int_range(1),
+        vol.Optional("start"): valid_date,
+        vol.Optional("end"): valid_date,
+        **GARDEN_FIELD,
+    }
+)
+
+GET_TREND_SCHEMA = vol.Schema(
+    {
+        vol.Required("plant_id"): cv.string,
+        vol.Optional("start"): valid_date,
+        vol.Optional("end"): valid_date,
+        **GARDEN_FIELD,
+    }
+)
+
+QUERY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("due_within"): _int_range(0),
+        vol.Optional("state"): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.In(WATERING_STATES))]
+        ),
+        vol.Optional("inside"): cv.boolean,
+        vol.Optional("name_prefix"): cv.string,
+        vol.Optional("limit"): _int_range(1),
+        **GARDEN_FIELD,
+    }
+)
+
+UPDATE_DAYS_SINCE_WATERED_SCHEMA = vol.Schema(GARDEN_FIELD)
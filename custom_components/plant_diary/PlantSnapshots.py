@@ -0,0 +1,229 @@
+"""Daily state snapshots of the Plant Diary component."""
+
+from datetime import date
+from itertools import accumulate
+import json
+import logging
+import os
+import tempfile
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import SNAPSHOT_DIRECTORY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns of a plant: date ordinals, states and days since watered
+Columns = tuple[list[int], list[int], list[int]]
+
+
+def delta_encode(values: list[int]) -> list[int]:
+    """Return the first value followed by the differences between values."""
+    return [current - previous for previous, current in zip([0, *values], values)]
+
+
+def delta_decode(deltas: list[int]) -> list[int]:
+    """Return the values of a delta encoded list."""
+    return list(accumulate(deltas))
+
+
+def encode_columns(columns: Columns) -> dict[str, Any]:
+    """Encode the snapshot columns of a plant.
+
+    Dates and days since watered usually grow by one a day, so their deltas are
+    mostly ones. States are single digits stored as a string.
+    """
+    dates, states, days = columns
+    return {
+        "d": delta_encode(dates),
+        "s": "".join(map(str, states)),
+        "w": delta_encode(days),
+    }
+
+
+def decode_columns(data: dict[str, Any]) -> Columns:
+    """Decode the snapshot columns of a plant."""
+    return (
+        delta_decode(data["d"]),
+        [int(state) for state in data["s"]],
+        delta_decode(data["w"]),
+    )
+
+
+def segment_name(day: date) -> str:
+    """Return the name of the monthly segment holding the snapshots of a day."""
+    return f"{day:%Y-%m}.json"
+
+
+def _snapshots(columns: Columns, start: date, end: date) -> list[dict[str, Any]]:
+    """Return the snapshots of the columns of a plant between two dates."""
+    start_ordinal = start.toordinal()
+    end_ordinal = end.toordinal()
+    return [
+        {
+            "date": date.fromordinal(ordinal).isoformat(),
+            "state": state,
+            "days_since_watered": days,
+            "overdue": state == 0,
+        }
+        for ordinal, state, days in zip(*columns)
+        if start_ordinal <= ordinal <= end_ordinal
+    ]
+
+
+class PlantSnapshots:
+    """Daily snapshots of the state of every plant.
+
+    The snapshots of a month are kept in one segment file storing, for each
+    plant, its dates, states and days since watered as separate delta encoded
+    columns. The segment of the current month is kept in memory and written
+    once a day.
+    """
+
+    def __init__(self, hass: HomeAssistant, shard: str | None = None) -> None:
+        """Initialize the snapshots, kept in a subdirectory when a shard is given."""
+        self.hass = hass
+        self.shard = shard
+        self._segment: str | None = None
+        self._columns: dict[str, Columns] = {}
+
+    @property
+    def directory(self) -> str:
+        """Return the directory of the segment files."""
+        directory = self.hass.config.path(".storage", SNAPSHOT_DIRECTORY)
+        return os.path.join(directory, self.shard) if self.shard else directory
+
+    async def async_record(
+        self, day: date, status: dict[str, tuple[int, int]]
+    ) -> None:
+        """Record the days since watered and the state of every plant for a day."""
+        name = segment_name(day)
+        if name != self._segment:
+            self._columns = await self.hass.async_add_executor_job(
+                self._read_segment, name
+            )
+            self._segment = name
+
+        ordinal = day.toordinal()
+        for plant_id, (days, state) in status.items():
+            dates, states, days_column = self._columns.setdefault(
+                plant_id, ([], [], [])
+            )
+            # A second snapshot of the same day replaces the first one
+            if dates and dates[-1] == ordinal:
+                states[-1] = state
+                days_column[-1] = days
+                continue
+            dates.append(ordinal)
+            states.append(state)
+            days_column.append(days)
+
+        data = {
+            plant_id: encode_columns(columns)
+            for plant_id, columns in self._columns.items()
+        }
+        await self.hass.async_add_executor_job(self._write_segment, name, data)
+
+    async def async_get_trend(
+        self, plant_id: str, start: date, end: date
+    ) -> list[dict[str, Any]]:
+        """Return the snapshots of a plant between two dates."""
+        snapshots = await self.hass.async_add_executor_job(
+            self._read_trend, plant_id, start, end, self._segment
+        )
+        # The segment of the current month is read from memory
+        columns = self._columns.get(plant_id)
+        if columns and segment_name(start) <= self._segment <= segment_name(end):
+            snapshots.extend(_snapshots(columns, start, end))
+        return snapshots
+
+    async def async_remove(self, *plant_ids: str) -> None:
+        """Remove the snapshots of some plants from every segment."""
+        for plant_id in plant_ids:
+            self._columns.pop(plant_id, None)
+        await self.hass.async_add_executor_job(self._remove_plants, plant_ids)
+
+    async def async_remove_all(self) -> None:
+        """Remove the snapshots of every plant."""
+        self._segment = None
+        self._columns = {}
+        await self.hass.async_add_executor_job(self._remove_directory)
+
+    def _read_trend(
+        self, plant_id: str, start: date, end: date, skip: str | None
+    ) -> list[dict[str, Any]]:
+        """Read the snapshots of a plant from the segment files of a date range."""
+        snapshots = []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            name = segment_name(date(year, month, 1))
+            if name != skip:
+                columns = self._read_segment(name, plant_id).get(plant_id)
+                if columns:
+                    snapshots.extend(_snapshots(columns, start, end))
+            year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+        return snapshots
+
+    def _read_segment(
+        self, name: str, plant_id: str | None = None
+    ) -> dict[str, Columns]:
+        """Read the columns of a segment, or only those of one plant."""
+        try:
+            with open(os.path.join(self.directory, name), encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            _LOGGER.warning("Ignoring the corrupted snapshot segment %s", name)
+            return {}
+
+        if plant_id is not None:
+            data = {plant_id: data[plant_id]} if plant_id in data else {}
+        return {key: decode_columns(value) for key, value in data.items()}
+
+    def _remove_directory(self) -> None:
+        """Remove the segment files, keeping the shards of the other gardens."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                os.remove(path)
+        if self.shard:
+            os.rmdir(self.directory)
+
+    def _remove_plants(self, plant_ids: tuple[str, ...]) -> None:
+        """Rewrite the segments holding the columns of some plants without them."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(
+                    os.path.join(self.directory, name), encoding="utf-8"
+                ) as file:
+                    data = json.load(file)
+            except ValueError:
+                continue
+            if any(plant_id in data for plant_id in plant_ids):
+                for plant_id in plant_ids:
+                    data.pop(plant_id, None)
+                self._write_segment(name, data)
+
+    def _write_segment(self, name: str, data: dict[str, Any]) -> None:
+        """Write a segment, replacing it atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        # A temporary file of its own, so concurrent writes of a segment do not
+        # replace it with one another's partial file
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(file.name, os.path.join(self.directory, name))
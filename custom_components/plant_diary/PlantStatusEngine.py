@@ -0,0 +1,169 @@
+"""Watering status engine of the Plant Diary component."""
+
+from array import array
+from datetime import date
+
+from .PlantRecord import PlantRecord
+from .PlantWeather import WeatherConditions, watering_basis
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+NO_DATE = 0
+
+
+def watering_state(days_since_watered: int, interval: int, postponed: int) -> int:
+    """Return the watering state of a plant watered days_since_watered days ago."""
+    if days_since_watered == 0:
+        return 3
+    if days_since_watered < interval:
+        return 2
+    if days_since_watered < interval + postponed:
+        return 1
+    return 0
+
+
+class PlantStatusEngine:
+    """Watering status of all plants kept in parallel arrays.
+
+    Each plant is a row holding its last watered date as an ordinal, its watering
+    interval and postponement, and the last computed days since watered and state.
+    compute() updates every row in a single pass, using NumPy when it is installed
+    and a pure Python loop otherwise.
+    """
+
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        """Initialize an empty engine."""
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self._rows: dict[str, int] = {}
+        self._plant_ids: list[str] = []
+        self._last_watered = array("q")
+        self._interval = array("q")
+        self._postponed = array("q")
+        self._days = array("q")
+        self._states = array("q")
+
+    def __len__(self) -> int:
+        """Return the number of plants."""
+        return len(self._plant_ids)
+
+    def set(
+        self,
+        plant_id: str,
+        record: PlantRecord,
+        weather: WeatherConditions | None = None,
+    ) -> None:
+        """Add or update the row of a plant."""
+        last_watered_date, interval = watering_basis(record, weather)
+        last_watered = last_watered_date.toordinal() if last_watered_date else NO_DATE
+        row = self._rows.get(plant_id)
+        if row is None:
+            self._rows[plant_id] = len(self._plant_ids)
+            self._plant_ids.append(plant_id)
+            self._last_watered.append(last_watered)
+            self._interval.append(interval)
+            self._postponed.append(record.watering_postponed)
+            self._days.append(0)
+            self._states.append(0)
+        else:
+            self._last_watered[row] = last_watered
+            self._interval[row] = interval
+            self._postponed[row] = record.watering_postponed
+
+    def remove(self, plant_id: str) -> None:
+        """Remove the row of a plant, moving the last row into its place."""
+        row = self._rows.pop(plant_id, None)
+        if row is None:
+            return
+
+        last = len(self._plant_ids) - 1
+        if row != last:
+            moved_id = self._plant_ids[last]
+            self._plant_ids[row] = moved_id
+            self._rows[moved_id] = row
+            for column in self._columns():
+                column[row] = column[last]
+
+        self._plant_ids.pop()
+        for column in self._columns():
+            column.pop()
+
+    def clear(self) -> None:
+        """Remove all plants."""
+        self._rows.clear()
+        self._plant_ids.clear()
+        for column in self._columns():
+            del column[:]
+
+    def status(self, plant_id: str) -> tuple[int, int]:
+        """Return the last computed days since watered and state of a plant."""
+        row = self._rows[plant_id]
+        return self._days[row], self._states[row]
+
+    def compute(self, today: date) -> list[str]:
+        """Compute the status of every plant for today.
+
+        Returns the IDs of the plants whose days since watered or state changed.
+        """
+        if not self._plant_ids:
+            return []
+        if self.use_numpy:
+            changed_rows = self._compute_numpy(today.toordinal())
+        else:
+            changed_rows = self._compute_python(today.toordinal())
+        plant_ids = self._plant_ids
+        return [plant_ids[row] for row in changed_rows]
+
+    def _compute_python(self, today: int) -> list[int]:
+        """Compute the status of every plant with a Python loop."""
+        changed_rows = []
+        days_column = self._days
+        states_column = self._states
+        for row, (last_watered, interval, postponed) in enumerate(
+            zip(self._last_watered, self._interval, self._postponed)
+        ):
+            if last_watered == NO_DATE:
+                days, state = 0, 0
+            else:
+                days = today - last_watered
+                state = watering_state(days, interval, postponed)
+
+            if days != days_column[row] or state != states_column[row]:
+                days_column[row] = days
+                states_column[row] = state
+                changed_rows.append(row)
+        return changed_rows
+
+    def _compute_numpy(self, today: int) -> list[int]:
+        """Compute the status of every plant with NumPy array operations."""
+        last_watered = np.frombuffer(self._last_watered, dtype=np.int64)
+        interval = np.frombuffer(self._interval, dtype=np.int64)
+        postponed = np.frombuffer(self._postponed, dtype=np.int64)
+        days_column = np.frombuffer(self._days, dtype=np.int64)
+        states_column = np.frombuffer(self._states, dtype=np.int64)
+
+        unknown = last_watered == NO_DATE
+        days = np.where(unknown, 0, today - last_watered)
+        states = np.select(
+            [unknown, days == 0, days < interval, days < interval + postponed],
+            [0, 3, 2, 1],
+            default=0,
+        )
+
+        changed = (days != days_column) | (states != states_column)
+        # The columns share memory with the arrays, so this writes them back
+        days_column[changed] = days[changed]
+        states_column[changed] = states[changed]
+        return np.flatnonzero(changed).tolist()
+
+    def _columns(self) -> tuple[array, ...]:
+        """Return the per-plant arrays."""
+        return (
+            self._last_watered,
+            self._interval,
+            self._postponed,
+            self._days,
+            self._states,
+        )
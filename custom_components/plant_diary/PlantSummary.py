@@ -0,0 +1,74 @@
+"""Aggregate watering counters of the Plant Diary component."""
+
+from collections import Counter
+
+STATE_OVERDUE = 0
+STATE_DUE = 1
+
+SUMMARY_DUE_TODAY = "due_today"
+SUMMARY_OVERDUE = "overdue"
+SUMMARY_TYPES = (SUMMARY_DUE_TODAY, SUMMARY_OVERDUE)
+
+# The watering states counted by each summary
+_SUMMARY_STATES = {
+    SUMMARY_DUE_TODAY: (STATE_OVERDUE, STATE_DUE),
+    SUMMARY_OVERDUE: (STATE_OVERDUE,),
+}
+
+
+class PlantSummary:
+    """Number of plants in each watering state, split by location.
+
+    The contribution of every plant is remembered, so a plant changing its state
+    or location moves it between two counters without looking at other plants.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._plants: dict[str, tuple[int, bool]] = {}
+        self._counts: Counter[tuple[int, bool]] = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of plants."""
+        return len(self._plants)
+
+    def set(self, plant_id: str, state: int, inside: bool) -> bool:
+        """Set the state and location of a plant.
+
+        Returns True when the counters changed.
+        """
+        key = (state, inside)
+        previous = self._plants.get(plant_id)
+        if previous == key:
+            return False
+
+        if previous is not None:
+            self._counts[previous] -= 1
+        self._plants[plant_id] = key
+        self._counts[key] += 1
+        return True
+
+    def remove(self, plant_id: str) -> bool:
+        """Remove a plant from the counters.
+
+        Returns True when the counters changed.
+        """
+        previous = self._plants.pop(plant_id, None)
+        if previous is None:
+            return False
+        self._counts[previous] -= 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all plants."""
+        self._plants.clear()
+        self._counts.clear()
+
+    def count(self, summary: str, inside: bool | None = None) -> int:
+        """Return the number of plants of a summary, optionally for one location."""
+        locations = (True, False) if inside is None else (inside,)
+        return sum(
+            self._counts[(state, location)]
+            for state in _SUMMARY_STATES[summary]
+            for location in locations
+        )
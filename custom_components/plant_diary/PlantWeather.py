@@ -0,0 +1,149 @@
+"""Weather adjustment of the Plant Diary component."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.dt import as_local, now, parse_datetime
+
+from .const import (
+    HEATWAVE_INTERVAL_FACTOR,
+    HEATWAVE_TEMPERATURE,
+    RAIN_WATERING_THRESHOLD,
+    WEATHER_CACHE_TTL,
+)
+from .PlantRecord import PlantRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherConditions:
+    """Weather affecting the watering of outside plants."""
+
+    rain_date: date | None = None
+    heatwave: bool = False
+
+
+def watering_basis(
+    record: PlantRecord, weather: WeatherConditions | None = None
+) -> tuple[date | None, int]:
+    """Return the last watered date and the interval used to compute the state.
+
+    For outside plants, enough rain counts as a watering and a heatwave shortens
+    the watering interval.
+    """
+    if weather is None or record.inside:
+        return record.last_watered, record.effective_interval
+
+    last_watered = record.last_watered
+    if weather.rain_date and (last_watered is None or weather.rain_date > last_watered):
+        last_watered = weather.rain_date
+
+    interval = record.effective_interval
+    if weather.heatwave:
+        interval = max(1, round(interval * HEATWAVE_INTERVAL_FACTOR))
+    return last_watered, interval
+
+
+class PlantWeather:
+    """Weather conditions read from a weather entity.
+
+    The state and the daily forecast of the entity are fetched at most once every
+    WEATHER_CACHE_TTL and shared by every outside plant.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str | None = None) -> None:
+        """Initialize the weather provider."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.conditions: WeatherConditions | None = None
+        self._fetched: datetime | None = None
+
+    def set_entity_id(self, entity_id: str | None) -> None:
+        """Follow another weather entity, dropping the conditions of the last one."""
+        if entity_id != self.entity_id:
+            self.entity_id = entity_id
+            self.conditions = None
+            self._fetched = None
+
+    async def async_update(self, force: bool = False) -> WeatherConditions | None:
+        """Return the current conditions, fetching them if the cache expired.
+
+        The periodic refresh forces a fetch, as its timer may fire slightly before
+        the cache expires.
+        """
+        if not self.entity_id:
+            self.conditions = None
+            return None
+
+        current = now()
+        if (
+            not force
+            and self._fetched is not None
+            and current - self._fetched < WEATHER_CACHE_TTL
+        ):
+            return self.conditions
+        self._fetched = current
+
+        today = current.date()
+        temperature, precipitation = await self._async_fetch(today)
+        rain_date = self.conditions.rain_date if self.conditions else None
+        if precipitation is not None and precipitation >= RAIN_WATERING_THRESHOLD:
+            rain_date = today
+
+        self.conditions = WeatherConditions(
+            rain_date=rain_date,
+            heatwave=temperature is not None and temperature >= HEATWAVE_TEMPERATURE,
+        )
+        return self.conditions
+
+    async def _async_fetch(self, today: date) -> tuple[float | None, float | None]:
+        """Return today's temperature in °C and precipitation in mm."""
+        state = self.hass.states.get(self.entity_id)
+        if state is None:
+            _LOGGER.warning("Weather entity %s not found", self.entity_id)
+            return None, None
+
+        attributes = state.attributes
+        temperature = attributes.get("temperature")
+        precipitation = None
+        try:
+            response = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": self.entity_id, "type": "daily"},
+                blocking=True,
+                return_response=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Failed to get the forecast of %s: %s", self.entity_id, err)
+        else:
+            forecast = _forecast_for(response, self.entity_id, today)
+            if forecast:
+                temperature = forecast.get("temperature", temperature)
+                precipitation = forecast.get("precipitation")
+
+        if temperature is not None and attributes.get("temperature_unit") == "°F":
+            temperature = (temperature - 32) * 5 / 9
+        if precipitation is not None and attributes.get("precipitation_unit") == "in":
+            precipitation = precipitation * 25.4
+        return temperature, precipitation
+
+
+def _forecast_for(
+    response: Any, entity_id: str, today: date
+) -> dict[str, Any] | None:
+    """Return the daily forecast of today from a get_forecasts response."""
+    if not isinstance(response, dict):
+        return None
+    for forecast in response.get(entity_id, {}).get("forecast", []):
+        forecast_time = parse_datetime(str(forecast.get("datetime", "")))
+        # The forecasts are usually given in UTC, so compare the local dates
+        if forecast_time and as_local(forecast_time).date() == today:
+            return forecast
+    return None
+
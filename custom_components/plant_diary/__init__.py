@@ -3,18 +3,30 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 from homeassistant.loader import IntegrationNotLoaded
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLANT_DIARY_MANAGER
-from .PlantDiaryManager import PlantDiaryManager
+from .const import DOMAIN
+from .PlantDiaryManager import PlantDiaryManager, entry_shard
+from .PlantHistory import PlantHistory
+from .PlantRepository import PlantRepository
+from .PlantSnapshots import PlantSnapshots
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services shared by every garden."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up the integration from a config entry."""
 
@@ -26,8 +38,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # with the entry ID as the key
     manager = PlantDiaryManager(hass, entry)
     await manager.async_init()
+    manager.async_migrate_unique_ids()
+
+    hass.data[DOMAIN][entry.entry_id] = manager
 
-    hass.data[DOMAIN][PLANT_DIARY_MANAGER] = manager
+    # Reload the entry when its options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Write the pending plant changes when Home Assistant stops
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, manager.async_handle_stop)
+    )
 
     # Set up the sensor platform
     hass.async_create_task(
@@ -46,18 +67,37 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         pass
 
     # Cleanup manager
-    manager: PlantDiaryManager = hass.data[DOMAIN].pop(PLANT_DIARY_MANAGER, None)
+    domain_data = hass.data.get(DOMAIN, {})
+    manager: PlantDiaryManager | None = domain_data.pop(entry.entry_id, None)
+
+    # Remove the domain once empty, before another garden may unload meanwhile
+    if not domain_data:
+        hass.data.pop(DOMAIN, None)
+
     if manager:
         await manager.async_unload()
 
-    # Optionally remove the domain if empty
-    if not hass.data[DOMAIN]:
-        hass.data.pop(DOMAIN)
-
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the plants, the history and the snapshots of a deleted garden."""
+    shard = entry_shard(entry)
+    await PlantRepository(hass, entry, shard=shard).async_remove()
+    await PlantHistory(hass, shard).async_remove_all()
+    await PlantSnapshots(hass, shard).async_remove_all()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
-    """Handle reloads of the config entry."""
+    """Handle reloads of the config entry.
+
+    A loaded manager applies the changes to its running entities, otherwise the
+    entry is set up again.
+    """
+    manager: PlantDiaryManager | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if manager:
+        await manager.async_reload()
+        return
+
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
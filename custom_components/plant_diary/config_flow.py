@@ -1,8 +1,25 @@
 """Config flow for the Plant Diary integration."""
 
+import voluptuous as vol
+
 from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers import selector
+from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .const import (
+    CONF_GARDEN,
+    CONF_LOGBOOK_RATE_LIMIT,
+    CONF_NOTIFY_SERVICE,
+    CONF_PROFILING,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_GARDEN_NAME,
+    DEFAULT_LOGBOOK_RATE_LIMIT,
+    DOMAIN,
+)
 
 
 class PlantDiaryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -13,10 +30,103 @@ class PlantDiaryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return getattr(other_flow, "DOMAIN", None) == DOMAIN
 
     async def async_step_user(self, user_input=None):
-        """Handle the user step in the configuration flow."""
-        existing_entries = self._async_current_entries()
-        if existing_entries:
-            return self.async_abort(reason="single_instance_allowed")
+        """Handle the user step, naming the garden of the new entry."""
+        errors = {}
+        if user_input is not None:
+            name = user_input[CONF_NAME].strip()
+            garden = slugify(name)
+            existing_entries = self._async_current_entries()
+            for entry in existing_entries:
+                if garden in (entry.data.get(CONF_GARDEN), slugify(entry.title)):
+                    return self.async_abort(reason="already_configured")
+
+            if garden:
+                # The first garden keeps the storage and the entity IDs of a
+                # single diary, so only the other gardens record their slug
+                data = {CONF_GARDEN: garden} if existing_entries else {}
+                return self.async_create_entry(title=name, data=data)
+            errors[CONF_NAME] = "invalid_name"
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NAME, default=DEFAULT_GARDEN_NAME
+                    ): selector.TextSelector()
+                }
+            ),
+            errors=errors,
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow of the integration."""
+        return PlantDiaryOptionsFlow(config_entry)
+
+
+class PlantDiaryOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of the Plant Diary integration."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Handle the weather, the reminders, the logbook and the profiling."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
 
-        # No configuration form is needed for this integration
-        return self.async_create_entry(title="Plant Diary", data={})
+        options = self._config_entry.options
+        weather_entity = options.get(CONF_WEATHER_ENTITY)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_WEATHER_ENTITY,
+                        description={"suggested_value": weather_entity},
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="weather")
+                    ),
+                    vol.Optional(
+                        CONF_NOTIFY_SERVICE,
+                        description={
+                            "suggested_value": options.get(CONF_NOTIFY_SERVICE)
+                        },
+                    ): selector.TextSelector(),
+                    vol.Optional(
+                        CONF_QUIET_HOURS_START,
+                        description={
+                            "suggested_value": options.get(CONF_QUIET_HOURS_START)
+                        },
+                    ): selector.TimeSelector(),
+                    vol.Optional(
+                        CONF_QUIET_HOURS_END,
+                        description={
+                            "suggested_value": options.get(CONF_QUIET_HOURS_END)
+                        },
+                    ): selector.TimeSelector(),
+                    vol.Optional(
+                        CONF_LOGBOOK_RATE_LIMIT,
+                        default=options.get(
+                            CONF_LOGBOOK_RATE_LIMIT, DEFAULT_LOGBOOK_RATE_LIMIT
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=1440,
+                            step=1,
+                            unit_of_measurement="min",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_PROFILING, default=options.get(CONF_PROFILING, False)
+                    ): selector.BooleanSelector(),
+                }
+            ),
+        )
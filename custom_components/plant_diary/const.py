@@ -1,4 +1,47 @@
 """Constants for the Plant Diary custom component."""
 
+from datetime import timedelta
+
 DOMAIN = "plant_diary"
-PLANT_DIARY_MANAGER = "plant_diary_manager"
+
+# Entry data holding the name of a garden in its entity IDs, absent for the first
+# garden, and service field selecting a garden
+CONF_GARDEN = "garden"
+DEFAULT_GARDEN_NAME = "Plant Diary"
+
+STORAGE_VERSION = 1
+STORAGE_MINOR_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.plants"
+STORAGE_SAVE_DELAY = 10
+
+HISTORY_DIRECTORY = f"{DOMAIN}_history"
+HISTORY_FLUSH_DELAY = 5
+
+SNAPSHOT_DIRECTORY = f"{DOMAIN}_snapshots"
+# Local time of the daily snapshot, late enough to capture the day's waterings
+SNAPSHOT_HOUR = 23
+SNAPSHOT_MINUTE = 55
+
+UPDATE_COALESCE_DELAY = 2
+
+# Logbook entries are written in batches, and the updates of a plant are logged
+# at most once per rate limit, in minutes
+CONF_LOGBOOK_RATE_LIMIT = "logbook_rate_limit"
+DEFAULT_LOGBOOK_RATE_LIMIT = 5
+LOGBOOK_BATCH_DELAY = 10
+
+# Watering reminders sent through a notify service, outside the quiet hours
+CONF_NOTIFY_SERVICE = "notify_service"
+CONF_QUIET_HOURS_START = "quiet_hours_start"
+CONF_QUIET_HOURS_END = "quiet_hours_end"
+NOTIFY_DIGEST_DELAY = 60
+
+MOISTURE_DEBOUNCE_DELAY = 30
+MOISTURE_HYSTERESIS = 5
+
+CONF_PROFILING = "profiling"
+CONF_WEATHER_ENTITY = "weather_entity"
+WEATHER_CACHE_TTL = timedelta(minutes=30)
+RAIN_WATERING_THRESHOLD = 5
+HEATWAVE_TEMPERATURE = 30
+HEATWAVE_INTERVAL_FACTOR = 0.7
@@ -0,0 +1,29 @@
+"""Diagnostics support for the Plant Diary component."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .PlantDiaryManager import PlantDiaryManager
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the diagnostics of a config entry."""
+    manager: PlantDiaryManager | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if manager is None:
+        return {"options": dict(entry.options), "loaded": False}
+
+    next_transition = manager.scheduler.next_date()
+    return {
+        "options": dict(entry.options),
+        "loaded": True,
+        "garden": manager.garden,
+        "plants": len(manager.entities),
+        "scheduled_transitions": len(manager.scheduler),
+        "next_transition": next_transition.isoformat() if next_transition else None,
+        "metrics": manager.metrics.as_dict(),
+    }
@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, PLANT_DIARY_MANAGER
+from .const import DOMAIN
 from .PlantDiaryManager import PlantDiaryManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up Plant Diary sensor platform")
 
     # Recuperar el manager desde hass.data
-    manager: PlantDiaryManager = hass.data[DOMAIN].get(PLANT_DIARY_MANAGER)
+    manager: PlantDiaryManager = hass.data[DOMAIN].get(entry.entry_id)
 
     if manager:
         await manager.restore_and_add_entities(async_add_entities)
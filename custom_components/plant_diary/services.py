@@ -0,0 +1,164 @@
+"""Services of the Plant Diary component.
+
+The services are registered once for the integration and routed to the manager
+of a garden, chosen with the optional garden field of the service data.
+"""
+
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import slugify
+
+from .const import CONF_GARDEN, DOMAIN
+from .PlantDiaryManager import PlantDiaryManager
+from .PlantServiceSchemas import (
+    ADD_EVENT_SCHEMA,
+    BULK_DELETE_SCHEMA,
+    BULK_UPSERT_SCHEMA,
+    CREATE_PLANT_SCHEMA,
+    DELETE_PLANT_SCHEMA,
+    GET_HISTORY_SCHEMA,
+    GET_TREND_SCHEMA,
+    QUERY_SCHEMA,
+    SNOOZE_PLANT_SCHEMA,
+    UPDATE_DAYS_SINCE_WATERED_SCHEMA,
+    UPDATE_PLANT_SCHEMA,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ServiceHandler = Callable[[PlantDiaryManager, dict[str, Any]], Awaitable[Any]]
+
+
+def async_get_manager(hass: HomeAssistant, garden: str | None) -> PlantDiaryManager:
+    """Return the manager of a garden, given by entry ID, slug or name.
+
+    The garden may be omitted while a single garden is loaded.
+    """
+    managers: dict[str, PlantDiaryManager] = hass.data.get(DOMAIN, {})
+    if garden is None:
+        if len(managers) == 1:
+            return next(iter(managers.values()))
+        raise ServiceValidationError(
+            "A garden is required when several gardens are loaded"
+            if managers
+            else "No garden is loaded"
+        )
+
+    if garden in managers:
+        return managers[garden]
+    slug = slugify(garden)
+    for manager in managers.values():
+        if slug in (manager.garden, slugify(manager.entry.title)):
+            return manager
+    raise ServiceValidationError(f"Unknown garden: {garden}")
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    def register(
+        service: str,
+        handler: ServiceHandler,
+        schema: Any,
+        supports_response: SupportsResponse = SupportsResponse.NONE,
+    ) -> None:
+        async def handle(call: ServiceCall) -> ServiceResponse:
+            data = dict(call.data)
+            manager = async_get_manager(hass, data.pop(CONF_GARDEN, None))
+            return await handler(manager, data)
+
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handle,
+            schema=schema,
+            supports_response=supports_response,
+        )
+
+    async def handle_create_plant(manager: PlantDiaryManager, data: dict) -> None:
+        await manager.create_plant(data)
+
+    async def handle_update_plant(manager: PlantDiaryManager, data: dict) -> None:
+        await manager.update_plant(data)
+
+    async def handle_delete_plant(manager: PlantDiaryManager, data: dict) -> None:
+        await manager.delete_plant(data["plant_id"])
+
+    async def handle_bulk_upsert(
+        manager: PlantDiaryManager, data: dict
+    ) -> ServiceResponse:
+        return await manager.bulk_upsert(data["plants"])
+
+    async def handle_bulk_delete(
+        manager: PlantDiaryManager, data: dict
+    ) -> ServiceResponse:
+        return await manager.bulk_delete(data["plant_ids"])
+
+    async def handle_snooze_plant(manager: PlantDiaryManager, data: dict) -> None:
+        await manager.snooze_plant(data)
+
+    async def handle_add_event(manager: PlantDiaryManager, data: dict) -> None:
+        await manager.add_event(data)
+
+    async def handle_get_history(
+        manager: PlantDiaryManager, data: dict
+    ) -> ServiceResponse:
+        return await manager.get_history(data)
+
+    async def handle_get_trend(
+        manager: PlantDiaryManager, data: dict
+    ) -> ServiceResponse:
+        return await manager.get_trend(data)
+
+    async def handle_query(manager: PlantDiaryManager, data: dict) -> ServiceResponse:
+        return manager.query(data)
+
+    register("create_plant", handle_create_plant, CREATE_PLANT_SCHEMA)
+    register("update_plant", handle_update_plant, UPDATE_PLANT_SCHEMA)
+    register("delete_plant", handle_delete_plant, DELETE_PLANT_SCHEMA)
+    register(
+        "bulk_upsert",
+        handle_bulk_upsert,
+        BULK_UPSERT_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    )
+    register(
+        "bulk_delete",
+        handle_bulk_delete,
+        BULK_DELETE_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    )
+    register("snooze_plant", handle_snooze_plant, SNOOZE_PLANT_SCHEMA)
+    register("add_event", handle_add_event, ADD_EVENT_SCHEMA)
+    register(
+        "get_history", handle_get_history, GET_HISTORY_SCHEMA, SupportsResponse.ONLY
+    )
+    register("get_trend", handle_get_trend, GET_TREND_SCHEMA, SupportsResponse.ONLY)
+    register("query", handle_query, QUERY_SCHEMA, SupportsResponse.ONLY)
+
+    async def handle_update_days_since_watered(call: ServiceCall) -> None:
+        # Without a garden, every loaded garden is updated
+        garden = call.data.get(CONF_GARDEN)
+        managers = (
+            [async_get_manager(hass, garden)]
+            if garden is not None
+            else list(hass.data.get(DOMAIN, {}).values())
+        )
+        for manager in managers:
+            await manager.async_update_all_days_since_last_watered()
+
+    hass.services.async_register(
+        DOMAIN,
+        "update_days_since_watered",
+        handle_update_days_since_watered,
+        schema=UPDATE_DAYS_SINCE_WATERED_SCHEMA,
+    )
@@ -1,3 +1,99 @@
 """pytest fixtures."""
 
+import copy
+from typing import Any
+from unittest.mock import patch
+
 import pytest
+
+# Larger diaries are only benchmarked with --benchmark-only
+SMOKE_PLANT_COUNT = 100
+
+
+class FakePlantStore:
+    """In-memory replacement for the plant storage."""
+
+    def __init__(self, hass, version, key, *args, **kwargs) -> None:
+        """Initialize the fake store."""
+        self.key = key
+        self.data: dict[str, Any] | None = None
+        self.saves = 0
+        self.delayed_saves = 0
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return a copy of the saved data."""
+        return copy.deepcopy(self.data)
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        """Save the data."""
+        self.saves += 1
+        self.data = copy.deepcopy(data)
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:
+        """Save the data immediately, counting the delayed save."""
+        self.delayed_saves += 1
+        self.data = copy.deepcopy(data_func())
+
+
+@pytest.fixture(autouse=True)
+def mock_plant_store():
+    """Replace the plant storage with an in-memory store."""
+    with patch(
+        "custom_components.plant_diary.PlantRepository.PlantStore", FakePlantStore
+    ):
+        yield FakePlantStore
+
+
+@pytest.fixture(autouse=True)
+def mock_track_point_in_time():
+    """Replace the state transition timer."""
+    with patch(
+        "custom_components.plant_diary.PlantDiaryManager.async_track_point_in_time"
+    ) as mock_track:
+        yield mock_track
+
+
+@pytest.fixture(autouse=True)
+def mock_history_call_later():
+    """Replace the delayed flush of the plant history."""
+    with patch(
+        "custom_components.plant_diary.PlantHistory.async_call_later"
+    ) as mock_call_later:
+        yield mock_call_later
+
+
+@pytest.fixture(autouse=True)
+def mock_update_call_later():
+    """Replace the delayed flush of the coalesced plant updates."""
+    with patch(
+        "custom_components.plant_diary.PlantDiaryManager.async_call_later"
+    ) as mock_call_later:
+        yield mock_call_later
+
+
+@pytest.fixture(autouse=True)
+def mock_logbook_call_later():
+    """Replace the delayed flush of the logbook entries."""
+    with patch(
+        "custom_components.plant_diary.PlantLogbook.async_call_later"
+    ) as mock_call_later:
+        yield mock_call_later
+
+
+@pytest.fixture(autouse=True)
+def mock_track_time_change():
+    """Replace the daily snapshot timer."""
+    with patch(
+        "custom_components.plant_diary.PlantDiaryManager.async_track_time_change"
+    ) as mock_track:
+        yield mock_track
+
+
+@pytest.fixture
+def count(request: pytest.FixtureRequest) -> int:
+    """Return the number of plants, skipping large diaries in regular test runs."""
+    if request.param > SMOKE_PLANT_COUNT and not request.config.getoption(
+        "benchmark_only"
+    ):
+        pytest.skip("Large diaries are only benchmarked with --benchmark-only")
+    return request.param
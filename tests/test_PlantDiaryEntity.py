@@ -1,5 +1,7 @@
 # Test cases for PlantDiaryEntity class in the Plant Diary custom component for Home Assistant
+from dataclasses import replace
 from datetime import date, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -23,24 +25,25 @@ async def test_plantdiaryentity_initialization() -> None:
             "inside": True,
         },
     )
-    await entity.async_update()  # Simulate async update
+    entity.update_days_since_last_watered()
     assert entity._plant_id == "test_plant"
     assert entity._name == "plant_diary_test_plant"
     assert entity._unique_id == "plant_diary_test_plant"
-    assert entity._plant_name == "Test Plant"
+    assert entity.record.plant_id == "test_plant"
+    assert entity.record.plant_name == "Test Plant"
     assert (
-        entity._last_watered is not None
-        and entity._last_watered.isoformat() == date_1_days_ago
+        entity.record.last_watered is not None
+        and entity.record.last_watered.isoformat() == date_1_days_ago
     )
     assert (
-        entity._last_fertilized is not None
-        and entity._last_fertilized.isoformat() == date_1_days_ago
+        entity.record.last_fertilized is not None
+        and entity.record.last_fertilized.isoformat() == date_1_days_ago
     )
-    assert entity._watering_interval == 14
-    assert entity._watering_postponed == 0
+    assert entity.record.watering_interval == 14
+    assert entity.record.watering_postponed == 0
     assert entity._days_since_watered == 1
-    assert entity._inside is True
-    assert entity._image == ""
+    assert entity.record.inside is True
+    assert entity.record.image == ""
 
 
 def test_plantdiaryentity_name() -> None:
@@ -127,7 +130,7 @@ async def test_plantdiaryentity_attributes() -> None:
             "inside": True,
         },
     )
-    await entity.async_update()
+    entity.update_days_since_last_watered()
     attributes = entity.extra_state_attributes
     assert attributes["plant_name"] == "Test Plant"
     assert attributes["last_watered"] == date_1_days_ago
@@ -139,9 +142,8 @@ async def test_plantdiaryentity_attributes() -> None:
     assert attributes["image"] == ""
 
 
-@pytest.mark.asyncio
-async def test_plantdiaryentity_update() -> None:
-    """Test the async_update method of the entity."""
+def test_plantdiaryentity_update() -> None:
+    """Test the entity is refreshed by the manager rather than polled."""
     entity = PlantDiaryEntity(
         "test_plant",
         {
@@ -154,9 +156,9 @@ async def test_plantdiaryentity_update() -> None:
             "inside": True,
         },
     )
-    # Simulate an update
-    await entity.async_update()
-    # Check if the state is still 0 after update
+    # The manager refreshes the state, so the entity is not polled
+    assert entity.should_poll is False
+    entity.update_days_since_last_watered()
     assert entity.native_value == 0
 
 
@@ -183,30 +185,30 @@ async def test_plantdiaryentity_update_days_since_watered() -> None:
 
     # Simulate a date 13 days ago
     date_13_days_ago = date.today() - timedelta(days=13)
-    entity._last_watered = date_13_days_ago
+    entity.set_record(replace(entity.record, last_watered=date_13_days_ago))
     entity.update_days_since_last_watered()
     assert entity.native_value == 2
 
     # Simulate a date 15 days ago
     date_15_days_ago = date.today() - timedelta(days=15)
-    entity._last_watered = date_15_days_ago
+    entity.set_record(replace(entity.record, last_watered=date_15_days_ago))
     entity.update_days_since_last_watered()
     assert entity.native_value == 0
 
     # Simulate a date 15 days ago + postponed watering
-    entity._watering_postponed = 2
-    entity._last_watered = date_15_days_ago
+    entity.set_record(replace(entity.record, watering_postponed=2))
+    entity.set_record(replace(entity.record, last_watered=date_15_days_ago))
     entity.update_days_since_last_watered()
     assert entity.native_value == 1
 
     # Simulate a date error
-    entity._last_watered = None
+    entity.set_record(replace(entity.record, last_watered=None))
     entity.update_days_since_last_watered()
     assert entity.native_value == 0
 
 
-def test_plantdiaryentity_parse_date() -> None:
-    """Test the _parse_date method of the entity."""
+def test_plantdiaryentity_clear_cache() -> None:
+    """Test that the extra_state_attributes cache is cleared."""
     entity = PlantDiaryEntity(
         "test_plant",
         {
@@ -219,54 +221,76 @@ def test_plantdiaryentity_parse_date() -> None:
             "inside": True,
         },
     )
-    assert entity._parse_date("2023-10-01") == date(2023, 10, 1)
-    assert entity._parse_date("invalid-date") is None
-    assert entity._parse_date(None) is None
-    assert entity._parse_date(12345) is None  # Non-string input should return None
+    # Access extra_state_attributes to populate the cache
+    _ = entity.extra_state_attributes
+    # Clear the cache
+    entity.__dict__.pop("extra_state_attributes", None)
+    # Check if the cache is cleared
+    assert "extra_state_attributes" not in entity.__dict__
 
 
-def test_plantdiaryentity_clear_cache() -> None:
-    """Test that the extra_state_attributes cache is cleared."""
+def test_plantdiaryentity_update_days_since_watered_with_today() -> None:
+    """Test the state is computed for a given date."""
     entity = PlantDiaryEntity(
         "test_plant",
         {
             "plant_name": "Test Plant",
             "last_watered": "2023-10-01",
-            "last_fertilized": "2023-09-15",
             "watering_interval": 14,
-            "watering_postponed": 0,
-            "days_since_watered": 1,
-            "inside": True,
         },
+        date(2023, 10, 1),
     )
-    # Access extra_state_attributes to populate the cache
-    _ = entity.extra_state_attributes
-    # Clear the cache
-    entity.__dict__.pop("extra_state_attributes", None)
-    # Check if the cache is cleared
-    assert "extra_state_attributes" not in entity.__dict__
+    assert entity.native_value == 3
+    assert entity._days_since_watered == 0
+
+    entity.update_days_since_last_watered(date(2023, 10, 5))
+    assert entity.native_value == 2
+    assert entity._days_since_watered == 4
 
 
-def test_plantdiaryentity_parse_int() -> None:
-    """Test the _parse_int method of the entity."""
+def test_plantdiaryentity_next_transition_date() -> None:
+    """Test the date of the next state transition."""
     entity = PlantDiaryEntity(
         "test_plant",
         {
             "plant_name": "Test Plant",
             "last_watered": "2023-10-01",
-            "last_fertilized": "2023-09-15",
             "watering_interval": 14,
-            "watering_postponed": 0,
-            "days_since_watered": 1,
-            "inside": True,
+            "watering_postponed": 2,
         },
     )
-    assert entity._parse_int("42") == 42
-    assert entity._parse_int("invalid") == 0
-    assert entity._parse_int(None) == 0
-    assert entity._parse_int(100) == 100  # Integer input should return itself
-    assert entity._parse_int(3.14) == 3  # Float input should return truncated integer
-    assert entity._parse_int(True) == 1  # Boolean input should return 1
-    assert entity._parse_int(False) == 0  # Boolean input should return 0
-    assert entity._parse_int([]) == 0  # List input should return 0
-    assert entity._parse_int({}) == 0  # Dict input should return 0
+    assert entity.next_transition_date(date(2023, 9, 30)) == date(2023, 10, 1)
+    assert entity.next_transition_date(date(2023, 10, 1)) == date(2023, 10, 2)
+    assert entity.next_transition_date(date(2023, 10, 2)) == date(2023, 10, 15)
+    assert entity.next_transition_date(date(2023, 10, 15)) == date(2023, 10, 17)
+    assert entity.next_transition_date(date(2023, 10, 17)) is None
+
+    entity.set_record(replace(entity.record, last_watered=None))
+    assert entity.next_transition_date(date(2023, 10, 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_plantdiaryentity_write_if_changed() -> None:
+    """Test the state is only written when it changed."""
+    entity = PlantDiaryEntity(
+        "test_plant",
+        {
+            "plant_name": "Test Plant",
+            "last_watered": "2023-10-01",
+            "watering_interval": 14,
+        },
+    )
+    entity.async_write_ha_state = MagicMock()
+
+    # Nothing is written before the entity is added to Home Assistant
+    assert entity.async_write_if_changed() is False
+
+    entity.hass = MagicMock()
+    await entity.async_added_to_hass()
+    assert entity.async_write_if_changed() is False
+    entity.async_write_ha_state.assert_not_called()
+
+    entity.update_from_dict({"watering_interval": 7})
+    assert entity.async_write_if_changed() is True
+    assert entity.async_write_if_changed() is False
+    entity.async_write_ha_state.assert_called_once()
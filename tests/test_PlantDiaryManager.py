@@ -1,18 +1,22 @@
 # Test for PlantDiaryManager
+from datetime import date, datetime, timedelta
 from typing import Iterable
-from unittest.mock import ANY, AsyncMock, MagicMock, patch, Mock
+from unittest.mock import AsyncMock, MagicMock, patch, Mock
 
 import pytest
 import asyncio
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity import Entity
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.helpers.entity_values import EntityValues
 
 from custom_components.plant_diary.const import DOMAIN
 from custom_components.plant_diary.PlantDiaryManager import PlantDiaryManager
+from custom_components.plant_diary.PlantRecord import InvalidDateError
+from custom_components.plant_diary.PlantWeather import WeatherConditions
 
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
@@ -54,7 +58,7 @@ def create_test_hass():
     hass.async_create_task = async_create_task
 
     def add_entities(
-        entities: Iterable[Entity], _update_before_add: bool = False
+        entities: Iterable[Entity], update_before_add: bool = False
     ) -> None:
         """Mock synchronous add_entities (follows the protocol)."""
         for entity in entities:
@@ -75,114 +79,34 @@ def test_plantdiarymanager_initialization() -> None:
     """Test the initialization of the manager."""
     hass = MagicMock(spec=HomeAssistant)
     entry = MagicMock(spec=ConfigEntry)
+    entry.data = {}
     manager = PlantDiaryManager(hass, entry)
     assert manager is not None
     assert manager.hass == hass
     assert manager.entry == entry
     assert manager.entities == {}
     assert manager._async_add_entities is None
-    assert manager._midnight_listener is None
+    assert manager._transition_listener is None
 
 
 @pytest.mark.asyncio
-@patch("custom_components.plant_diary.PlantDiaryManager.async_track_time_change")
-async def test_plantdiarymanager_async_init(mock_async_track_time_change) -> None:
+async def test_plantdiarymanager_async_init() -> None:
     """Test the async initialization of the manager."""
     hass = MagicMock(spec=HomeAssistant)
-
-    # Add mock for hass.services.async_register
     hass.services = MagicMock()
-    hass.services.async_register = MagicMock()
 
     entry = MagicMock(spec=ConfigEntry)
+    entry.data = {}
+    entry.options = {"weather_entity": "weather.home"}
 
     manager = PlantDiaryManager(hass, entry)
     await manager.async_init()
-    # Check if the method runs without errors
-    assert manager is not None
-    # Verify that the service was registered
-    hass.services.async_register.assert_any_call(
-        DOMAIN,
-        "create_plant",
-        ANY,
-    )
-    hass.services.async_register.assert_any_call(
-        DOMAIN,
-        "update_plant",
-        ANY,
-    )
-    hass.services.async_register.assert_any_call(
-        DOMAIN,
-        "delete_plant",
-        ANY,
-    )
-    hass.services.async_register.assert_any_call(
-        DOMAIN,
-        "update_days_since_watered",
-        ANY,
-    )
-    assert manager._midnight_listener is not None
-    mock_async_track_time_change.assert_called_once_with(
-        hass,
-        manager.async_update_all_days_since_last_watered,
-        hour=0,
-        minute=0,
-        second=1,
-    )
-
-    assert manager._midnight_listener == mock_async_track_time_change.return_value
-
-
-@pytest.mark.asyncio
-@patch("custom_components.plant_diary.PlantDiaryManager.async_track_time_change")
-async def test_service_handlers_register_and_call(_mock_async_track_time_change):
-    """Test registering and calling service handlers."""
-
-    hass = create_test_hass()
-    manager = PlantDiaryManager(hass, MagicMock())
-
-    # Patch the methods that the services would call
-    manager.create_plant = AsyncMock()
-    manager.update_plant = AsyncMock()
-    manager.delete_plant = AsyncMock()
-    manager.async_update_all_days_since_last_watered = AsyncMock()
-
-    # Patch async_track_time_change to avoid lingering timers
-    with patch("homeassistant.helpers.event.async_track_time_change"):
-        await manager.async_register_services()
-
-    # Simulate service calls
-    await hass.services.async_call(
-        DOMAIN,
-        "create_plant",
-        {"plant_id": "test_plant"},
-        blocking=True,
-    )
-    manager.create_plant.assert_called_once()
-
-    await hass.services.async_call(
-        DOMAIN,
-        "update_plant",
-        {"plant_id": "test_plant", "new_name": "Updated"},
-        blocking=True,
-    )
-    manager.update_plant.assert_called_once()
-
-    await hass.services.async_call(
-        DOMAIN,
-        "delete_plant",
-        {"plant_id": "test_plant"},
-        blocking=True,
-    )
-    manager.delete_plant.assert_called_once()
-
-    await hass.services.async_call(
-        DOMAIN,
-        "update_days_since_watered",
-        {},
-        blocking=True,
-    )
-    manager.async_update_all_days_since_last_watered.assert_called_once()
+    assert manager.garden == ""
+    assert manager.weather.entity_id == "weather.home"
+    # The services are registered once by the integration, not by each manager
+    hass.services.async_register.assert_not_called()
+    # No plants, so no state transition is scheduled
+    assert manager._transition_listener is None
 
 
 @pytest.mark.asyncio
@@ -231,7 +155,7 @@ async def test_plantdiarymanager_create_plant() -> None:
     with patch("homeassistant.components.logbook.async_log_entry", None):
         await manager.create_plant(data)
     assert "New Plant" in manager.entities
-    assert manager.entities["New Plant"]._plant_name == "New Plant"
+    assert manager.entities["New Plant"].record.plant_name == "New Plant"
 
 
 @pytest.mark.asyncio
@@ -265,21 +189,24 @@ async def test_plantdiarymanager_update_plant() -> None:
         "image": "Existing Plant",
     }
 
-    with patch("homeassistant.components.logbook.async_log_entry", None):
+    with patch("custom_components.plant_diary.PlantLogbook.async_log_entry"):
         await manager.update_plant(updated_data)
-
-    updatedPlant = manager.entities["Existing Plant"]
-    assert updatedPlant._last_watered.isoformat() == "2023-10-02"
-    assert updatedPlant._last_fertilized.isoformat() == "2023-10-02"
-    assert updatedPlant._watering_interval == 7
-    assert updatedPlant._watering_postponed == 0
-    assert updatedPlant._inside is False
-    assert updatedPlant._plant_name == "Updated Plant"
-    assert updatedPlant._image == "Existing Plant"
+        await manager.async_flush_updates()
+
+    updatedPlant = manager.entities["Existing Plant"].record
+    assert updatedPlant.last_watered.isoformat() == "2023-10-02"
+    assert updatedPlant.last_fertilized.isoformat() == "2023-10-02"
+    assert updatedPlant.watering_interval == 7
+    assert updatedPlant.watering_postponed == 0
+    assert updatedPlant.inside is False
+    assert updatedPlant.plant_name == "Updated Plant"
+    assert updatedPlant.image == "Existing Plant"
+    assert manager.repository.get("Existing Plant") is updatedPlant
 
     # Test updating with a non-existing plant
     updated_data = {"plant_id": "Non-Existing Plant"}
-    await manager.update_plant(updated_data)
+    with pytest.raises(ServiceValidationError):
+        await manager.update_plant(updated_data)
 
 
 @patch("homeassistant.helpers.entity_registry.async_get")
@@ -324,7 +251,8 @@ async def test_plantdiarymanager_delete_plant(mock_er_async_get) -> None:
     fake_registry.async_remove.assert_called_once_with("plant_diary.plant_to_delete")
 
     # Call the delete method to a non-existing plant
-    await manager.delete_plant("Plant to Delete")
+    with pytest.raises(ServiceValidationError):
+        await manager.delete_plant("Plant to Delete")
 
 
 @pytest.mark.asyncio
@@ -351,10 +279,13 @@ async def test_plantdiarymanager_update_days_since_watered() -> None:
     assert manager.entities["Plant to Update"]._days_since_watered > 1
 
 
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
 @patch("homeassistant.helpers.entity_registry.async_get")
 @pytest.mark.asyncio
-async def test_plantdiarymanager_async_unload(mock_er_async_get) -> None:
-    """Test unloading the manager."""
+async def test_plantdiarymanager_async_unload(
+    mock_er_async_get, mock_log_entry
+) -> None:
+    """Test unloading the manager keeps the registry entries and logs nothing."""
     hass = create_test_hass()
     entry = MagicMock(spec=ConfigEntry)
     entry.data = {
@@ -388,6 +319,631 @@ async def test_plantdiarymanager_async_unload(mock_er_async_get) -> None:
 
     # Mock the unload method
     await manager.async_unload()
-    assert manager._midnight_listener is None
+    assert manager._transition_listener is None
     assert manager._async_add_entities is None
     assert len(manager.entities) == 0
+    assert manager.scheduler.next_date() is None
+    assert manager.index.query() == []
+
+    # The sensor platform removes the entities, the registry entries are kept
+    entity.async_remove.assert_not_awaited()
+    fake_registry.async_remove.assert_not_called()
+    mock_log_entry.assert_not_called()
+    # The plants stay in storage
+    assert "Plant to Delete" in manager.repository._store.data["plants"]
+
+
+@patch("homeassistant.helpers.entity_registry.async_get")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_async_reload(mock_er_async_get) -> None:
+    """Test reloading only touches the plants that changed in storage."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            plant_id: {
+                "plant_name": plant_id,
+                "last_watered": "2023-10-01",
+                "watering_interval": 14,
+            }
+            for plant_id in ("Kept", "Changed", "Removed")
+        }
+    }
+    entry.options = {}
+    add_entities = MagicMock(side_effect=hass.async_add_entities)
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(add_entities)
+    add_entities.reset_mock()
+    kept = manager.entities["Kept"]
+    changed = manager.entities["Changed"]
+    removed = manager.entities["Removed"]
+    for entity in (kept, changed, removed):
+        entity.async_write_ha_state = MagicMock()
+    removed.async_remove = AsyncMock()
+
+    # The storage is changed behind the back of the manager
+    store = manager.repository._store
+    plants = store.data["plants"]
+    plants["Changed"]["watering_interval"] = 3
+    plants["Added"] = {"plant_name": "Added", "watering_interval": 7}
+    del plants["Removed"]
+
+    entry.options = {"profiling": True}
+    await manager.async_reload()
+
+    assert set(manager.entities) == {"Kept", "Changed", "Added"}
+    # The unchanged and the changed plants keep their entities
+    assert manager.entities["Kept"] is kept
+    assert manager.entities["Changed"] is changed
+    assert changed.record.watering_interval == 3
+    changed.async_write_ha_state.assert_called_once()
+    kept.async_write_ha_state.assert_not_called()
+    removed.async_remove.assert_awaited_once()
+    assert "Removed" not in manager.index.query()
+
+    # Only the new plant and the diagnostic sensors are added
+    (added,) = add_entities.call_args.args
+    assert added[0] is manager.entities["Added"]
+    assert added[1:] == manager.diagnostic_entities
+    assert manager.metrics.enabled
+
+    # Turning the profiling off removes the diagnostic sensors
+    diagnostic_entities = manager.diagnostic_entities
+    for entity in diagnostic_entities:
+        entity.async_remove = AsyncMock()
+    entry.options = {}
+    await manager.async_reload()
+    assert manager.diagnostic_entities == []
+    for entity in diagnostic_entities:
+        entity.async_remove.assert_awaited_once()
+    assert not manager.metrics.enabled
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_update_days_since_watered_does_not_save() -> None:
+    """Test refreshing all plants does not save the unchanged plant records."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Plant A": {
+                "plant_name": "Plant A",
+                "last_watered": "2023-10-01",
+                "watering_interval": 14,
+            },
+            "Plant B": {
+                "plant_name": "Plant B",
+                "last_watered": "2023-10-02",
+                "watering_interval": 7,
+            },
+        }
+    }
+
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    store = manager.repository._store
+
+    await manager.async_update_all_days_since_last_watered(None)
+    assert store.delayed_saves == 0
+    assert set(store.data["plants"]) == {"Plant A", "Plant B"}
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_bulk_upsert(mock_log_entry) -> None:
+    """Test creating and updating several plants at once."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Existing Plant": {
+                "plant_name": "Existing Plant",
+                "last_watered": "2023-10-01",
+                "watering_interval": 14,
+            }
+        }
+    }
+    add_entities = MagicMock(side_effect=hass.async_add_entities)
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(add_entities)
+    add_entities.reset_mock()
+    store = manager.repository._store
+    delayed_saves = store.delayed_saves
+
+    result = await manager.bulk_upsert(
+        [
+            {"plant_id": "Existing Plant", "watering_interval": 7},
+            {"plant_name": "New Plant 1", "last_watered": "2023-10-02"},
+            {"plant_name": "New Plant 2"},
+            {"watering_interval": 3},
+        ]
+    )
+
+    assert result == {
+        "created": ["New Plant 1", "New Plant 2"],
+        "updated": ["Existing Plant"],
+    }
+    add_entities.assert_called_once()
+    assert len(add_entities.call_args[0][0]) == 2
+    assert manager.entities["Existing Plant"].record.watering_interval == 7
+    assert manager.entities["New Plant 2"].record.watering_interval == 14
+    assert store.delayed_saves == delayed_saves + 1
+    assert set(store.data["plants"]) == {
+        "Existing Plant",
+        "New Plant 1",
+        "New Plant 2",
+    }
+    manager.logbook.async_flush()
+    mock_log_entry.assert_called_once()
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@patch("homeassistant.helpers.entity_registry.async_get")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_bulk_delete(mock_er_async_get, mock_log_entry) -> None:
+    """Test deleting several plants at once."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Plant A": {"plant_name": "Plant A"},
+            "Plant B": {"plant_name": "Plant B"},
+            "Plant C": {"plant_name": "Plant C"},
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    for entity in manager.entities.values():
+        entity.async_remove = AsyncMock()
+    store = manager.repository._store
+    delayed_saves = store.delayed_saves
+
+    result = await manager.bulk_delete(["Plant A", "Plant C", "Unknown"])
+
+    assert result == {"deleted": ["Plant A", "Plant C"], "not_found": ["Unknown"]}
+    assert list(manager.entities) == ["Plant B"]
+    assert store.delayed_saves == delayed_saves + 1
+    assert list(store.data["plants"]) == ["Plant B"]
+    manager.logbook.async_flush()
+    mock_log_entry.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_state_transitions(mock_track_point_in_time) -> None:
+    """Test only the plants whose state flips are written on a transition."""
+    today = date.today()
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Due Plant": {
+                "plant_name": "Due Plant",
+                "last_watered": (today - timedelta(days=13)).isoformat(),
+                "watering_interval": 14,
+            },
+            "Fresh Plant": {
+                "plant_name": "Fresh Plant",
+                "last_watered": (today - timedelta(days=3)).isoformat(),
+                "watering_interval": 14,
+            },
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+
+    # The timer is armed for the earliest transition
+    assert manager._next_transition == today + timedelta(days=1)
+    mock_track_point_in_time.assert_called_once()
+    assert mock_track_point_in_time.call_args[0][1] == manager._async_handle_transitions
+
+    for entity in [*manager.entities.values(), *manager.summary_entities]:
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state = MagicMock()
+    due_today, overdue = manager.summary_entities
+    assert overdue.native_value == 0
+
+    tomorrow = datetime.now() + timedelta(days=1)
+    with patch(
+        "custom_components.plant_diary.PlantDiaryManager.now",
+        return_value=tomorrow,
+    ):
+        await manager._async_handle_transitions(tomorrow)
+
+    due_plant = manager.entities["Due Plant"]
+    fresh_plant = manager.entities["Fresh Plant"]
+    assert due_plant.native_value == 0
+    due_plant.async_write_ha_state.assert_called_once()
+    fresh_plant.async_write_ha_state.assert_not_called()
+    assert manager._next_transition == today + timedelta(days=11)
+
+    # The summary follows the plant that became overdue
+    assert overdue.native_value == 1
+    assert overdue.extra_state_attributes == {"inside": 1, "outside": 0}
+    assert due_today.native_value == 1
+    overdue.async_write_ha_state.assert_called_once()
+
+
+@patch("custom_components.plant_diary.PlantNotifier.async_call_later")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_reminders_and_snooze(mock_notify_call_later) -> None:
+    """Test the plants turning overdue are reminded of, unless snoozed."""
+    today = date.today()
+    hass = create_test_hass()
+    hass.services.async_call = AsyncMock()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            plant_id: {
+                "plant_name": plant_id,
+                "last_watered": (today - timedelta(days=13)).isoformat(),
+                "watering_interval": 14,
+            }
+            for plant_id in ("Fern", "Mint")
+        }
+    }
+    entry.options = {"notify_service": "notify.phone"}
+    manager = PlantDiaryManager(hass, entry)
+    await manager.async_init()
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    for entity in manager.entities.values():
+        entity.async_write_ha_state = MagicMock()
+
+    tomorrow = datetime.now() + timedelta(days=1)
+    with patch(
+        "custom_components.plant_diary.PlantDiaryManager.now",
+        return_value=tomorrow,
+    ):
+        await manager._async_handle_transitions(tomorrow)
+
+        # Both plants turned overdue and wait for a single digest
+        mock_notify_call_later.assert_called_once()
+
+        # Snoozing Mint for two days postpones it past its interval
+        await manager.snooze_plant({"plant_id": "Mint", "days": 2})
+    mint = manager.entities["Mint"]
+    assert mint.record.watering_postponed == 2
+    assert mint.status_on(tomorrow.date()) == (14, 1)
+
+    await mock_notify_call_later.call_args[0][2](None)
+    hass.services.async_call.assert_awaited_once_with(
+        "notify",
+        "phone",
+        {"title": "Plant Diary", "message": "1 plant needs watering\nOverdue: Fern"},
+        blocking=True,
+    )
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_update_plant_skips_unchanged(mock_log_entry) -> None:
+    """Test updating a plant with the same data does not write its state."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Existing Plant": {
+                "plant_name": "Existing Plant",
+                "last_watered": "2023-10-01",
+                "watering_interval": 14,
+            }
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    entity = manager.entities["Existing Plant"]
+    await entity.async_added_to_hass()
+    entity.async_write_ha_state = MagicMock()
+
+    await manager.update_plant({"plant_id": "Existing Plant", "watering_interval": 14})
+    await manager.async_flush_updates()
+    entity.async_write_ha_state.assert_not_called()
+
+    await manager.update_plant({"plant_id": "Existing Plant", "watering_interval": 7})
+    await manager.async_flush_updates()
+    entity.async_write_ha_state.assert_called_once()
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_update_plant_records_history(mock_log_entry) -> None:
+    """Test updating a plant appends the watering to its history."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Existing Plant": {
+                "plant_name": "Existing Plant",
+                "last_watered": "2023-10-01",
+            }
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    manager.history.async_append = MagicMock()
+
+    await manager.update_plant({"plant_id": "Existing Plant", "last_watered": "2023-10-05"})
+
+    manager.history.async_append.assert_called_once_with(
+        "Existing Plant", "watered", date(2023, 10, 5)
+    )
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_query() -> None:
+    """Test querying the plants through the indexes."""
+    today = date.today()
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Monstera": {
+                "plant_name": "Monstera",
+                "last_watered": (today - timedelta(days=5)).isoformat(),
+                "watering_interval": 7,
+            },
+            "Mint": {
+                "plant_name": "Mint",
+                "last_watered": (today - timedelta(days=5)).isoformat(),
+                "watering_interval": 3,
+                "inside": False,
+            },
+            "Fern": {
+                "plant_name": "Fern",
+                "last_watered": today.isoformat(),
+                "watering_interval": 14,
+            },
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+
+    result = manager.query({"due_within": 3})
+    assert [plant["plant_id"] for plant in result["plants"]] == ["Mint", "Monstera"]
+    assert result["plants"][0] == {
+        "plant_id": "Mint",
+        "plant_name": "Mint",
+        "state": 0,
+        "due_date": (today - timedelta(days=2)).isoformat(),
+        "inside": False,
+    }
+    assert manager.query({"state": [0], "inside": False}) == {
+        "plants": [result["plants"][0]]
+    }
+    assert manager.query({"name_prefix": "m", "limit": 1}) == {
+        "plants": [result["plants"][0]]
+    }
+
+    # Updates move the plant in the indexes
+    entity = manager.entities["Mint"]
+    entity.async_write_ha_state = MagicMock()
+    with patch("custom_components.plant_diary.PlantLogbook.async_log_entry"):
+        await manager.update_plant(
+            {"plant_id": "Mint", "last_watered": today.isoformat()}
+        )
+    result = manager.query({"due_within": 2})
+    assert [plant["plant_id"] for plant in result["plants"]] == ["Monstera"]
+    result = manager.query({"state": [3]})
+    assert [plant["plant_id"] for plant in result["plants"]] == ["Mint", "Fern"]
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_update_plant_coalesces_updates(
+    mock_log_entry, mock_update_call_later
+) -> None:
+    """Test rapid updates of a plant are written, saved and logged once."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Existing Plant": {
+                "plant_name": "Existing Plant",
+                "last_watered": "2023-10-01",
+                "watering_interval": 14,
+            }
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    entity = manager.entities["Existing Plant"]
+    await entity.async_added_to_hass()
+    entity.async_write_ha_state = MagicMock()
+    store = manager.repository._store
+    delayed_saves = store.delayed_saves
+
+    await manager.update_plant({"plant_id": "Existing Plant", "watering_interval": 7})
+    await manager.update_plant({"plant_id": "Existing Plant", "watering_postponed": 2})
+    await manager.update_plant({"plant_id": "Existing Plant", "inside": False})
+
+    # The updates are merged at once but not written yet
+    assert entity.record.watering_interval == 7
+    assert entity.record.inside is False
+    mock_update_call_later.assert_called_once()
+    entity.async_write_ha_state.assert_not_called()
+    mock_log_entry.assert_not_called()
+    assert store.delayed_saves == delayed_saves
+
+    # The delayed flush writes, saves and logs the plant once
+    await mock_update_call_later.call_args[0][2](None)
+    entity.async_write_ha_state.assert_called_once()
+    manager.logbook.async_flush()
+    mock_log_entry.assert_called_once()
+    assert mock_log_entry.call_args.kwargs["message"] == "Updated plant: Existing Plant"
+    assert store.delayed_saves == delayed_saves + 1
+    assert store.data["plants"]["Existing Plant"]["watering_postponed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_update_plant_parses_dates() -> None:
+    """Test datetimes are accepted and invalid dates rejected without changes."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Existing Plant": {
+                "plant_name": "Existing Plant",
+                "last_watered": "2023-10-01",
+            }
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    entity = manager.entities["Existing Plant"]
+
+    await manager.update_plant(
+        {"plant_id": "Existing Plant", "last_watered": "2023-10-05 09:15:00"}
+    )
+    assert entity.record.last_watered == date(2023, 10, 5)
+
+    with pytest.raises(InvalidDateError):
+        await manager.update_plant(
+            {"plant_id": "Existing Plant", "last_watered": "2023-10-32"}
+        )
+    assert entity.record.last_watered == date(2023, 10, 5)
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_unload_flushes_updates(mock_log_entry) -> None:
+    """Test the pending updates are saved when the manager is unloaded."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {"plants": {"Existing Plant": {"plant_name": "Existing Plant"}}}
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    manager.entities["Existing Plant"].async_remove = AsyncMock()
+
+    await manager.update_plant({"plant_id": "Existing Plant", "watering_interval": 3})
+    with patch("homeassistant.helpers.entity_registry.async_get"):
+        await manager.async_unload()
+
+    store = manager.repository._store
+    assert store.data["plants"]["Existing Plant"]["watering_interval"] == 3
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_moisture_watering(mock_log_entry) -> None:
+    """Test a watering detected by a moisture sensor updates the plant."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Fern": {
+                "plant_name": "Fern",
+                "last_watered": "2023-10-01",
+                "moisture_sensor": "sensor.fern_moisture",
+            },
+            "Mint": {"plant_name": "Mint", "last_watered": "2023-10-01"},
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    with patch(
+        "custom_components.plant_diary.PlantMoistureDispatcher.async_track_state_change_event"
+    ) as mock_track:
+        await manager.restore_and_add_entities(hass.async_add_entities)
+
+    assert mock_track.call_args[0][1] == ["sensor.fern_moisture"]
+
+    await manager._async_handle_moisture_watering(["Fern"])
+    assert manager.entities["Fern"].record.last_watered == date.today()
+    assert manager.entities["Mint"].record.last_watered == date(2023, 10, 1)
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_weather_adjusts_outside_plants() -> None:
+    """Test rain waters the outside plants without touching the inside ones."""
+    today = date.today()
+    last_watered = (today - timedelta(days=20)).isoformat()
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Inside Plant": {"plant_name": "Inside Plant", "last_watered": last_watered},
+            "Outside Plant": {
+                "plant_name": "Outside Plant",
+                "last_watered": last_watered,
+                "inside": False,
+            },
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    assert manager.entities["Outside Plant"].native_value == 0
+
+    manager.weather.entity_id = "weather.home"
+    manager.weather.async_update = AsyncMock(
+        return_value=WeatherConditions(rain_date=today)
+    )
+    await manager.async_update_all_days_since_last_watered()
+
+    assert manager.entities["Inside Plant"].native_value == 0
+    outside_plant = manager.entities["Outside Plant"]
+    assert outside_plant.native_value == 3
+    assert outside_plant.record.last_watered == today - timedelta(days=20)
+    result = manager.query({"state": [0]})
+    assert [plant["plant_id"] for plant in result["plants"]] == ["Inside Plant"]
+
+
+@pytest.mark.asyncio
+async def test_plantdiarymanager_daily_snapshot(mock_track_time_change) -> None:
+    """Test the daily snapshot records the state of every plant."""
+    today = date.today()
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {
+        "plants": {
+            "Fern": {
+                "plant_name": "Fern",
+                "last_watered": (today - timedelta(days=20)).isoformat(),
+            }
+        }
+    }
+    manager = PlantDiaryManager(hass, entry)
+    await manager.restore_and_add_entities(hass.async_add_entities)
+    assert mock_track_time_change.call_args[0][1] == manager._async_take_snapshot
+
+    manager.snapshots.async_record = AsyncMock()
+    await manager._async_take_snapshot()
+    manager.snapshots.async_record.assert_awaited_once_with(today, {"Fern": (20, 0)})
+
+
+@patch("custom_components.plant_diary.PlantLogbook.async_log_entry")
+@pytest.mark.asyncio
+async def test_plantdiarymanager_metrics(mock_log_entry) -> None:
+    """Test the operations are timed and counted when profiling is enabled."""
+    hass = create_test_hass()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = {"plants": {"Fern": {"plant_name": "Fern"}}}
+    add_entities = MagicMock(side_effect=hass.async_add_entities)
+    manager = PlantDiaryManager(hass, entry)
+    manager.metrics.enabled = True
+
+    await manager.restore_and_add_entities(add_entities)
+    diagnostic_entities = [
+        entity
+        for entity in add_entities.call_args[0][0]
+        if entity.name == "plant_diary_last_sweep_duration"
+    ]
+    assert len(diagnostic_entities) == 1
+
+    for entity in manager.entities.values():
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state = MagicMock()
+    await manager.update_plant({"plant_id": "Fern", "last_watered": "2023-10-01"})
+    await manager.async_flush_updates()
+    await manager.async_update_all_days_since_last_watered()
+    manager.logbook.async_flush()
+
+    metrics = manager.metrics.as_dict()
+    assert metrics["counters"]["state_writes"] >= 1
+    assert metrics["counters"]["logbook_entries"] == 2
+    # The migration of the config entry plants and the update
+    assert metrics["counters"]["storage_writes"] == 2
+    assert set(metrics["timings"]) == {
+        "restore_and_add_entities",
+        "update_plant",
+        "async_flush_updates",
+        "sweep",
+    }
+    assert diagnostic_entities[0].native_value is not None
@@ -0,0 +1,126 @@
+# Test for PlantHistory
+from datetime import date
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.plant_diary.PlantHistory import (
+    PlantHistory,
+    decode_event,
+    encode_event,
+    read_events,
+)
+from custom_components.plant_diary.PlantRecord import PlantRecord
+
+
+def create_history(tmp_path) -> PlantHistory:
+    """Create a history writing its files to a temporary directory."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.config = MagicMock()
+    hass.config.path = lambda *paths: os.path.join(tmp_path, *paths)
+
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+
+    hass.async_add_executor_job = async_add_executor_job
+    return PlantHistory(hass)
+
+
+def test_encode_and_decode_event() -> None:
+    """Test events are stored as JSON lines starting with their date."""
+    line = encode_event(date(2023, 10, 1), "postponed", 2)
+    assert line == b'{"d":"2023-10-01","e":"postponed","v":2}\n'
+    assert decode_event(line) == {
+        "date": "2023-10-01",
+        "event": "postponed",
+        "value": 2,
+    }
+
+
+def test_read_events(tmp_path) -> None:
+    """Test reading the last events and the events within a date range."""
+    path = os.path.join(tmp_path, "history.jsonl")
+    assert read_events(path, last=5) == []
+
+    with open(path, "wb") as file:
+        for day in range(1, 11):
+            file.write(encode_event(date(2023, 10, day), "watered"))
+
+    assert [event["date"] for event in read_events(path, last=3)] == [
+        "2023-10-08",
+        "2023-10-09",
+        "2023-10-10",
+    ]
+    assert len(read_events(path, last=50)) == 10
+    assert [
+        event["date"]
+        for event in read_events(path, start=date(2023, 10, 4), end=date(2023, 10, 6))
+    ] == ["2023-10-04", "2023-10-05", "2023-10-06"]
+    assert len(read_events(path)) == 10
+
+
+
+@pytest.mark.asyncio
+async def test_read_events_after_an_interrupted_append(tmp_path) -> None:
+    """Test an incomplete last line is skipped and ended by the next append."""
+    history = create_history(tmp_path)
+    os.makedirs(history.directory)
+    with open(history.path("Fern"), "wb") as file:
+        file.write(encode_event(date(2023, 10, 1), "watered"))
+        file.write(encode_event(date(2023, 10, 2), "watered")[:-2])
+
+    assert read_events(history.path("Fern"), last=5) == [
+        {"date": "2023-10-01", "event": "watered"}
+    ]
+    assert read_events(history.path("Fern")) == [
+        {"date": "2023-10-01", "event": "watered"}
+    ]
+
+    # The next event is not appended to the incomplete line
+    history.async_append("Fern", "watered", date(2023, 10, 3))
+    await history.async_flush()
+    assert [event["date"] for event in read_events(history.path("Fern"))] == [
+        "2023-10-01",
+        "2023-10-03",
+    ]
+    assert [
+        event["date"] for event in read_events(history.path("Fern"), last=5)
+    ] == ["2023-10-01", "2023-10-03"]
+
+@pytest.mark.asyncio
+async def test_planthistory_record_changes(tmp_path, mock_history_call_later) -> None:
+    """Test the events implied by record changes are appended and read back."""
+    history = create_history(tmp_path)
+    old = PlantRecord.from_dict("Fern", {"last_watered": "2023-10-01"})
+    new = old.updated(
+        {
+            "last_watered": "2023-10-05",
+            "last_fertilized": "2023-10-05",
+            "watering_postponed": 2,
+        }
+    )
+
+    history.async_record_changes("Fern", None, old, date(2023, 10, 1))
+    history.async_record_changes("Fern", old, new, date(2023, 10, 5))
+    history.async_append("Fern", "repotted", date(2023, 10, 6))
+    mock_history_call_later.assert_called_once()
+
+    # Pending events are flushed before reading
+    assert await history.async_get_events("Fern") == [
+        {"date": "2023-10-01", "event": "watered"},
+        {"date": "2023-10-05", "event": "watered"},
+        {"date": "2023-10-05", "event": "fertilized"},
+        {"date": "2023-10-05", "event": "postponed", "value": 2},
+        {"date": "2023-10-06", "event": "repotted"},
+    ]
+    assert os.path.exists(history.path("Fern"))
+    assert await history.async_get_events("Fern", last=1) == [
+        {"date": "2023-10-06", "event": "repotted"}
+    ]
+
+    await history.async_remove("Fern")
+    assert not os.path.exists(history.path("Fern"))
+    assert await history.async_get_events("Fern") == []
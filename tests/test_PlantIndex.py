@@ -0,0 +1,68 @@
+# Test for PlantIndex
+from datetime import date
+
+from custom_components.plant_diary.PlantIndex import PlantIndex, due_date
+from custom_components.plant_diary.PlantRecord import PlantRecord
+
+
+def create_index() -> PlantIndex:
+    """Create an index of a few plants."""
+    index = PlantIndex()
+    index.set(
+        "Monstera",
+        PlantRecord("Monstera", "Monstera", date(2023, 10, 1), watering_interval=7),
+        2,
+    )
+    index.set(
+        "Mint",
+        PlantRecord(
+            "Mint", "Mint", date(2023, 10, 1), watering_interval=3, inside=False
+        ),
+        0,
+    )
+    index.set("Cactus", PlantRecord("Cactus", "Cactus"), 0)
+    return index
+
+
+def test_plantindex_due_date() -> None:
+    """Test the due date of a plant."""
+    assert due_date(PlantRecord("A", "A", date(2023, 10, 1))) == date(2023, 10, 15)
+    assert due_date(PlantRecord("A", "A")) is None
+
+
+def test_plantindex_query() -> None:
+    """Test queries combining the indexes."""
+    index = create_index()
+
+    assert len(index) == 3
+    assert index.query() == ["Cactus", "Mint", "Monstera"]
+    assert index.query(due_by=date(2023, 10, 5)) == ["Cactus", "Mint"]
+    assert index.query(states=[2]) == ["Monstera"]
+    assert index.query(inside=False) == ["Mint"]
+    assert index.query(name_prefix="mon") == ["Monstera"]
+    assert index.query(due_by=date(2023, 10, 5), inside=True) == ["Cactus"]
+    assert index.query(states=[0], name_prefix="m") == ["Mint"]
+
+
+def test_plantindex_update_and_remove() -> None:
+    """Test updated and removed plants leave their old index positions."""
+    index = create_index()
+
+    index.set(
+        "Monstera",
+        PlantRecord("Monstera", "Swiss Cheese", date(2023, 10, 1), inside=False),
+        0,
+    )
+    assert index.query(name_prefix="mon") == []
+    assert index.query(name_prefix="swiss") == ["Monstera"]
+    assert index.query(inside=False) == ["Mint", "Monstera"]
+    assert index.query(states=[2]) == []
+
+    index.remove("Mint")
+    index.remove("Unknown")
+    assert index.query(inside=False) == ["Monstera"]
+    assert index.query(due_by=date(2023, 10, 5)) == ["Cactus"]
+
+    index.clear()
+    assert len(index) == 0
+    assert index.query() == []
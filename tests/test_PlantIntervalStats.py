@@ -0,0 +1,39 @@
+# Test for PlantIntervalStats
+import pytest
+
+from custom_components.plant_diary.PlantIntervalStats import PlantIntervalStats
+
+
+def test_plantintervalstats_add() -> None:
+    """Test the moving average follows the gaps between waterings."""
+    stats = PlantIntervalStats()
+    assert stats.predicted_interval is None
+    assert stats.confidence == 0.0
+
+    stats = stats.add(10)
+    assert stats == PlantIntervalStats(1, 10.0, 0.0)
+
+    stats = stats.add(20)
+    assert stats.count == 2
+    assert stats.mean == pytest.approx(13.0)
+    assert stats.variance == pytest.approx(21.0)
+    assert stats.predicted_interval == 13.0
+
+
+def test_plantintervalstats_confidence() -> None:
+    """Test the confidence grows with regular waterings."""
+    stats = PlantIntervalStats()
+    for _ in range(5):
+        stats = stats.add(7)
+    assert stats.confidence == 1.0
+
+    irregular = PlantIntervalStats()
+    for gap in (2, 12, 3, 14, 2):
+        irregular = irregular.add(gap)
+    assert 0.0 <= irregular.confidence < 0.5
+
+
+def test_plantintervalstats_stored_form() -> None:
+    """Test the statistics round trip through their stored form."""
+    stats = PlantIntervalStats().add(7).add(9)
+    assert PlantIntervalStats.from_list(stats.as_list()) == stats
@@ -0,0 +1,98 @@
+# Test for PlantLogbook
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.plant_diary.PlantLogbook import (
+    ACTION_ADDED,
+    ACTION_WATERED,
+    PlantLogbook,
+)
+from custom_components.plant_diary.PlantMetrics import PlantMetrics
+
+
+@pytest.fixture
+def mock_log_entry():
+    """Replace the logbook of Home Assistant."""
+    with patch(
+        "custom_components.plant_diary.PlantLogbook.async_log_entry"
+    ) as mock_log_entry:
+        yield mock_log_entry
+
+
+def logged_messages(mock_log_entry: MagicMock) -> list[tuple[str, str | None]]:
+    """Return the messages and entity IDs written to the logbook."""
+    return [
+        (call.kwargs["message"], call.kwargs["entity_id"])
+        for call in mock_log_entry.call_args_list
+    ]
+
+
+def test_logbook_batches_entries(mock_log_entry, mock_logbook_call_later) -> None:
+    """Test the entries are written together and bursts are summarised."""
+    metrics = PlantMetrics(enabled=True)
+    logbook = PlantLogbook(MagicMock(spec=HomeAssistant), metrics)
+
+    for plant_id in ("Fern", "Mint", "Ivy"):
+        logbook.async_log(
+            f"Watered plant: {plant_id}",
+            f"sensor.plant_diary_{plant_id.lower()}",
+            plant_id,
+            ACTION_WATERED,
+        )
+    logbook.async_log(
+        "Added new plant: Fern", "sensor.plant_diary_fern", "Fern", ACTION_ADDED
+    )
+    logbook.async_log("Deleted 2 plants")
+
+    # A single delayed flush is scheduled
+    mock_logbook_call_later.assert_called_once()
+    mock_log_entry.assert_not_called()
+
+    mock_logbook_call_later.call_args[0][2](None)
+    assert logged_messages(mock_log_entry) == [
+        ("Deleted 2 plants", None),
+        ("Watered 3 plants", None),
+        ("Added new plant: Fern", "sensor.plant_diary_fern"),
+    ]
+    assert metrics.counters["logbook_entries"] == 3
+
+    # Nothing is left to write
+    logbook.async_flush()
+    assert mock_log_entry.call_count == 3
+
+
+def test_logbook_rate_limits_plant_updates(mock_log_entry) -> None:
+    """Test the updates of a plant are logged at most once per rate limit."""
+    logbook = PlantLogbook(MagicMock(spec=HomeAssistant), PlantMetrics())
+    logbook.rate_limit = timedelta(minutes=5)
+
+    with patch(
+        "custom_components.plant_diary.PlantLogbook.monotonic", return_value=1000.0
+    ) as mock_monotonic:
+        logbook.async_log("Watered plant: Fern", None, "Fern", ACTION_WATERED)
+        logbook.async_log("Watered plant: Fern", None, "Fern", ACTION_WATERED)
+        # Added plants are not rate limited
+        logbook.async_log("Added new plant: Fern", None, "Fern", ACTION_ADDED)
+        logbook.async_log("Added new plant: Fern", None, "Fern", ACTION_ADDED)
+        logbook.async_flush()
+        assert logged_messages(mock_log_entry) == [
+            ("Watered plant: Fern", None),
+            ("Added 2 plants", None),
+        ]
+
+        mock_log_entry.reset_mock()
+        mock_monotonic.return_value = 1000.0 + 5 * 60
+        logbook.async_log("Watered plant: Fern", None, "Fern", ACTION_WATERED)
+        logbook.async_flush()
+        assert logged_messages(mock_log_entry) == [("Watered plant: Fern", None)]
+
+        # A deleted plant starts again without a rate limit
+        mock_log_entry.reset_mock()
+        logbook.async_forget("Fern")
+        logbook.async_log("Watered plant: Fern", None, "Fern", ACTION_WATERED)
+        logbook.async_flush()
+        assert logged_messages(mock_log_entry) == [("Watered plant: Fern", None)]
@@ -0,0 +1,67 @@
+# Test for PlantMetrics
+import pytest
+
+from custom_components.plant_diary.PlantMetrics import (
+    COUNTER_STATE_WRITES,
+    PlantMetrics,
+    timed,
+)
+
+
+class Instrumented:
+    """Object with an instrumented operation."""
+
+    def __init__(self, enabled: bool) -> None:
+        """Initialize the object."""
+        self.metrics = PlantMetrics(enabled)
+
+    @timed("operation")
+    async def operation(self, value: int) -> int:
+        """Return the value."""
+        return value
+
+
+@pytest.mark.asyncio
+async def test_plantmetrics_timed() -> None:
+    """Test operations are only timed while the metrics are enabled."""
+    disabled = Instrumented(False)
+    assert await disabled.operation(1) == 1
+    assert disabled.metrics.timings == {}
+
+    enabled = Instrumented(True)
+    assert await enabled.operation(2) == 2
+    assert await enabled.operation(3) == 3
+    timings = enabled.metrics.as_dict()["timings"]["operation"]
+    assert timings["count"] == 2
+    assert timings["histogram"]["<=1ms"] == 2
+    assert enabled.metrics.last_duration("operation") is not None
+    assert enabled.metrics.last_duration("other") is None
+
+
+def test_plantmetrics_counters() -> None:
+    """Test counters are only incremented while the metrics are enabled."""
+    metrics = PlantMetrics()
+    metrics.count(COUNTER_STATE_WRITES)
+    assert metrics.counters[COUNTER_STATE_WRITES] == 0
+
+    metrics.enabled = True
+    metrics.count(COUNTER_STATE_WRITES, 3)
+    assert metrics.as_dict()["counters"] == {
+        "storage_writes": 0,
+        "state_writes": 3,
+        "logbook_entries": 0,
+    }
+
+
+def test_plantmetrics_histogram_buckets() -> None:
+    """Test durations are counted in their histogram bucket."""
+    metrics = PlantMetrics(True)
+    for seconds in (0.0005, 0.003, 0.2, 10):
+        metrics.record("sweep", seconds)
+
+    histogram = metrics.as_dict()["timings"]["sweep"]["histogram"]
+    assert histogram["<=1ms"] == 1
+    assert histogram["<=5ms"] == 1
+    assert histogram["<=500ms"] == 1
+    assert histogram[">5000ms"] == 1
+    assert metrics.as_dict()["timings"]["sweep"]["max_ms"] == 10000
@@ -0,0 +1,82 @@
+# Test for PlantMoistureDispatcher
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.plant_diary.PlantMoistureDispatcher import (
+    PlantMoistureDispatcher,
+)
+
+
+def state_change(entity_id: str, state: str) -> MagicMock:
+    """Create a state change event of a sensor."""
+    event = MagicMock()
+    event.data = {"entity_id": entity_id, "new_state": State(entity_id, state)}
+    return event
+
+
+def test_plantmoisturedispatcher_detect_watering() -> None:
+    """Test waterings are rising edges with hysteresis."""
+    dispatcher = PlantMoistureDispatcher(MagicMock(spec=HomeAssistant), AsyncMock())
+
+    # The first reading arms the plant
+    assert not dispatcher.detect_watering("Fern", 20, 40)
+    assert dispatcher.detect_watering("Fern", 45, 40)
+    # Staying above or dipping within the hysteresis is the same watering
+    assert not dispatcher.detect_watering("Fern", 50, 40)
+    assert not dispatcher.detect_watering("Fern", 37, 40)
+    assert not dispatcher.detect_watering("Fern", 41, 40)
+    # Drying out re-arms the plant
+    assert not dispatcher.detect_watering("Fern", 30, 40)
+    assert dispatcher.detect_watering("Fern", 42, 40)
+
+    # A sensor already wet when bound does not count as a watering
+    assert not dispatcher.detect_watering("Mint", 60, 40)
+    assert not dispatcher.detect_watering("Mint", 70, 40)
+
+
+@pytest.mark.asyncio
+async def test_plantmoisturedispatcher_single_listener() -> None:
+    """Test one debounced listener dispatches the readings of every sensor."""
+    on_watered = AsyncMock()
+    dispatcher = PlantMoistureDispatcher(MagicMock(spec=HomeAssistant), on_watered)
+    dispatcher.bind("Fern", "sensor.soil", 40)
+    dispatcher.bind("Mint", "sensor.soil", 50)
+    dispatcher.bind("Cactus", "sensor.other", 10)
+    dispatcher.bind("Rose", "", 40)
+
+    with (
+        patch(
+            "custom_components.plant_diary.PlantMoistureDispatcher.async_track_state_change_event"
+        ) as mock_track,
+        patch(
+            "custom_components.plant_diary.PlantMoistureDispatcher.async_call_later"
+        ) as mock_call_later,
+    ):
+        dispatcher.async_update_listener()
+        dispatcher.async_update_listener()
+        mock_track.assert_called_once()
+        assert mock_track.call_args[0][1] == ["sensor.soil", "sensor.other"]
+        handle_state_change = mock_track.call_args[0][2]
+
+        handle_state_change(state_change("sensor.soil", "20"))
+        handle_state_change(state_change("sensor.soil", "unavailable"))
+        await mock_call_later.call_args[0][2](None)
+        on_watered.assert_not_called()
+
+        # Only the last reading within the debounce delay is evaluated
+        mock_call_later.reset_mock()
+        handle_state_change(state_change("sensor.soil", "80"))
+        handle_state_change(state_change("sensor.soil", "45"))
+        mock_call_later.assert_called_once()
+        await mock_call_later.call_args[0][2](None)
+        on_watered.assert_awaited_once_with(["Fern"])
+
+        # Unbinding the last plant of a sensor stops listening to it
+        unsubscribe = mock_track.return_value
+        dispatcher.unbind("Cactus")
+        dispatcher.async_update_listener()
+        unsubscribe.assert_called_once()
+        assert mock_track.call_args[0][1] == ["sensor.soil"]
@@ -0,0 +1,105 @@
+# Test for PlantNotifier
+from datetime import datetime, time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceNotFound
+
+from custom_components.plant_diary.PlantNotifier import (
+    PlantNotifier,
+    digest_message,
+    quiet_hours_end,
+)
+
+
+@pytest.mark.parametrize(
+    ("moment", "start", "end", "expected"),
+    [
+        # Quiet hours spanning midnight
+        ("2024-05-01 23:30", time(22), time(7), "2024-05-02 07:00"),
+        ("2024-05-02 06:59", time(22), time(7), "2024-05-02 07:00"),
+        ("2024-05-02 07:00", time(22), time(7), None),
+        ("2024-05-01 12:00", time(22), time(7), None),
+        # Quiet hours within a day
+        ("2024-05-01 13:15", time(13), time(15), "2024-05-01 15:00"),
+        ("2024-05-01 16:00", time(13), time(15), None),
+        # No quiet hours
+        ("2024-05-01 23:30", None, time(7), None),
+        ("2024-05-01 23:30", time(7), time(7), None),
+    ],
+)
+def test_quiet_hours_end(moment, start, end, expected) -> None:
+    """Test the end of the quiet hours around a moment."""
+    result = quiet_hours_end(datetime.fromisoformat(moment), start, end)
+    assert result == (datetime.fromisoformat(expected) if expected else None)
+
+
+def test_digest_message() -> None:
+    """Test the digest lists the overdue plants before the due ones."""
+    assert digest_message(["Fern", "Mint"], ["Ivy"]) == (
+        "3 plants need watering\nOverdue: Fern, Mint\nDue: Ivy"
+    )
+    assert digest_message([], ["Ivy"]) == "1 plant needs watering\nDue: Ivy"
+
+
+@pytest.mark.asyncio
+async def test_notifier_sends_a_digest() -> None:
+    """Test the plants are sent together, leaving out those no longer due."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.services = MagicMock()
+    hass.services.async_call = AsyncMock()
+    states = {"fern": ("Fern", 0), "ivy": ("Ivy", 1), "mint": ("Mint", 3)}
+    notifier = PlantNotifier(hass, states.get)
+
+    with patch(
+        "custom_components.plant_diary.PlantNotifier.async_call_later"
+    ) as mock_call_later:
+        # Nothing is collected without a notify service
+        notifier.async_add("fern")
+        mock_call_later.assert_not_called()
+
+        notifier.service = "mobile_app_phone"
+        for plant_id in ("fern", "ivy", "mint", "gone"):
+            notifier.async_add(plant_id)
+        mock_call_later.assert_called_once()
+
+        await mock_call_later.call_args[0][2](None)
+        hass.services.async_call.assert_awaited_once_with(
+            "notify",
+            "mobile_app_phone",
+            {
+                "title": "Plant Diary",
+                "message": "2 plants need watering\nOverdue: Fern\nDue: Ivy",
+            },
+            blocking=True,
+        )
+
+        # A missing notify service is logged rather than raised
+        hass.services.async_call.side_effect = ServiceNotFound("notify", "phone")
+        notifier.service = "notify.phone"
+        notifier.async_add("fern")
+        await notifier.async_send()
+        assert hass.services.async_call.call_args[0][:2] == ("notify", "phone")
+
+
+def test_notifier_waits_for_the_end_of_the_quiet_hours() -> None:
+    """Test a digest due during the quiet hours is sent once they end."""
+    notifier = PlantNotifier(MagicMock(spec=HomeAssistant), lambda _plant_id: None)
+    notifier.service = "notify.phone"
+    notifier.quiet_start = time(22)
+    notifier.quiet_end = time(7)
+
+    moment = datetime.fromisoformat("2024-05-01 23:30")
+    with (
+        patch("custom_components.plant_diary.PlantNotifier.now", return_value=moment),
+        patch(
+            "custom_components.plant_diary.PlantNotifier.async_track_point_in_time"
+        ) as mock_track,
+    ):
+        notifier.async_add("fern")
+        notifier.async_discard("fern")
+
+    assert mock_track.call_args[0][2] == datetime.fromisoformat("2024-05-02 07:00")
+    notifier.async_unload()
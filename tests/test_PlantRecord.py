@@ -0,0 +1,154 @@
+# Test for PlantRecord
+from datetime import date, datetime, timezone
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_diary.PlantRecord import (
+    InvalidDateError,
+    PlantRecord,
+    parse_date,
+    parse_int,
+)
+
+
+def test_parse_date() -> None:
+    """Test dates are parsed from dates, datetimes, timestamps and strings."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Madrid"))
+    try:
+        assert parse_date("2023-10-01") == date(2023, 10, 1)
+        assert parse_date("2023-10-01 08:30:00") == date(2023, 10, 1)
+        assert parse_date("2023-10-01T08:30:00") == date(2023, 10, 1)
+        # Datetimes with a timezone give the local date
+        assert parse_date("2023-10-01T23:30:00+00:00") == date(2023, 10, 2)
+        assert parse_date(datetime(2023, 10, 1, 23, 30, tzinfo=timezone.utc)) == date(
+            2023, 10, 2
+        )
+        assert parse_date(date(2023, 10, 1)) == date(2023, 10, 1)
+        assert parse_date(1696118400) == date(2023, 10, 1)
+    finally:
+        dt_util.set_default_time_zone(dt_util.UTC)
+
+    assert parse_date(None) is None
+    assert parse_date("") is None
+    assert parse_date("Unknown") is None
+
+    for value in ("2023-13-01", "yesterday", True, [2023, 10, 1]):
+        with pytest.raises(InvalidDateError):
+            parse_date(value)
+
+
+def test_parse_int() -> None:
+    """Test integers are parsed from various values, falling back to a default."""
+    assert parse_int("42") == 42
+    assert parse_int("invalid") == 0
+    assert parse_int(None) == 0
+    assert parse_int(None, 7) == 7
+    assert parse_int(100) == 100
+    assert parse_int(3.14) == 3  # Floats are truncated
+    assert parse_int(True) == 1
+    assert parse_int(False) == 0
+    assert parse_int([]) == 0
+    assert parse_int({}) == 0
+
+
+def test_plantrecord_from_dict_rejects_invalid_dates() -> None:
+    """Test an invalid date raises instead of clearing the date."""
+    with pytest.raises(InvalidDateError):
+        PlantRecord.from_dict("test_plant", {"last_watered": "2023-10-32"})
+
+
+def test_plantrecord_from_dict() -> None:
+    """Test creating a record from its stored data."""
+    record = PlantRecord.from_dict(
+        "test_plant",
+        {
+            "last_watered": "2023-10-01",
+            "last_fertilized": "Unknown",
+            "watering_interval": "7",
+            "inside": 0,
+            "days_since_watered": 3,
+        },
+    )
+    assert record.plant_id == "test_plant"
+    assert record.plant_name == "test_plant"
+    assert record.last_watered == date(2023, 10, 1)
+    assert record.last_fertilized is None
+    assert record.watering_interval == 7
+    assert record.watering_postponed == 0
+    assert record.inside is False
+    assert record.image == ""
+
+
+def test_plantrecord_updated() -> None:
+    """Test updated returns a new record only when a field changes."""
+    record = PlantRecord.from_dict("test_plant", {"watering_interval": 7})
+
+    assert record.updated({}) is record
+    assert record.updated({"watering_interval": 7}) is record
+
+    updated = record.updated({"watering_interval": 10, "plant_name": "Fern"})
+    assert updated is not record
+    assert updated.watering_interval == 10
+    assert updated.plant_name == "Fern"
+    assert record.watering_interval == 7
+
+
+def test_plantrecord_attributes_are_cached() -> None:
+    """Test the serialised attributes are built once per record."""
+    record = PlantRecord.from_dict(
+        "test_plant", {"plant_name": "Fern", "last_watered": "2023-10-01"}
+    )
+
+    attributes = record.attributes
+    assert attributes == {
+        "plant_name": "Fern",
+        "last_watered": "2023-10-01",
+        "last_fertilized": "Unknown",
+        "watering_interval": 14,
+        "watering_postponed": 0,
+        "inside": True,
+        "image": "",
+        "adaptive_interval": False,
+        "predicted_interval": None,
+        "confidence": 0.0,
+        "moisture_sensor": "",
+        "moisture_threshold": 40,
+    }
+    assert record.attributes is attributes
+    assert record == PlantRecord.from_dict(
+        "test_plant", {"plant_name": "Fern", "last_watered": "2023-10-01"}
+    )
+
+
+def test_plantrecord_learns_watering_interval() -> None:
+    """Test the watering interval is learned from the gaps between waterings."""
+    record = PlantRecord.from_dict(
+        "test_plant",
+        {
+            "last_watered": "2023-10-01",
+            "watering_interval": 14,
+            "adaptive_interval": True,
+        },
+    )
+    assert record.effective_interval == 14
+
+    record = record.updated({"last_watered": "2023-10-08"})
+    assert record.interval_stats.count == 1
+    assert record.attributes["predicted_interval"] == 7.0
+    # A single gap is not enough to replace the configured interval
+    assert record.effective_interval == 14
+
+    record = record.updated({"last_watered": "2023-10-15"})
+    assert record.interval_stats.count == 2
+    assert record.effective_interval == 7
+    assert record.attributes["confidence"] == 0.4
+
+    # Going back in time does not add a gap
+    assert record.updated({"last_watered": "2023-10-10"}).interval_stats.count == 2
+
+    # The statistics are restored from the stored form
+    stored = PlantRecord.from_dict("test_plant", record.to_dict())
+    assert stored.interval_stats == record.interval_stats
+    assert stored.effective_interval == 7
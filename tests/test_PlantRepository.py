@@ -0,0 +1,108 @@
+# Test for PlantRepository
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.plant_diary.PlantRecord import PlantRecord
+from custom_components.plant_diary.PlantRepository import PlantRepository
+
+PLANT = {
+    "plant_name": "Test Plant",
+    "last_watered": "2023-10-01",
+    "last_fertilized": "2023-09-15",
+    "watering_interval": 14,
+    "watering_postponed": 0,
+    "inside": True,
+    "image": "Test Plant.jpg",
+    "adaptive_interval": False,
+    "predicted_interval": None,
+    "confidence": 0.0,
+    "moisture_sensor": "",
+    "moisture_threshold": 40,
+}
+
+
+def create_repository(entry_data: dict) -> PlantRepository:
+    """Create a repository for a config entry with the given data."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.config_entries = MagicMock()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.data = entry_data
+    return PlantRepository(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_plantrepository_migrates_config_entry_plants() -> None:
+    """Test plants are moved from the config entry data to storage once."""
+    repository = create_repository({"plants": {"Test Plant": PLANT}})
+
+    plants = await repository.async_load()
+
+    assert plants == {"Test Plant": PlantRecord.from_dict("Test Plant", PLANT)}
+    assert repository._store.key == "plant_diary.plants"
+    assert repository._store.data == {"plants": {"Test Plant": PLANT}}
+    repository.hass.config_entries.async_update_entry.assert_called_once_with(
+        repository.entry, data={}
+    )
+
+    # Loading again uses the loaded plants
+    assert await repository.async_load() is plants
+    assert repository._store.saves == 1
+
+
+@pytest.mark.asyncio
+async def test_plantrepository_loads_from_storage() -> None:
+    """Test plants are loaded from storage when it exists."""
+    repository = create_repository({})
+    repository._store.data = {"plants": {"Test Plant": PLANT}}
+
+    assert await repository.async_load() == {
+        "Test Plant": PlantRecord.from_dict("Test Plant", PLANT)
+    }
+    repository.hass.config_entries.async_update_entry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_plantrepository_restores_plants_with_invalid_dates() -> None:
+    """Test a plant with an invalid stored date is restored without its dates."""
+    repository = create_repository({})
+    repository._store.data = {
+        "plants": {"Test Plant": {**PLANT, "last_watered": "not a date"}}
+    }
+
+    plants = await repository.async_load()
+
+    record = plants["Test Plant"]
+    assert record.last_watered is None
+    assert record.last_fertilized is None
+    assert record.watering_interval == 14
+
+
+@pytest.mark.asyncio
+async def test_plantrepository_set_and_flush() -> None:
+    """Test plants changes are saved with a delayed save and flushed."""
+    repository = create_repository({})
+    await repository.async_load()
+    record_a = PlantRecord.from_dict("A", PLANT)
+    record_b = PlantRecord.from_dict("B", PLANT)
+
+    repository.async_set_many({"A": record_a, "B": record_b})
+    assert repository._store.delayed_saves == 1
+    assert set(repository.plants) == {"A", "B"}
+
+    repository.async_set("A", None)
+    assert repository.get("A") is None
+    assert repository._store.data == {"plants": {"B": PLANT}}
+
+    # Nothing to flush once the delayed save has been written
+    saves = repository._store.saves
+    await repository.async_flush()
+    assert repository._store.saves == saves
+
+    # Unchanged records and unknown plants do not trigger a save
+    repository.async_set_many({"B": PlantRecord.from_dict("B", PLANT), "C": None})
+    repository.async_set_many({})
+    assert repository._store.delayed_saves == 2
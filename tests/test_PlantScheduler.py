@@ -0,0 +1,52 @@
+# Test for PlantScheduler
+from datetime import date
+
+from custom_components.plant_diary.PlantScheduler import PlantScheduler
+
+
+def test_plantscheduler_pop_due() -> None:
+    """Test plants are popped in the order of their transition date."""
+    scheduler = PlantScheduler()
+    scheduler.schedule("A", date(2023, 10, 3))
+    scheduler.schedule("B", date(2023, 10, 1))
+    scheduler.schedule("C", date(2023, 10, 2))
+    scheduler.schedule("D", None)
+
+    assert len(scheduler) == 3
+    assert scheduler.next_date() == date(2023, 10, 1)
+    assert scheduler.pop_due(date(2023, 9, 30)) == []
+    assert scheduler.pop_due(date(2023, 10, 2)) == ["B", "C"]
+    assert scheduler.next_date() == date(2023, 10, 3)
+    assert len(scheduler) == 1
+
+
+def test_plantscheduler_reschedule_and_unschedule() -> None:
+    """Test stale heap items are skipped."""
+    scheduler = PlantScheduler()
+    scheduler.schedule("A", date(2023, 10, 1))
+    scheduler.schedule("B", date(2023, 10, 2))
+
+    scheduler.schedule("A", date(2023, 10, 5))
+    scheduler.unschedule("B")
+
+    assert scheduler.next_date() == date(2023, 10, 5)
+    assert scheduler.pop_due(date(2023, 10, 4)) == []
+    assert scheduler.pop_due(date(2023, 10, 5)) == ["A"]
+    assert scheduler.next_date() is None
+
+    scheduler.schedule("A", date(2023, 10, 6))
+    scheduler.clear()
+    assert len(scheduler) == 0
+    assert scheduler.next_date() is None
+
+
+def test_plantscheduler_compact() -> None:
+    """Test the heap is compacted after many reschedules."""
+    scheduler = PlantScheduler()
+    for day in range(1, 29):
+        for _ in range(10):
+            scheduler.schedule("A", date(2023, 10, day))
+            scheduler.schedule("A", date(2023, 11, day))
+
+    assert len(scheduler._heap) <= 2 * len(scheduler) + 64
+    assert scheduler.pop_due(date(2023, 11, 28)) == ["A"]
@@ -0,0 +1,85 @@
+# Test for the service schemas
+from datetime import date
+
+import pytest
+import voluptuous as vol
+
+from custom_components.plant_diary.PlantServiceSchemas import (
+    ADD_EVENT_SCHEMA,
+    BULK_DELETE_SCHEMA,
+    BULK_UPSERT_SCHEMA,
+    CREATE_PLANT_SCHEMA,
+    DELETE_PLANT_SCHEMA,
+    GET_TREND_SCHEMA,
+    QUERY_SCHEMA,
+    SNOOZE_PLANT_SCHEMA,
+    UPDATE_PLANT_SCHEMA,
+)
+
+
+def test_plant_schemas_convert_fields() -> None:
+    """Test the plant fields are converted to their types."""
+    assert UPDATE_PLANT_SCHEMA(
+        {
+            "plant_id": "Fern",
+            "last_watered": "2023-10-01 08:30:00",
+            "last_fertilized": "Unknown",
+            "watering_interval": "7",
+            "inside": "off",
+            "moisture_sensor": "",
+        }
+    ) == {
+        "plant_id": "Fern",
+        "last_watered": date(2023, 10, 1),
+        "last_fertilized": None,
+        "watering_interval": 7,
+        "inside": False,
+        "moisture_sensor": "",
+    }
+    assert CREATE_PLANT_SCHEMA({"plant_name": "Fern", "moisture_threshold": 35}) == {
+        "plant_name": "Fern",
+        "moisture_threshold": 35,
+    }
+
+
+@pytest.mark.parametrize(
+    ("schema", "data", "path"),
+    [
+        (CREATE_PLANT_SCHEMA, {"last_watered": "2023-10-01"}, ["plant_name"]),
+        (UPDATE_PLANT_SCHEMA, {"plant_id": "Fern", "last_watered": "x"}, None),
+        (UPDATE_PLANT_SCHEMA, {"plant_id": "Fern", "watering_interval": 0}, None),
+        (UPDATE_PLANT_SCHEMA, {"plant_id": "Fern", "moisture_sensor": "x"}, None),
+        (UPDATE_PLANT_SCHEMA, {"plant_id": "Fern", "new_name": "Ivy"}, None),
+        (DELETE_PLANT_SCHEMA, {}, ["plant_id"]),
+        (ADD_EVENT_SCHEMA, {"plant_id": "Fern", "event": "pruned"}, ["event"]),
+        (GET_TREND_SCHEMA, {"plant_id": "Fern", "start": "2023-02-30"}, ["start"]),
+        (QUERY_SCHEMA, {"state": [5]}, ["state", 0]),
+        (SNOOZE_PLANT_SCHEMA, {"plant_id": "Fern", "days": 0}, ["days"]),
+    ],
+)
+def test_schemas_reject_invalid_data(schema, data, path) -> None:
+    """Test invalid data is rejected with the path of the invalid value."""
+    with pytest.raises(vol.Invalid) as err:
+        schema(data)
+    if path is not None:
+        assert err.value.path == path
+
+
+def test_bulk_schemas() -> None:
+    """Test the list payloads of the bulk services."""
+    assert BULK_UPSERT_SCHEMA(
+        {"plants": {"plant_name": "Fern", "watering_interval": "5"}}
+    ) == {"plants": [{"plant_name": "Fern", "watering_interval": 5}]}
+    assert BULK_DELETE_SCHEMA({"plant_ids": "Fern"}) == {"plant_ids": ["Fern"]}
+    assert QUERY_SCHEMA({"state": "0"}) == {"state": [0]}
+    assert SNOOZE_PLANT_SCHEMA({"plant_id": "Fern"}) == {"plant_id": "Fern", "days": 1}
+
+    # Each item of a bulk upsert is validated and needs a plant_id or a plant_name
+    with pytest.raises(vol.Invalid) as err:
+        BULK_UPSERT_SCHEMA(
+            {"plants": [{"plant_id": "Fern"}, {"plant_name": "Ivy", "inside": "x"}]}
+        )
+    assert err.value.path == ["plants", 1, "inside"]
+    with pytest.raises(vol.Invalid) as err:
+        BULK_UPSERT_SCHEMA({"plants": [{"watering_interval": 3}]})
+    assert err.value.path == ["plants", 0]
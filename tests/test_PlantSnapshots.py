@@ -0,0 +1,113 @@
+# Test for PlantSnapshots
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.plant_diary.PlantSnapshots import (
+    PlantSnapshots,
+    decode_columns,
+    encode_columns,
+)
+
+
+def create_snapshots(tmp_path) -> PlantSnapshots:
+    """Create snapshots writing their segments to a temporary directory."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.config = MagicMock()
+    hass.config.path = lambda *paths: os.path.join(tmp_path, *paths)
+
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+
+    hass.async_add_executor_job = async_add_executor_job
+    return PlantSnapshots(hass)
+
+
+def test_encode_and_decode_columns() -> None:
+    """Test the columns are delta encoded."""
+    columns = ([738794, 738795, 738796], [2, 1, 0], [13, 14, 15])
+    data = encode_columns(columns)
+    assert data == {"d": [738794, 1, 1], "s": "210", "w": [13, 1, 1]}
+    assert decode_columns(data) == columns
+
+
+@pytest.mark.asyncio
+async def test_plantsnapshots_record_and_trend(tmp_path) -> None:
+    """Test daily snapshots are written per month and read back as a trend."""
+    snapshots = create_snapshots(tmp_path)
+    await snapshots.async_record(date(2023, 9, 30), {"Fern": (13, 2)})
+    await snapshots.async_record(date(2023, 10, 1), {"Fern": (14, 1), "Mint": (1, 2)})
+    await snapshots.async_record(date(2023, 10, 2), {"Fern": (15, 0)})
+    # A second snapshot of the same day replaces the first one
+    await snapshots.async_record(date(2023, 10, 2), {"Fern": (0, 3)})
+
+    with open(os.path.join(snapshots.directory, "2023-10.json")) as file:
+        assert json.load(file)["Fern"] == {"d": [738794, 1], "s": "13", "w": [14, -14]}
+
+    trend = await snapshots.async_get_trend(
+        "Fern", date(2023, 9, 1), date(2023, 10, 31)
+    )
+    assert trend == [
+        {"date": "2023-09-30", "state": 2, "days_since_watered": 13, "overdue": False},
+        {"date": "2023-10-01", "state": 1, "days_since_watered": 14, "overdue": False},
+        {"date": "2023-10-02", "state": 3, "days_since_watered": 0, "overdue": False},
+    ]
+    assert await snapshots.async_get_trend(
+        "Fern", date(2023, 10, 2), date(2023, 10, 2)
+    ) == [trend[2]]
+
+    # Segments are read back from disk after a restart
+    restarted = create_snapshots(tmp_path)
+    assert (
+        await restarted.async_get_trend("Fern", date(2023, 9, 1), date(2023, 10, 31))
+        == trend
+    )
+    assert await restarted.async_get_trend(
+        "Unknown", date(2023, 9, 1), date(2023, 10, 31)
+    ) == []
+
+
+@pytest.mark.asyncio
+async def test_plantsnapshots_remove(tmp_path) -> None:
+    """Test the snapshots of a deleted plant are removed from every segment."""
+    snapshots = create_snapshots(tmp_path)
+    await snapshots.async_record(date(2023, 9, 30), {"Fern": (13, 2), "Mint": (1, 2)})
+    await snapshots.async_record(date(2023, 10, 1), {"Fern": (14, 1), "Mint": (2, 2)})
+
+    await snapshots.async_remove("Fern")
+    # The plant is not written again with the next snapshot
+    await snapshots.async_record(date(2023, 10, 2), {"Mint": (3, 2)})
+
+    for name in ("2023-09.json", "2023-10.json"):
+        with open(os.path.join(snapshots.directory, name)) as file:
+            assert list(json.load(file)) == ["Mint"]
+    assert (
+        await snapshots.async_get_trend("Fern", date(2023, 9, 1), date(2023, 10, 31))
+        == []
+    )
+
+
+def test_plantsnapshots_concurrent_segment_writes(tmp_path) -> None:
+    """Test concurrent writes of a segment each replace it with a whole file."""
+    snapshots = create_snapshots(tmp_path)
+    data = [
+        {f"Plant {i}": encode_columns(([738794], [i % 4], [i]))} for i in range(4)
+    ]
+
+    def write(segment_data) -> None:
+        for _ in range(50):
+            snapshots._write_segment("2023-10.json", segment_data)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(write, item) for item in data]:
+            future.result()
+
+    assert os.listdir(snapshots.directory) == ["2023-10.json"]
+    with open(os.path.join(snapshots.directory, "2023-10.json")) as file:
+        assert json.load(file) in data
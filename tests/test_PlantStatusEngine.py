@@ -0,0 +1,77 @@
+# Test for PlantStatusEngine
+from datetime import date
+
+import pytest
+
+from custom_components.plant_diary.PlantRecord import PlantRecord
+from custom_components.plant_diary.PlantStatusEngine import (
+    PlantStatusEngine,
+    watering_state,
+)
+
+
+def create_record(plant_id: str, last_watered: str | None, postponed: int = 0):
+    """Create a plant record watered on the given date."""
+    return PlantRecord.from_dict(
+        plant_id,
+        {
+            "last_watered": last_watered,
+            "watering_interval": 14,
+            "watering_postponed": postponed,
+        },
+    )
+
+
+def test_watering_state() -> None:
+    """Test the state for the days since watered."""
+    assert watering_state(0, 14, 2) == 3
+    assert watering_state(13, 14, 2) == 2
+    assert watering_state(15, 14, 2) == 1
+    assert watering_state(16, 14, 2) == 0
+    assert watering_state(-1, 14, 0) == 2
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_plantstatusengine_compute(use_numpy: bool) -> None:
+    """Test the status of all plants is computed and only changes are returned."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    engine = PlantStatusEngine(use_numpy=use_numpy)
+    engine.set("Today", create_record("Today", "2023-10-15"))
+    engine.set("Due", create_record("Due", "2023-10-01"))
+    engine.set("Postponed", create_record("Postponed", "2023-10-01", postponed=2))
+    engine.set("Unknown", create_record("Unknown", None))
+
+    assert engine.compute(date(2023, 10, 15)) == ["Today", "Due", "Postponed"]
+    assert engine.status("Today") == (0, 3)
+    assert engine.status("Due") == (14, 0)
+    assert engine.status("Postponed") == (14, 1)
+    assert engine.status("Unknown") == (0, 0)
+
+    # Nothing changes when computing the same day again
+    assert engine.compute(date(2023, 10, 15)) == []
+
+    engine.set("Due", create_record("Due", "2023-10-15"))
+    assert engine.compute(date(2023, 10, 15)) == ["Due"]
+    assert engine.status("Due") == (0, 3)
+
+
+def test_plantstatusengine_remove() -> None:
+    """Test removing a plant moves the last row into its place."""
+    engine = PlantStatusEngine(use_numpy=False)
+    engine.set("A", create_record("A", "2023-10-01"))
+    engine.set("B", create_record("B", "2023-10-02"))
+    engine.set("C", create_record("C", "2023-10-03"))
+    engine.compute(date(2023, 10, 5))
+
+    engine.remove("A")
+    engine.remove("Unknown")
+
+    assert len(engine) == 2
+    assert engine.status("C") == (2, 2)
+    assert engine.status("B") == (3, 2)
+    assert engine.compute(date(2023, 10, 6)) == ["C", "B"]
+
+    engine.clear()
+    assert len(engine) == 0
+    assert engine.compute(date(2023, 10, 6)) == []
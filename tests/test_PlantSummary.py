@@ -0,0 +1,40 @@
+# Test for PlantSummary
+from custom_components.plant_diary.PlantSummary import (
+    SUMMARY_DUE_TODAY,
+    SUMMARY_OVERDUE,
+    PlantSummary,
+)
+
+
+def test_plantsummary_counts() -> None:
+    """Test plants are counted by state and location."""
+    summary = PlantSummary()
+    assert summary.set("A", 0, True)
+    assert summary.set("B", 1, False)
+    assert summary.set("C", 2, True)
+    assert not summary.set("C", 2, True)
+
+    assert len(summary) == 3
+    assert summary.count(SUMMARY_DUE_TODAY) == 2
+    assert summary.count(SUMMARY_OVERDUE) == 1
+    assert summary.count(SUMMARY_DUE_TODAY, inside=False) == 1
+    assert summary.count(SUMMARY_OVERDUE, inside=False) == 0
+
+
+def test_plantsummary_move_and_remove() -> None:
+    """Test a plant changing state or location moves between counters."""
+    summary = PlantSummary()
+    summary.set("A", 2, True)
+    summary.set("A", 0, False)
+
+    assert summary.count(SUMMARY_OVERDUE) == 1
+    assert summary.count(SUMMARY_OVERDUE, inside=True) == 0
+
+    assert summary.remove("A")
+    assert not summary.remove("A")
+    assert summary.count(SUMMARY_DUE_TODAY) == 0
+
+    summary.set("B", 1, True)
+    summary.clear()
+    assert len(summary) == 0
+    assert summary.count(SUMMARY_DUE_TODAY) == 0
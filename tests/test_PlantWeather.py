@@ -0,0 +1,164 @@
+# Test for PlantWeather
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_diary.PlantRecord import PlantRecord
+from custom_components.plant_diary.PlantWeather import (
+    PlantWeather,
+    WeatherConditions,
+    _forecast_for,
+    watering_basis,
+)
+
+NOW = datetime(2023, 10, 10, 8, 0)
+
+
+def create_weather_hass(
+    temperature: float, precipitation: float, attributes: dict | None = None
+) -> MagicMock:
+    """Create a Home Assistant mock with a stub weather entity."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.states = MagicMock()
+    hass.states.get = MagicMock(
+        return_value=State(
+            "weather.home",
+            "rainy",
+            {"temperature": 20, **(attributes or {})},
+        )
+    )
+    hass.services = MagicMock()
+    hass.services.async_call = AsyncMock(
+        return_value={
+            "weather.home": {
+                "forecast": [
+                    {
+                        "datetime": "2023-10-10T00:00:00+00:00",
+                        "temperature": temperature,
+                        "precipitation": precipitation,
+                    },
+                    {
+                        "datetime": "2023-10-11T00:00:00+00:00",
+                        "temperature": 10,
+                        "precipitation": 20,
+                    },
+                ]
+            }
+        }
+    )
+    return hass
+
+
+def test_plantweather_watering_basis() -> None:
+    """Test rain and heatwaves only adjust outside plants."""
+    inside = PlantRecord("A", "A", date(2023, 10, 1), watering_interval=10)
+    outside = PlantRecord(
+        "B", "B", date(2023, 10, 1), watering_interval=10, inside=False
+    )
+    weather = WeatherConditions(rain_date=date(2023, 10, 5), heatwave=True)
+
+    assert watering_basis(outside) == (date(2023, 10, 1), 10)
+    assert watering_basis(inside, weather) == (date(2023, 10, 1), 10)
+    assert watering_basis(outside, weather) == (date(2023, 10, 5), 7)
+    # Rain before the last watering does not move it back
+    assert watering_basis(
+        outside, WeatherConditions(rain_date=date(2023, 9, 20))
+    ) == (date(2023, 10, 1), 10)
+
+
+@pytest.mark.asyncio
+async def test_plantweather_fetches_once_per_cycle() -> None:
+    """Test the weather is fetched once and cached for every plant."""
+    hass = create_weather_hass(temperature=33, precipitation=8)
+    weather = PlantWeather(hass, "weather.home")
+
+    with patch(
+        "custom_components.plant_diary.PlantWeather.now", return_value=NOW
+    ) as mock_now:
+        conditions = await weather.async_update()
+        assert conditions == WeatherConditions(
+            rain_date=date(2023, 10, 10), heatwave=True
+        )
+        assert await weather.async_update() is conditions
+        hass.services.async_call.assert_awaited_once()
+
+        # Once the cache expires the rain date is remembered
+        hass.services.async_call.return_value["weather.home"]["forecast"][0].update(
+            temperature=20, precipitation=0
+        )
+        mock_now.return_value = NOW + timedelta(hours=1)
+        assert await weather.async_update() == WeatherConditions(
+            rain_date=date(2023, 10, 10), heatwave=False
+        )
+        assert hass.services.async_call.await_count == 2
+
+        # The periodic refresh fetches even when its timer fires a bit early
+        mock_now.return_value += timedelta(minutes=29, seconds=59)
+        assert await weather.async_update() is weather.conditions
+        assert hass.services.async_call.await_count == 2
+        await weather.async_update(force=True)
+        assert hass.services.async_call.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_plantweather_units_and_missing_entity() -> None:
+    """Test imperial units are converted and a missing entity is ignored."""
+    hass = create_weather_hass(
+        temperature=95,
+        precipitation=0.1,
+        attributes={"temperature_unit": "°F", "precipitation_unit": "in"},
+    )
+    weather = PlantWeather(hass, "weather.home")
+    with patch("custom_components.plant_diary.PlantWeather.now", return_value=NOW):
+        assert await weather.async_update() == WeatherConditions(heatwave=True)
+
+    hass.states.get.return_value = None
+    weather = PlantWeather(hass, "weather.home")
+    with patch("custom_components.plant_diary.PlantWeather.now", return_value=NOW):
+        assert await weather.async_update() == WeatherConditions()
+
+    assert await PlantWeather(hass).async_update() is None
+
+
+def test_plantweather_forecast_of_the_local_day() -> None:
+    """Test the forecast of today is matched on the local date."""
+    response = {
+        "weather.home": {
+            "forecast": [
+                {"datetime": "2023-10-09T22:00:00+00:00", "precipitation": 8},
+                {"datetime": "2023-10-10T22:00:00+00:00", "precipitation": 0},
+            ]
+        }
+    }
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Paris"))
+    try:
+        forecast = _forecast_for(response, "weather.home", date(2023, 10, 10))
+    finally:
+        dt_util.set_default_time_zone(dt_util.UTC)
+    assert forecast == {"datetime": "2023-10-09T22:00:00+00:00", "precipitation": 8}
+
+
+@pytest.mark.asyncio
+async def test_plantweather_switching_entity_drops_the_cache() -> None:
+    """Test the conditions of a weather entity are not kept for another one."""
+    hass = create_weather_hass(temperature=20, precipitation=8)
+    weather = PlantWeather(hass, "weather.home")
+
+    with patch("custom_components.plant_diary.PlantWeather.now", return_value=NOW):
+        assert await weather.async_update() == WeatherConditions(
+            rain_date=date(2023, 10, 10)
+        )
+
+        # The same entity keeps its cache
+        weather.set_entity_id("weather.home")
+        assert weather.conditions is not None
+
+        hass.services.async_call.return_value = {}
+        weather.set_entity_id("weather.garden")
+        assert weather.conditions is None
+        assert await weather.async_update() == WeatherConditions()
+        assert hass.services.async_call.await_count == 2
@@ -3,11 +3,18 @@ from typing import Iterable
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from homeassistant.components.sensor import SCAN_INTERVAL
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import Entity
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.plant_diary.const import DOMAIN, PLANT_DIARY_MANAGER
+from custom_components.plant_diary.const import DOMAIN
 from custom_components.plant_diary.sensor import async_setup_entry
 
 
@@ -16,12 +23,13 @@ async def test_async_setup_entry_calls_restore(caplog):
     """Test that async_setup_entry calls restore_and_add_entities."""
     hass = MagicMock(spec=HomeAssistant)
     entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "entry"
 
     # Prepare mock manager and inject it into hass.data
     mock_manager = MagicMock()
     mock_manager.restore_and_add_entities = AsyncMock()
 
-    hass.data = {DOMAIN: {PLANT_DIARY_MANAGER: mock_manager}}
+    hass.data = {DOMAIN: {entry.entry_id: mock_manager}}
 
     # Define a dummy async_add_entities callback
     def add_entities(
@@ -35,7 +43,84 @@ async def test_async_setup_entry_calls_restore(caplog):
 
     mock_manager.restore_and_add_entities.assert_awaited_once_with(add_entities)
 
-    hass.data[DOMAIN].pop(PLANT_DIARY_MANAGER)
+    hass.data[DOMAIN].pop(entry.entry_id)
     caplog.clear()
     await async_setup_entry(hass, entry, hass.async_add_entities)
     assert "PlantDiaryManager not found in hass.data" in caplog.text
+
+
+async def test_plant_sensors_are_not_polled(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the platform never refreshes the plants behind the manager."""
+    # The logbook needs the recorder, which is not needed here
+    hass.config.components.add("logbook")
+    entry = MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    manager = hass.data[DOMAIN][entry.entry_id]
+    for plant_id in ("Fern", "Ivy"):
+        await manager.create_plant(
+            {"plant_name": plant_id, "last_watered": "2023-10-01"}
+        )
+    await hass.async_block_till_done()
+
+    entities = list(manager.entities.values())
+    writes = []
+    for entity in entities:
+        assert entity.should_poll is False
+        # Both the poll and async_write_ha_state write through this method
+        entity._async_write_ha_state = lambda entity=entity: writes.append(entity)
+
+    # Several scan intervals of the platform pass without a write
+    for interval in range(1, 4):
+        async_fire_time_changed(hass, utcnow() + SCAN_INTERVAL * interval)
+        await hass.async_block_till_done()
+    assert writes == []
+
+    # Only a changed plant is written
+    entities[0].update_from_dict({"watering_interval": 3})
+    assert [entity.async_write_if_changed() for entity in entities] == [True, False]
+    assert writes == [entities[0]]
+
+
+async def test_aggregate_sensors_do_not_clash_with_plants(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test plants named after an aggregate sensor and the migrated unique IDs."""
+    hass.config.components.add("logbook")
+    entry = MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+    entry.add_to_hass(hass)
+    # Aggregate sensors registered with the unique IDs they shared with plants
+    registry = er.async_get(hass)
+    for unique_id in ("plant_diary_overdue", "plant_diary_state_writes"):
+        registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            unique_id,
+            config_entry=entry,
+            suggested_object_id=unique_id,
+        )
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The summary sensor keeps its registry entry and its entity ID
+    assert (
+        registry.async_get_entity_id("sensor", DOMAIN, "plant_diary_overdue_summary")
+        == "sensor.plant_diary_overdue"
+    )
+    assert registry.async_get_entity_id("sensor", DOMAIN, "plant_diary_overdue") is None
+    assert (
+        registry.async_get_entity_id(
+            "sensor", DOMAIN, "plant_diary_state_writes_diagnostic"
+        )
+        == "sensor.plant_diary_state_writes"
+    )
+
+    manager = hass.data[DOMAIN][entry.entry_id]
+    await manager.create_plant({"plant_name": "overdue"})
+    await hass.async_block_till_done()
+    assert manager.entities["overdue"].entity_id == "sensor.plant_diary_overdue_2"
+    assert hass.states.get("sensor.plant_diary_overdue_2") is not None
@@ -0,0 +1,268 @@
+# Benchmarks of the manager operations on a running Home Assistant instance
+#
+# Regular test runs only check the smallest diary. Run the full matrix of every
+# benchmark and store the results as a JSON baseline under .benchmarks with:
+#   pytest tests --no-cov --benchmark-only --benchmark-autosave
+# and compare a later run with the last baseline with:
+#   pytest tests --no-cov --benchmark-only \
+#       --benchmark-compare --benchmark-compare-fail=mean:20%
+from collections import Counter
+from collections.abc import Awaitable, Callable, Generator
+from datetime import timedelta
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+from homeassistant.util.dt import utcnow
+
+from custom_components.plant_diary.const import (
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_MINOR_VERSION,
+    STORAGE_VERSION,
+)
+from custom_components.plant_diary.PlantDiaryManager import PlantDiaryManager
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+PLANT_COUNTS = [100, 1000, 10000, 50000]
+
+ROUNDS = {100: 5, 1000: 5, 10000: 2, 50000: 1}
+
+START_TIME = "2023-11-01 12:00:00+00:00"
+
+
+def create_plants(count: int) -> dict:
+    """Create the stored data of a synthetic diary."""
+    return {
+        f"Plant {i}": {
+            "plant_name": f"Plant {i}",
+            "last_watered": f"2023-10-{i % 28 + 1:02d}",
+            "last_fertilized": "2023-09-15",
+            "watering_interval": i % 20 + 1,
+            "watering_postponed": i % 3,
+            "inside": bool(i % 2),
+            "image": f"Plant {i}",
+        }
+        for i in range(count)
+    }
+
+
+@pytest.fixture
+def mock_plant_store():
+    """Keep the real plant storage, backed by the mocked Home Assistant storage."""
+    yield None
+
+
+@pytest.fixture
+def diary(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+    count: int,
+) -> Generator[MockConfigEntry, None, None]:
+    """Return a config entry whose storage holds a synthetic diary."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": STORAGE_MINOR_VERSION,
+        "key": STORAGE_KEY,
+        "data": {"plants": create_plants(count)},
+    }
+    # The logbook needs the recorder, and its entries are not measured here
+    hass.config.components.add("logbook")
+
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    yield entry
+
+    if entry.state is ConfigEntryState.LOADED:
+        run(hass, async_unload_diary(hass, entry))
+
+
+def run(hass: HomeAssistant, coro: Awaitable[Any]) -> Any:
+    """Run a coroutine on the event loop of Home Assistant."""
+    return hass.loop.run_until_complete(coro)
+
+
+async def async_setup_diary(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up the config entry and its sensor platform."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def async_unload_diary(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Unload the config entry."""
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def async_write_pending(hass: HomeAssistant) -> None:
+    """Let the delayed storage writes happen."""
+    async_fire_time_changed(hass, utcnow() + timedelta(minutes=5))
+    await hass.async_block_till_done()
+
+
+def get_manager(hass: HomeAssistant, entry: MockConfigEntry) -> PlantDiaryManager:
+    """Return the manager of the loaded config entry."""
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+def benchmark_operation(
+    benchmark: Any,
+    hass: HomeAssistant,
+    count: int,
+    operation: Callable[[], Awaitable[Any]],
+    setup: Callable[[], Awaitable[Any]] | None = None,
+) -> None:
+    """Benchmark an operation, recording its peak memory and storage writes.
+
+    A first run traced by tracemalloc measures the peak memory and counts the
+    storage writes by storage key, delayed writes included. The timed rounds
+    follow, each one after its own setup. The measures are saved with the timings
+    in the JSON results of pytest-benchmark.
+    """
+    write_data = storage.Store._async_write_data
+
+    if setup:
+        run(hass, setup())
+    run(hass, async_write_pending(hass))
+    writes_before = write_data.call_count
+
+    tracemalloc.start()
+    try:
+        run(hass, operation())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    run(hass, async_write_pending(hass))
+
+    writes = Counter(
+        call.args[0].key for call in write_data.call_args_list[writes_before:]
+    )
+    benchmark.extra_info.update(
+        {
+            "plants": count,
+            "peak_memory_kib": round(peak / 1024),
+            "storage_writes": dict(sorted(writes.items())),
+        }
+    )
+
+    benchmark.pedantic(
+        lambda: run(hass, operation()),
+        setup=(lambda: run(hass, setup())) if setup else None,
+        rounds=ROUNDS[count],
+    )
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+def test_benchmark_setup(
+    hass: HomeAssistant, diary: MockConfigEntry, benchmark: Any, count: int
+) -> None:
+    """Measure the setup of the config entry, restoring every plant."""
+
+    async def setup() -> None:
+        if diary.state is ConfigEntryState.LOADED:
+            await async_unload_diary(hass, diary)
+
+    benchmark_operation(
+        benchmark, hass, count, lambda: async_setup_diary(hass, diary), setup
+    )
+
+    assert len(get_manager(hass, diary).entities) == count
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+def test_benchmark_sweep(
+    hass: HomeAssistant,
+    diary: MockConfigEntry,
+    benchmark: Any,
+    count: int,
+    freezer: Any,
+) -> None:
+    """Measure the midnight sweep, on a new day for every round."""
+    freezer.move_to(START_TIME)
+    run(hass, async_setup_diary(hass, diary))
+    manager = get_manager(hass, diary)
+
+    async def next_day() -> None:
+        freezer.tick(timedelta(days=1))
+
+    benchmark_operation(
+        benchmark,
+        hass,
+        count,
+        manager.async_update_all_days_since_last_watered,
+        next_day,
+    )
+
+    assert len(manager.entities) == count
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+def test_benchmark_single_update(
+    hass: HomeAssistant, diary: MockConfigEntry, benchmark: Any, count: int
+) -> None:
+    """Measure the update of one plant, including its coalesced write."""
+    run(hass, async_setup_diary(hass, diary))
+    manager = get_manager(hass, diary)
+    days = iter(range(1, 1000))
+
+    async def update() -> None:
+        day = next(days) % 28 + 1
+        await manager.update_plant(
+            {"plant_id": "Plant 0", "last_watered": f"2023-10-{day:02d}"}
+        )
+        await manager.async_flush_updates()
+
+    benchmark_operation(benchmark, hass, count, update)
+
+    assert manager.entities["Plant 0"].record.last_watered is not None
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+def test_benchmark_bulk_update(
+    hass: HomeAssistant, diary: MockConfigEntry, benchmark: Any, count: int
+) -> None:
+    """Measure the update of every plant with a single bulk upsert."""
+    run(hass, async_setup_diary(hass, diary))
+    manager = get_manager(hass, diary)
+    days = iter(range(1, 1000))
+    plants: list[dict[str, Any]] = []
+
+    async def prepare() -> None:
+        day = next(days) % 28 + 1
+        plants[:] = [
+            {"plant_id": plant_id, "last_watered": f"2023-10-{day:02d}"}
+            for plant_id in manager.entities
+        ]
+
+    async def bulk_update() -> None:
+        result = await manager.bulk_upsert(plants)
+        assert len(result["updated"]) == count
+
+    benchmark_operation(benchmark, hass, count, bulk_update, prepare)
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+def test_benchmark_unload(
+    hass: HomeAssistant, diary: MockConfigEntry, benchmark: Any, count: int
+) -> None:
+    """Measure the unload of the config entry, removing every plant."""
+    benchmark_operation(
+        benchmark,
+        hass,
+        count,
+        lambda: async_unload_diary(hass, diary),
+        lambda: async_setup_diary(hass, diary),
+    )
+
+    assert diary.state is ConfigEntryState.NOT_LOADED
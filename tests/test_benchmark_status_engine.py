@@ -0,0 +1,61 @@
+# Benchmark comparing the NumPy and pure Python status engines
+#
+# Regular test runs only check the smallest diary; test_benchmark_manager.py
+# describes how to run the full matrix and compare it with a baseline.
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from custom_components.plant_diary.PlantRecord import PlantRecord
+from custom_components.plant_diary.PlantStatusEngine import PlantStatusEngine
+
+pytest.importorskip("pytest_benchmark")
+
+PLANT_COUNTS = [100, 10000, 100000]
+
+ROUNDS = {100: 20, 10000: 5, 100000: 3}
+
+TODAY = date(2023, 11, 1)
+
+
+def create_engine(use_numpy: bool, count: int) -> PlantStatusEngine:
+    """Create an engine with a synthetic diary of plants."""
+    engine = PlantStatusEngine(use_numpy=use_numpy)
+    first_day = date(2023, 1, 1)
+    for i in range(count):
+        plant_id = f"Plant {i}"
+        engine.set(
+            plant_id,
+            PlantRecord(
+                plant_id,
+                plant_id,
+                last_watered=first_day + timedelta(days=i % 300),
+                watering_interval=i % 20 + 1,
+                watering_postponed=i % 3,
+            ),
+        )
+    return engine
+
+
+@pytest.mark.parametrize("count", PLANT_COUNTS, indirect=True)
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+def test_benchmark_status_engine(benchmark: Any, count: int, use_numpy: bool) -> None:
+    """Measure a full status pass over every plant, on a new engine each round."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    engines: list[PlantStatusEngine] = []
+
+    def setup() -> None:
+        engines[:] = [create_engine(use_numpy, count)]
+
+    benchmark.extra_info["plants"] = count
+    changed = benchmark.pedantic(
+        lambda: engines[0].compute(TODAY), setup=setup, rounds=ROUNDS[count]
+    )
+
+    # Both implementations find the same changes
+    expected = create_engine(False, count)
+    assert [(plant_id, engines[0].status(plant_id)) for plant_id in changed] == [
+        (plant_id, expected.status(plant_id)) for plant_id in expected.compute(TODAY)
+    ]
@@ -0,0 +1,42 @@
+"""Tests for the Plant Diary diagnostics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.plant_diary.const import DOMAIN
+from custom_components.plant_diary.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.plant_diary.PlantDiaryManager import PlantDiaryManager
+
+
+@pytest.mark.asyncio
+async def test_async_get_config_entry_diagnostics() -> None:
+    """Test the diagnostics expose the metrics of the manager."""
+    hass = MagicMock(spec=HomeAssistant)
+    hass.data = {}
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "entry"
+    entry.data = {"garden": "balcony"}
+    entry.options = {"profiling": True}
+
+    assert await async_get_config_entry_diagnostics(hass, entry) == {
+        "options": {"profiling": True},
+        "loaded": False,
+    }
+
+    manager = PlantDiaryManager(hass, entry)
+    manager.metrics.enabled = True
+    manager.metrics.record("sweep", 0.002)
+    hass.data[DOMAIN] = {entry.entry_id: manager}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["loaded"] is True
+    assert diagnostics["garden"] == "balcony"
+    assert diagnostics["plants"] == 0
+    assert diagnostics["next_transition"] is None
+    assert diagnostics["metrics"]["timings"]["sweep"]["count"] == 1
@@ -1,21 +1,31 @@
 """Tests for Plant Diary integration."""
 
+import asyncio
+import os
 import pathlib
 import types
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant import config_entries
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.loader import Integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.dt import now
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.plant_diary import (
     async_reload_entry,
     config_flow,
 )
+from custom_components.plant_diary.const import DOMAIN, STORAGE_KEY
+from custom_components.plant_diary.PlantRepository import PlantStore
+from custom_components.plant_diary.PlantSnapshots import segment_name
+
+from .test_services import async_setup_gardens
 
 DEFAULT_NAME = "My Plant Diary"
 
@@ -33,17 +43,50 @@ async def test_flow_user_init() -> None:
     flow.hass = hass
 
     result = await flow.async_step_user()
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
 
-    # Since no data is required, a create_entry result is expected
+    # The first garden keeps the storage of a single diary
+    result = await flow.async_step_user({"name": "Plant Diary"})
     assert result["type"] == "create_entry"
     assert result["title"] == "Plant Diary"
     assert result["data"] == {}
 
 
+@pytest.mark.asyncio
+async def test_flow_user_additional_garden() -> None:
+    """Test the config flow of a garden added next to an existing one."""
+
+    flow = config_flow.PlantDiaryConfigFlow()
+    existing = MagicMock(spec=ConfigEntry)
+    existing.title = "Plant Diary"
+    existing.data = {}
+    hass = MagicMock()
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_entries = MagicMock(return_value=[existing])
+    flow.hass = hass
+
+    result = await flow.async_step_user({"name": " My Balcony "})
+    assert result["type"] == "create_entry"
+    assert result["title"] == "My Balcony"
+    assert result["data"] == {"garden": "my_balcony"}
+
+    # Gardens are unique by their slug
+    result = await flow.async_step_user({"name": "plant diary"})
+    assert result["type"] == "abort"
+    assert result["reason"] == "already_configured"
+
+    result = await flow.async_step_user({"name": " "})
+    assert result["type"] == "form"
+    assert result["errors"] == {"name": "invalid_name"}
+
+
 @pytest.mark.asyncio
 async def test_async_reload_entry():
     hass = MagicMock(spec=HomeAssistant)
+    hass.data = {}
     entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "entry"
 
     with (
         patch(
@@ -59,3 +102,105 @@ async def test_async_reload_entry():
 
         mock_unload.assert_awaited_once_with(hass, entry)
         mock_setup.assert_awaited_once_with(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_async_reload_entry_with_loaded_manager():
+    """Test a loaded manager is reloaded in place."""
+    hass = MagicMock(spec=HomeAssistant)
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "entry"
+    manager = MagicMock()
+    manager.async_reload = AsyncMock()
+    hass.data = {DOMAIN: {entry.entry_id: manager}}
+
+    with patch(
+        "custom_components.plant_diary.async_unload_entry",
+        new_callable=AsyncMock,
+    ) as mock_unload:
+        await async_reload_entry(hass, entry)
+
+    manager.async_reload.assert_awaited_once_with()
+    mock_unload.assert_not_awaited()
+
+
+async def test_gardens_unload_concurrently(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test two gardens writing their pending changes can unload together."""
+    entries = await async_setup_gardens(
+        hass,
+        MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={}),
+        MockConfigEntry(domain=DOMAIN, title="Balcony", data={"garden": "balcony"}),
+    )
+    for manager in hass.data[DOMAIN].values():
+        unload = manager.async_unload
+
+        # Yield while writing, so the other garden unloads meanwhile
+        async def async_unload(unload=unload) -> None:
+            await asyncio.sleep(0)
+            await unload()
+
+        manager.async_unload = async_unload
+
+    results = await asyncio.gather(
+        *(hass.config_entries.async_unload(entry.entry_id) for entry in entries)
+    )
+
+    assert results == [True, True]
+    assert all(entry.state is ConfigEntryState.NOT_LOADED for entry in entries)
+    assert DOMAIN not in hass.data
+
+
+async def test_removed_garden_deletes_its_storage(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test removing a garden deletes its files and re-adding it starts empty."""
+    hass.config.config_dir = str(tmp_path)
+    with patch("custom_components.plant_diary.PlantRepository.PlantStore", PlantStore):
+        home, balcony = await async_setup_gardens(
+            hass,
+            MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={}),
+            MockConfigEntry(
+                domain=DOMAIN, title="Balcony", data={"garden": "balcony"}
+            ),
+        )
+        managers = [hass.data[DOMAIN][entry.entry_id] for entry in (home, balcony)]
+        for manager in managers:
+            await manager.create_plant({"plant_name": "Fern"})
+            await manager.add_event({"plant_id": "Fern", "event": "repotted"})
+            await manager.history.async_flush()
+            await manager._async_take_snapshot()
+            await manager.repository.async_flush()
+        home_files = [
+            managers[0].history.path("Fern"),
+            os.path.join(managers[0].snapshots.directory, segment_name(now().date())),
+        ]
+        balcony_files = [
+            managers[1].history.path("Fern"),
+            os.path.join(managers[1].snapshots.directory, segment_name(now().date())),
+        ]
+        assert all(map(os.path.exists, home_files + balcony_files))
+        assert set(hass_storage) >= {STORAGE_KEY, f"{STORAGE_KEY}.{balcony.entry_id}"}
+
+        await hass.config_entries.async_remove(balcony.entry_id)
+        await hass.async_block_till_done()
+        assert f"{STORAGE_KEY}.{balcony.entry_id}" not in hass_storage
+        assert not os.path.exists(managers[1].history.directory)
+        assert not os.path.exists(managers[1].snapshots.directory)
+        # The first garden keeps its files
+        assert all(map(os.path.exists, home_files))
+
+        await hass.config_entries.async_remove(home.entry_id)
+        await hass.async_block_till_done()
+        assert STORAGE_KEY not in hass_storage
+        assert not any(map(os.path.exists, home_files))
+
+        # The plants of a removed garden do not come back with a new one
+        (entry,) = await async_setup_gardens(
+            hass, MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+        )
+        assert hass.data[DOMAIN][entry.entry_id].entities == {}
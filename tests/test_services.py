@@ -0,0 +1,178 @@
+"""Tests for the services shared by the gardens."""
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.plant_diary.const import DOMAIN, STORAGE_KEY
+
+
+async def async_setup_gardens(
+    hass: HomeAssistant, *entries: MockConfigEntry
+) -> list[MockConfigEntry]:
+    """Set up the config entries of some gardens."""
+    # The logbook needs the recorder, which is not needed here
+    hass.config.components.add("logbook")
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return list(entries)
+
+
+def create_plant_data(**kwargs: Any) -> dict[str, Any]:
+    """Return the data of a new plant."""
+    return {"plant_name": "Fern", "watering_interval": 7, **kwargs}
+
+
+async def test_services_use_the_single_garden(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the garden may be omitted while a single garden is loaded."""
+    (entry,) = await async_setup_gardens(
+        hass, MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+    )
+
+    await hass.services.async_call(
+        DOMAIN, "create_plant", create_plant_data(), blocking=True
+    )
+    await hass.async_block_till_done()
+
+    manager = hass.data[DOMAIN][entry.entry_id]
+    assert list(manager.entities) == ["Fern"]
+    # The first garden keeps the entity IDs of a single diary
+    assert hass.states.get("sensor.plant_diary_fern") is not None
+
+    response = await hass.services.async_call(
+        DOMAIN, "query", {}, blocking=True, return_response=True
+    )
+    assert [plant["plant_id"] for plant in response["plants"]] == ["Fern"]
+
+
+async def test_services_route_to_a_garden(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the services are routed by entry ID, slug or name of a garden."""
+    home, balcony = await async_setup_gardens(
+        hass,
+        MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={}),
+        MockConfigEntry(domain=DOMAIN, title="Balcony", data={"garden": "balcony"}),
+    )
+    home_manager = hass.data[DOMAIN][home.entry_id]
+    balcony_manager = hass.data[DOMAIN][balcony.entry_id]
+    # The other gardens are stored apart from the first one
+    assert balcony_manager.repository._store.key == f"{STORAGE_KEY}.{balcony.entry_id}"
+
+    # Several gardens are loaded, so the garden is required
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "create_plant", create_plant_data(), blocking=True
+        )
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "create_plant", create_plant_data(garden="attic"), blocking=True
+        )
+
+    for garden in (home.entry_id, "Balcony"):
+        await hass.services.async_call(
+            DOMAIN, "create_plant", create_plant_data(garden=garden), blocking=True
+        )
+    await hass.services.async_call(
+        DOMAIN,
+        "update_plant",
+        {"plant_id": "Fern", "watering_interval": 3, "garden": "balcony"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert home_manager.entities["Fern"].record.watering_interval == 7
+    assert balcony_manager.entities["Fern"].record.watering_interval == 3
+    # The plants of the other gardens are named after their garden
+    assert hass.states.get("sensor.plant_diary_fern") is not None
+    assert hass.states.get("sensor.plant_diary_balcony_fern") is not None
+
+
+async def test_update_days_since_watered_updates_every_garden(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the days since watered of every garden are updated without a garden."""
+    await async_setup_gardens(
+        hass,
+        MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={}),
+        MockConfigEntry(domain=DOMAIN, title="Balcony", data={"garden": "balcony"}),
+    )
+    managers = list(hass.data[DOMAIN].values())
+    calls = []
+    for manager in managers:
+
+        async def update(manager=manager) -> None:
+            calls.append(manager)
+
+        manager.async_update_all_days_since_last_watered = update
+
+    await hass.services.async_call(
+        DOMAIN, "update_days_since_watered", {}, blocking=True
+    )
+    assert calls == managers
+
+    calls.clear()
+    await hass.services.async_call(
+        DOMAIN, "update_days_since_watered", {"garden": "balcony"}, blocking=True
+    )
+    assert calls == [managers[1]]
+
+
+@pytest.mark.parametrize(
+    ("service", "data"),
+    [
+        ("update_plant", {"watering_interval": 3}),
+        ("delete_plant", {}),
+        ("snooze_plant", {"days": 2}),
+        ("add_event", {"event": "repotted"}),
+        ("get_history", {}),
+        ("get_trend", {}),
+    ],
+)
+async def test_services_reject_unknown_plants(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    service: str,
+    data: dict[str, Any],
+) -> None:
+    """Test the services report an unknown plant to the caller."""
+    await async_setup_gardens(
+        hass, MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+    )
+
+    with pytest.raises(ServiceValidationError, match="Plant with ID Rose not found"):
+        await hass.services.async_call(
+            DOMAIN,
+            service,
+            {"plant_id": "Rose", **data},
+            blocking=True,
+            return_response=service in ("get_history", "get_trend"),
+        )
+
+
+async def test_bulk_delete_plants_not_added_yet(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test plants upserted and deleted in the same tick are not left behind."""
+    (entry,) = await async_setup_gardens(
+        hass, MockConfigEntry(domain=DOMAIN, title="Plant Diary", data={})
+    )
+    manager = hass.data[DOMAIN][entry.entry_id]
+
+    await manager.bulk_upsert([create_plant_data()])
+    result = await manager.bulk_delete(["Fern"])
+    await hass.async_block_till_done()
+
+    assert result == {"deleted": ["Fern"], "not_found": []}
+    assert manager.entities == {}
+    assert hass.states.get("sensor.plant_diary_fern") is None
+    assert er.async_get(hass).async_get("sensor.plant_diary_fern") is None